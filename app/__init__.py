@@ -43,6 +43,23 @@ def create_app():
     }
     Swagger(app)  # Flasgger 초기화
 
+    # gevent 워커(SSE 사용 시, gunicorn.conf.py 참고)면 psycopg2 green patch
+    from app.utils import gevent_compat
+    if gevent_compat.patch_psycopg():
+        logger.info("gevent 워커: psycopg2 green patch 적용")
+
+    # 요청 단위 DB 연결 관리 (teardown 에서 커밋/롤백 후 풀에 반납)
+    from app.models import db
+    db.init_app(app)
+
+    # 스키마 마이그레이션 CLI (flask db upgrade / verify / status)
+    from app.models import schema
+    schema.init_app(app)
+
+    # 백그라운드 주기 작업 (이력 압축, 알림 outbox 전송) - 워커별 첫 요청 시 시작
+    from app.models import jobs, compaction, outbox  # noqa: F401 (각 모듈이 작업을 등록)
+    jobs.init_app(app)
+
     # 라우터 등록
     from app.routes import register_routes
     register_routes(app)
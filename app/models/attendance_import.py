@@ -0,0 +1,130 @@
+import io
+import logging
+
+import pandas as pd
+
+from app.models.attendance_rollup import ROLLUP_INSERTED, late_after_seconds, lock_writes
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_FIELDS = ['date', 'instructor', 'instructor_name', 'training_course', 'check_in', 'check_out']
+FIELDS = REQUIRED_FIELDS + ['daily_log']
+DUPLICATE_KEY = ['date', 'instructor', 'training_course']
+
+_TIME_PATTERN = r'(?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d)?'
+_BOOLEAN_VALUES = {
+    'true': True, '1': True, 'y': True, 'yes': True,
+    'false': False, '0': False, 'n': False, 'no': False, '': False,
+}
+
+# 요청 단위 임시 테이블 (컬럼 타입은 attendance 와 동일, 커밋 시 삭제)
+CREATE_STAGING = '''
+    CREATE TEMP TABLE attendance_staging ON COMMIT DROP AS
+    SELECT 0 AS row_no, date, instructor, instructor_name, training_course, check_in, check_out, daily_log
+    FROM attendance WITH NO DATA
+'''
+
+COPY_STAGING = '''
+    COPY attendance_staging (row_no, date, instructor, instructor_name, training_course, check_in, check_out, daily_log)
+    FROM STDIN WITH (FORMAT csv)
+'''
+
+# 이미 같은 (date, instructor, training_course) 기록이 있는 행은 건너뛰고 나머지를 한 번에 저장
+# (월간 집계도 같은 문장에서 갱신)
+MERGE_STAGING = f'''
+    WITH duplicated AS (
+        SELECT s.row_no
+        FROM attendance_staging s
+        WHERE EXISTS (
+            SELECT 1 FROM attendance a
+            WHERE a.date = s.date AND a.instructor = s.instructor AND a.training_course = s.training_course
+        )
+    ),
+    inserted AS (
+        INSERT INTO attendance (date, instructor, instructor_name, training_course, check_in, check_out, daily_log)
+        SELECT date, instructor, instructor_name, training_course, check_in, check_out, daily_log
+        FROM attendance_staging s
+        WHERE NOT EXISTS (SELECT 1 FROM duplicated d WHERE d.row_no = s.row_no)
+        ORDER BY s.row_no
+        RETURNING date, instructor, training_course, check_in, daily_log
+    ),
+    {ROLLUP_INSERTED}
+    SELECT ARRAY(SELECT row_no FROM duplicated ORDER BY row_no), (SELECT COUNT(*) FROM inserted)
+'''
+
+
+def read_records(payload, content_type):
+    """CSV 텍스트 또는 JSON 배열을 문자열 컬럼의 DataFrame 으로 변환 (행 번호는 1부터)"""
+    if content_type == 'csv':
+        df = pd.read_csv(io.StringIO(payload), dtype=str, keep_default_na=False, skipinitialspace=True)
+    else:
+        # 숫자/None 이 섞여도 float 로 바뀌지 않도록 object 로 유지
+        df = pd.DataFrame(payload, dtype=object)
+    df.index = pd.RangeIndex(1, len(df) + 1)
+    return df
+
+
+def missing_columns(df):
+    return [field for field in REQUIRED_FIELDS if field not in df.columns]
+
+
+def _text(series):
+    return series.where(series.notna(), '').astype(str).str.strip()
+
+
+def validate_records(df):
+    """컬럼 단위로 한 번에 검증하고 (정규화된 유효 행 DataFrame, {행 번호: [오류 메시지]}) 반환"""
+    clean = pd.DataFrame(index=df.index)
+    for field in REQUIRED_FIELDS:
+        clean[field] = _text(df[field])
+    daily_log = _text(df['daily_log']).str.lower() if 'daily_log' in df.columns else pd.Series('', index=df.index)
+
+    errors = {}
+
+    def reject(mask, message):
+        for row in mask[mask].index:
+            errors.setdefault(int(row), []).append(message)
+
+    for field in REQUIRED_FIELDS:
+        reject(clean[field] == '', f"{field} 값이 없습니다")
+
+    dates = pd.to_datetime(clean['date'], format='%Y-%m-%d', errors='coerce')
+    reject(dates.isna() & (clean['date'] != ''), "date 형식이 올바르지 않습니다 (YYYY-MM-DD)")
+    clean['date'] = dates.dt.strftime('%Y-%m-%d')
+
+    for field in ('check_in', 'check_out'):
+        reject(~clean[field].str.fullmatch(_TIME_PATTERN) & (clean[field] != ''),
+               f"{field} 형식이 올바르지 않습니다 (HH:MM)")
+
+    clean['daily_log'] = daily_log.map(_BOOLEAN_VALUES)
+    reject(clean['daily_log'].isna(), "daily_log 값이 올바르지 않습니다 (true/false)")
+
+    # 요청 안에서 같은 (date, instructor, training_course) 가 반복되면 첫 번째 유효 행만 사용
+    keyed = clean.drop(index=list(errors))
+    reject(keyed.duplicated(subset=DUPLICATE_KEY, keep='first').reindex(clean.index, fill_value=False),
+           "같은 날짜/강사/훈련과정 기록이 요청 안에 이미 있습니다")
+
+    valid = clean.drop(index=list(errors))
+    return valid, errors
+
+
+def merge_records(conn, valid):
+    """유효 행을 COPY 로 임시 테이블에 올린 뒤 attendance 에 병합하고 (저장 건수, 중복 행 번호 목록) 반환"""
+    if valid.empty:
+        return 0, []
+
+    buffer = io.StringIO()
+    valid.assign(daily_log=valid['daily_log'].map({True: 't', False: 'f'})).to_csv(
+        buffer, columns=FIELDS, header=False, index=True, index_label=False
+    )
+    buffer.seek(0)
+
+    cursor = conn.cursor()
+    # 동시에 들어온 저장끼리 서로의 행을 중복 검사/출근일 집계에서 놓치지 않도록 직렬화
+    lock_writes(cursor)
+    cursor.execute(CREATE_STAGING)
+    cursor.copy_expert(COPY_STAGING, buffer)
+    cursor.execute(MERGE_STAGING, (late_after_seconds(),))
+    duplicated, inserted = cursor.fetchone()
+    cursor.execute("DROP TABLE attendance_staging")
+    return inserted, duplicated
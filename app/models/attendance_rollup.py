@@ -0,0 +1,97 @@
+from app import config
+
+# 출퇴근 기록 저장(단건/대량)을 직렬화하는 advisory lock 키 (days_present 중복 집계 방지)
+ATTENDANCE_WRITE_LOCK_KEY = 724_015
+
+# check_in 이 HH:MM(:SS) 형식인 경우에만 초 단위로 변환 (형식이 다른 값은 평균/지각 집계에서 제외)
+CHECK_IN_SECONDS = '''
+    CASE WHEN check_in::text ~ '^[0-9]{1,2}:[0-9]{2}(:[0-9]{2})?$'
+         THEN EXTRACT(EPOCH FROM check_in::text::time)::integer END
+'''
+
+
+def _month_late_count(late_after):
+    """집계 행 r 의 달/강사/훈련과정 기록 중 지각 기준(late_after, 자정부터의 초) 이후 출근 수 (SQL 식)"""
+    return f'''(
+        SELECT COUNT(*)
+        FROM (SELECT {CHECK_IN_SECONDS} AS check_in_seconds
+              FROM attendance
+              WHERE date >= r.month AND date < r.month + INTERVAL '1 month'
+                AND instructor = r.instructor AND training_course = r.training_course) m
+        WHERE m.check_in_seconds > {late_after}
+    )'''
+
+
+# 같은 문장의 "inserted" CTE (date, instructor, training_course, check_in, daily_log) 를 월별 집계에 더하는 CTE
+# - 다른 CTE 가 넣은 행은 같은 문장 안에서 보이지 않으므로, attendance 에 같은 날짜 행이 없으면 새 출근일
+#   (동시에 저장하면 서로의 행을 보지 못하므로 호출하는 쪽에서 ATTENDANCE_WRITE_LOCK_KEY 로 직렬화)
+# - 파라미터: 지각 기준 (자정부터의 초)
+# - 집계 행의 지각 기준(late_after)이 현재 기준과 다르면 그 달의 late_count 를 현재 기준으로 다시 계산
+ROLLUP_INSERTED = f'''
+    late_cutoff AS (
+        SELECT %s::integer AS seconds
+    ),
+    rolled_up AS (
+        INSERT INTO attendance_monthly_rollup AS r
+            (month, instructor, training_course, records, days_present,
+             check_in_count, check_in_seconds, late_count, missing_log_count, late_after, updated_at)
+        SELECT date_trunc('month', i.date)::date, i.instructor, i.training_course,
+               COUNT(*),
+               COUNT(*) FILTER (WHERE NOT EXISTS (
+                   SELECT 1 FROM attendance a
+                   WHERE a.date = i.date AND a.instructor = i.instructor AND a.training_course = i.training_course
+               )),
+               COUNT(i.check_in_seconds),
+               COALESCE(SUM(i.check_in_seconds), 0),
+               COUNT(*) FILTER (WHERE i.check_in_seconds > c.seconds),
+               COUNT(*) FILTER (WHERE NOT COALESCE(i.daily_log, FALSE)),
+               c.seconds,
+               NOW()
+        FROM (SELECT inserted.*, {CHECK_IN_SECONDS} AS check_in_seconds FROM inserted) i
+        CROSS JOIN late_cutoff c
+        GROUP BY 1, 2, 3, c.seconds
+        ON CONFLICT (month, instructor, training_course) DO UPDATE
+        SET records = r.records + EXCLUDED.records,
+            days_present = r.days_present + EXCLUDED.days_present,
+            check_in_count = r.check_in_count + EXCLUDED.check_in_count,
+            check_in_seconds = r.check_in_seconds + EXCLUDED.check_in_seconds,
+            late_count = CASE WHEN r.late_after = EXCLUDED.late_after
+                              THEN r.late_count
+                              ELSE {_month_late_count('EXCLUDED.late_after')}
+                         END + EXCLUDED.late_count,
+            missing_log_count = r.missing_log_count + EXCLUDED.missing_log_count,
+            late_after = EXCLUDED.late_after,
+            updated_at = NOW()
+    )
+'''
+
+# 지각 기준이 현재 값과 다른 월간 집계 행의 late_count 를 다시 계산 (파라미터: 지각 기준 2번)
+RECOMPUTE_LATE_COUNTS = f'''
+    UPDATE attendance_monthly_rollup r
+    SET late_count = {_month_late_count('%s')},
+        late_after = %s,
+        updated_at = NOW()
+    WHERE r.late_after IS DISTINCT FROM %s
+'''
+
+
+def late_after_seconds():
+    """ATTENDANCE_LATE_AFTER (HH:MM) 를 자정부터의 초로 변환"""
+    hours, minutes = config.ATTENDANCE_LATE_AFTER.split(':')[:2]
+    return int(hours) * 3600 + int(minutes) * 60
+
+
+def lock_writes(cursor):
+    """현재 트랜잭션이 끝날 때까지 다른 출퇴근 기록 저장을 기다리게 함
+
+    ROLLUP_INSERTED 의 새 출근일 판단(NOT EXISTS)은 동시에 저장 중인 다른 트랜잭션의 행을 보지 못하므로
+    같은 날짜가 두 번 days_present 에 더해지지 않도록 저장 전에 호출합니다.
+    """
+    cursor.execute("SELECT pg_advisory_xact_lock(%s)", (ATTENDANCE_WRITE_LOCK_KEY,))
+
+
+def recompute_late_counts(cursor, seconds=None):
+    """지각 기준이 바뀐 월간 집계 행의 late_count 를 다시 계산하고 갱신한 행 수 반환"""
+    seconds = late_after_seconds() if seconds is None else seconds
+    cursor.execute(RECOMPUTE_LATE_COUNTS, (seconds, seconds, seconds))
+    return cursor.rowcount
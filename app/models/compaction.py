@@ -0,0 +1,73 @@
+import logging
+
+from app import config
+from app.models import jobs
+
+logger = logging.getLogger(__name__)
+
+IRREGULAR_TASKS_COMPACTION_LOCK_KEY = 724_011
+
+# 보존 기간이 지난 이력을 한 배치씩 보관 테이블로 옮기고 일별 요약에 누적
+# (최신 상태로 참조 중인 행은 남겨둠)
+COMPACT_IRREGULAR_TASKS_BATCH = '''
+    WITH moved AS (
+        DELETE FROM irregular_tasks t
+        WHERE t.id IN (
+            SELECT h.id
+            FROM irregular_tasks h
+            WHERE h.checked_date < NOW() - make_interval(days => %s)
+              AND NOT EXISTS (SELECT 1 FROM irregular_task_state s WHERE s.history_id = h.id)
+            ORDER BY h.id
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING t.id, t.task_name, t.is_checked, t.checked_date, t.training_course
+    ),
+    archived AS (
+        INSERT INTO irregular_tasks_archive (id, task_name, is_checked, checked_date, training_course)
+        SELECT id, task_name, is_checked, checked_date, training_course FROM moved
+        ON CONFLICT (id) DO NOTHING
+    ),
+    summarized AS (
+        INSERT INTO irregular_task_daily AS d
+            (training_course, task_name, day, checks, last_is_checked, last_checked_date)
+        SELECT COALESCE(training_course, ''), task_name, DATE(checked_date), COUNT(*),
+               (array_agg(is_checked ORDER BY checked_date DESC, id DESC))[1], MAX(checked_date)
+        FROM moved
+        WHERE task_name IS NOT NULL AND checked_date IS NOT NULL
+        GROUP BY COALESCE(training_course, ''), task_name, DATE(checked_date)
+        ON CONFLICT (training_course, task_name, day) DO UPDATE
+        SET checks = d.checks + EXCLUDED.checks,
+            last_is_checked = CASE WHEN EXCLUDED.last_checked_date >= d.last_checked_date
+                                   THEN EXCLUDED.last_is_checked ELSE d.last_is_checked END,
+            last_checked_date = GREATEST(d.last_checked_date, EXCLUDED.last_checked_date)
+    )
+    SELECT COUNT(*) FROM moved
+'''
+
+
+def compact_irregular_tasks(conn, retention_days=None, batch_size=None, max_batches=None):
+    """보존 기간이 지난 irregular_tasks 이력을 압축하고 옮긴 행 수를 반환"""
+    retention_days = config.IRREGULAR_TASKS_RETENTION_DAYS if retention_days is None else retention_days
+    batch_size = config.COMPACTION_BATCH_SIZE if batch_size is None else batch_size
+    max_batches = config.COMPACTION_MAX_BATCHES if max_batches is None else max_batches
+
+    total = 0
+    for _ in range(max_batches):
+        with conn.cursor() as cursor:
+            cursor.execute(COMPACT_IRREGULAR_TASKS_BATCH, (retention_days, batch_size))
+            moved = cursor.fetchone()[0]
+        # 배치마다 커밋해서 잠금 시간을 짧게 유지
+        conn.commit()
+        total += moved
+        if moved < batch_size:
+            break
+    return total
+
+
+irregular_tasks_compaction = jobs.register(jobs.PeriodicJob(
+    "irregular-tasks-compaction",
+    config.IRREGULAR_TASKS_COMPACTION_INTERVAL,
+    compact_irregular_tasks,
+    lock_key=IRREGULAR_TASKS_COMPACTION_LOCK_KEY,
+))
@@ -0,0 +1,127 @@
+import itertools
+import json
+import logging
+import queue
+import threading
+
+from app import config
+from app.models import queries
+from app.models.listener import listener
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'dashboard_events'
+
+PUBLISH = queries.register('dashboard_event_publish', '''
+    SELECT pg_notify('dashboard_events', %s)
+''')
+
+
+def publish(cursor, entity, action, entity_id=None, training_course=None, **extra):
+    """대시보드 변경 이벤트 NOTIFY (호출한 쪽의 트랜잭션이 커밋될 때 전달되고 롤백되면 버려짐)
+
+    entity 는 notice, issue, comment, unchecked, unchecked_comment 중 하나이며
+    클라이언트는 이 이벤트를 받아 해당 목록만 다시 조회합니다.
+    """
+    payload = {"type": entity, "action": action, "id": entity_id, "training_course": training_course}
+    payload.update(extra)
+    PUBLISH.execute(cursor, (json.dumps(payload, ensure_ascii=False, default=str),))
+
+
+class EventClient:
+    """SSE 연결 하나의 수신 대기열 (types / training_course 로 받을 이벤트를 거름)"""
+
+    def __init__(self, types=None, training_course=None):
+        self.types = set(types) if types else None
+        self.training_course = training_course
+        self.queue = queue.Queue(maxsize=config.SSE_CLIENT_QUEUE_SIZE)
+        self.overflowed = False
+
+    def accepts(self, event):
+        if event["event"] == 'resync':
+            return True
+        data = event["data"]
+        if self.types is not None and data.get("type") not in self.types:
+            return False
+        course = data.get("training_course")
+        return self.training_course is None or course is None or course == self.training_course
+
+    def put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            # 너무 느린 클라이언트는 밀린 이벤트 대신 resync 하나만 받음
+            self.overflowed = True
+
+    def get(self, timeout):
+        """다음 이벤트 (timeout 초 동안 없으면 None)"""
+        if self.overflowed:
+            self.overflowed = False
+            with self.queue.mutex:
+                self.queue.queue.clear()
+            return resync_event()
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+_event_ids = itertools.count(1)
+
+
+def resync_event():
+    return {"id": next(_event_ids), "event": "resync", "data": {}}
+
+
+class EventHub:
+    """dashboard_events 알림을 연결된 SSE 클라이언트에게 나눠 주는 허브 (워커 프로세스당 하나)
+
+    LISTEN 연결은 listener 의 전용 연결 하나만 사용하고, 클라이언트는 메모리 대기열만 가집니다.
+    listener 가 다시 연결되면 (놓친 알림이 있을 수 있으므로) 모든 클라이언트에 resync 를 보냅니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = set()
+        self._subscribed = False
+
+    def _subscribe(self):
+        if not self._subscribed:
+            self._subscribed = True
+            listener.subscribe(CHANNEL, self.on_notify)
+
+    def on_notify(self, payload=None):
+        if payload is None:
+            event = resync_event()
+        else:
+            try:
+                event = {"id": next(_event_ids), "event": "change", "data": json.loads(payload)}
+            except ValueError:
+                logger.warning(f"잘못된 대시보드 이벤트: {payload[:200]}")
+                return
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            if client.accepts(event):
+                client.put(event)
+
+    def connect(self, types=None, training_course=None):
+        """클라이언트 등록 (SSE_MAX_CLIENTS 를 넘으면 None)"""
+        self._subscribe()
+        with self._lock:
+            if len(self._clients) >= config.SSE_MAX_CLIENTS:
+                return None
+            client = EventClient(types, training_course)
+            self._clients.add(client)
+        return client
+
+    def disconnect(self, client):
+        with self._lock:
+            self._clients.discard(client)
+
+    def client_count(self):
+        with self._lock:
+            return len(self._clients)
+
+
+event_hub = EventHub()
@@ -0,0 +1,92 @@
+import logging
+import os
+import random
+import threading
+import time
+
+from app.models.db import get_pool
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """워커 프로세스에서 주기적으로 실행되는 백그라운드 작업
+
+    lock_key 를 지정하면 pg_try_advisory_lock 으로 여러 워커/서버 중 하나만 실행합니다.
+    func(conn) 은 풀에서 빌린 psycopg2 연결을 받아 직접 커밋합니다.
+    """
+
+    def __init__(self, name, interval, func, lock_key=None):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.lock_key = lock_key
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        if self.interval <= 0:
+            return
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._thread = threading.Thread(target=self._loop, name=f"job-{self.name}", daemon=True)
+            self._thread.start()
+
+    def run_once(self, func=None):
+        """한 번 실행 (다른 곳에서 실행 중이면 None 반환, func 로 실행할 함수를 바꿀 수 있음)"""
+        pool = get_pool()
+        conn = pool.getconn()
+        locked = False
+        try:
+            if self.lock_key is not None:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_try_advisory_lock(%s)", (self.lock_key,))
+                    locked = cursor.fetchone()[0]
+                conn.commit()
+                if not locked:
+                    return None
+            return (func or self.func)(conn)
+        finally:
+            if locked:
+                try:
+                    conn.rollback()
+                    with conn.cursor() as cursor:
+                        cursor.execute("SELECT pg_advisory_unlock(%s)", (self.lock_key,))
+                    conn.commit()
+                except Exception:
+                    logger.warning(f"{self.name}: advisory lock 해제 실패", exc_info=True)
+            pool.putconn(conn)
+
+    def _loop(self):
+        # 여러 워커가 동시에 깨어나지 않도록 시작 시점을 분산
+        time.sleep(random.uniform(0, min(self.interval, 60)))
+        while True:
+            try:
+                result = self.run_once()
+                if result is not None:
+                    logger.info(f"{self.name} 실행 완료: {result}")
+            except Exception:
+                logger.error(f"{self.name} 실행 실패", exc_info=True)
+            time.sleep(self.interval)
+
+
+_jobs = []
+
+
+def register(job):
+    _jobs.append(job)
+    return job
+
+
+def init_app(app):
+    """첫 요청 시점에 (fork 된 워커 안에서) 등록된 작업 스레드를 시작"""
+    @app.before_request
+    def _start_jobs():
+        for job in _jobs:
+            job.ensure_started()
@@ -0,0 +1,108 @@
+import logging
+import os
+import select
+import threading
+import time
+
+import psycopg2
+from psycopg2 import extensions, sql
+
+from app import config
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationListener:
+    """PostgreSQL LISTEN/NOTIFY 수신 스레드 (워커 프로세스당 하나, 전용 연결 사용)
+
+    subscribe(channel, callback) 로 등록한 콜백은 알림 payload 와 함께 호출되며,
+    연결이 (재)수립될 때는 놓친 알림이 있을 수 있으므로 payload=None 으로 호출됩니다.
+    콜백은 수신 스레드에서 실행되므로 오래 걸리는 작업을 하면 안 됩니다.
+    """
+
+    def __init__(self, dsn, poll_timeout=5.0, reconnect_delay=1.0, max_reconnect_delay=30.0):
+        self.dsn = dsn
+        self.poll_timeout = poll_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._callbacks = {}  # channel -> [callback]
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._conn = None
+        self._listening = set()
+
+    def subscribe(self, channel, callback):
+        with self._lock:
+            self._callbacks.setdefault(channel, []).append(callback)
+        self.start()
+
+    def start(self):
+        """수신 스레드 시작 (fork 된 프로세스에서는 새로 시작)"""
+        with self._lock:
+            pid = os.getpid()
+            if self._thread is not None and self._thread.is_alive() and self._pid == pid:
+                return
+            self._pid = pid
+            self._conn = None
+            self._listening = set()
+            self._thread = threading.Thread(target=self._run, name="pg-listener", daemon=True)
+            self._thread.start()
+
+    def _connect(self):
+        conn = psycopg2.connect(self.dsn)
+        conn.set_isolation_level(extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def _sync_channels(self):
+        with self._lock:
+            channels = set(self._callbacks) - self._listening
+        if not channels:
+            return
+        with self._conn.cursor() as cursor:
+            for channel in channels:
+                cursor.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+        self._listening |= channels
+        # 새로 구독한 채널은 그 전의 알림을 받지 못했으므로 전체 갱신 신호 전달
+        for channel in channels:
+            self._dispatch(channel, None)
+
+    def _dispatch(self, channel, payload):
+        with self._lock:
+            callbacks = list(self._callbacks.get(channel, []))
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception:
+                logger.error(f"알림 콜백 처리 실패 (channel={channel})", exc_info=True)
+
+    def _run(self):
+        delay = self.reconnect_delay
+        while True:
+            try:
+                if self._conn is None or self._conn.closed:
+                    self._conn = self._connect()
+                    self._listening = set()
+                    delay = self.reconnect_delay
+                    logger.info("LISTEN 연결 수립")
+                self._sync_channels()
+
+                if select.select([self._conn], [], [], self.poll_timeout) == ([], [], []):
+                    continue
+                self._conn.poll()
+                while self._conn.notifies:
+                    notify = self._conn.notifies.pop(0)
+                    self._dispatch(notify.channel, notify.payload)
+            except Exception:
+                logger.warning(f"LISTEN 연결 오류, {delay:.0f}초 후 재연결", exc_info=True)
+                try:
+                    if self._conn is not None:
+                        self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+
+listener = NotificationListener(config.DATABASE_URL)
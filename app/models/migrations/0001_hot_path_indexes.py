@@ -0,0 +1,20 @@
+from app.models.schema import Index
+
+DESCRIPTION = "자주 호출되는 조회/업데이트 경로용 인덱스"
+
+INDEXES = [
+    # save_tasks / update_tasks 의 당일 기존 데이터 조회
+    Index("idx_task_checklist_task_course_day", "task_checklist",
+          "(task_id, training_course, (DATE(checked_date)))"),
+    # task_name -> id 조회
+    Index("idx_task_items_task_name", "task_items", "(task_name)"),
+    # 이슈별 댓글 조회 (created_at 순)
+    Index("idx_issue_comments_issue_created", "issue_comments", "(issue_id, created_at)"),
+    # 공지사항별 읽은 사용자 조회
+    Index("idx_notice_reads_notice", "notice_reads", "(notice_id)"),
+    # 미해결 이슈 / 미체크 항목만 조회하는 경로
+    Index("idx_issues_unresolved", "issues", "(training_course, created_at)",
+          where="resolved = FALSE"),
+    Index("idx_unchecked_descriptions_unresolved", "unchecked_descriptions", "(created_at DESC)",
+          where="resolved = FALSE"),
+]
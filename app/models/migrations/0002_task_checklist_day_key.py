@@ -0,0 +1,27 @@
+from app.models.schema import Index
+
+DESCRIPTION = "task_checklist 에 체크 날짜(check_day) 컬럼과 (task_id, training_course, check_day) 유니크 키 추가"
+
+STATEMENTS = [
+    "ALTER TABLE task_checklist ADD COLUMN IF NOT EXISTS check_day DATE",
+    # checked_date 가 NULL 인 기존 행은 어느 날짜에도 속하지 않으므로 '-infinity' 로 채움
+    # (NULL 로 두면 아래 SET NOT NULL 이 실패)
+    "UPDATE task_checklist SET check_day = COALESCE(DATE(checked_date), '-infinity'::date) WHERE check_day IS NULL",
+    # 동시 저장으로 생긴 같은 날짜의 중복 행 정리 (가장 최근 행만 유지, checked_date 가 NULL 인 행은 id 순)
+    '''
+    DELETE FROM task_checklist tc
+    USING task_checklist newer
+    WHERE tc.task_id = newer.task_id
+      AND tc.training_course = newer.training_course
+      AND tc.check_day = newer.check_day
+      AND (COALESCE(tc.checked_date, '-infinity'::timestamp), tc.id)
+        < (COALESCE(newer.checked_date, '-infinity'::timestamp), newer.id)
+    ''',
+    "ALTER TABLE task_checklist ALTER COLUMN check_day SET DEFAULT CURRENT_DATE",
+    "ALTER TABLE task_checklist ALTER COLUMN check_day SET NOT NULL",
+]
+
+INDEXES = [
+    Index("uq_task_checklist_task_course_day", "task_checklist",
+          "(task_id, training_course, check_day)", unique=True),
+]
@@ -0,0 +1,28 @@
+DESCRIPTION = "카탈로그 테이블 버전 카운터와 변경 알림 트리거 (task_items)"
+
+STATEMENTS = [
+    '''
+    CREATE TABLE IF NOT EXISTS catalog_versions (
+        name TEXT PRIMARY KEY,
+        version BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    ''',
+    "INSERT INTO catalog_versions (name) VALUES ('task_items') ON CONFLICT (name) DO NOTHING",
+    # 문장 단위로 버전을 올리고 catalog_changed 채널로 테이블 이름을 알림
+    '''
+    CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS trigger AS $$
+    BEGIN
+        UPDATE catalog_versions SET version = version + 1, updated_at = NOW() WHERE name = TG_ARGV[0];
+        PERFORM pg_notify('catalog_changed', TG_ARGV[0]);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    "DROP TRIGGER IF EXISTS trg_task_items_catalog_version ON task_items",
+    '''
+    CREATE TRIGGER trg_task_items_catalog_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON task_items
+    FOR EACH STATEMENT EXECUTE PROCEDURE bump_catalog_version('task_items')
+    ''',
+]
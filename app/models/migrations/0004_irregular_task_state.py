@@ -0,0 +1,24 @@
+DESCRIPTION = "비정기 업무 최신 상태 테이블 (irregular_tasks 는 이력으로 유지)"
+
+STATEMENTS = [
+    '''
+    CREATE TABLE IF NOT EXISTS irregular_task_state (
+        training_course TEXT NOT NULL,
+        task_name TEXT NOT NULL,
+        history_id INTEGER NOT NULL,
+        is_checked BOOLEAN,
+        checked_date TIMESTAMP NOT NULL,
+        PRIMARY KEY (training_course, task_name)
+    )
+    ''',
+    # 기존 이력에서 과정/업무별 최신 상태 채우기
+    '''
+    INSERT INTO irregular_task_state (training_course, task_name, history_id, is_checked, checked_date)
+    SELECT DISTINCT ON (COALESCE(training_course, ''), task_name)
+           COALESCE(training_course, ''), task_name, id, is_checked, checked_date
+    FROM irregular_tasks
+    WHERE task_name IS NOT NULL AND checked_date IS NOT NULL
+    ORDER BY COALESCE(training_course, ''), task_name, checked_date DESC, id DESC
+    ON CONFLICT (training_course, task_name) DO NOTHING
+    ''',
+]
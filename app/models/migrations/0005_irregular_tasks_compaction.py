@@ -0,0 +1,32 @@
+from app.models.schema import Index
+
+DESCRIPTION = "비정기 업무 이력 압축용 일별 요약/보관 테이블과 과정별 이력 인덱스"
+
+STATEMENTS = [
+    '''
+    CREATE TABLE IF NOT EXISTS irregular_task_daily (
+        training_course TEXT NOT NULL,
+        task_name TEXT NOT NULL,
+        day DATE NOT NULL,
+        checks INTEGER NOT NULL,
+        last_is_checked BOOLEAN,
+        last_checked_date TIMESTAMP NOT NULL,
+        PRIMARY KEY (training_course, task_name, day)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS irregular_tasks_archive (
+        id INTEGER PRIMARY KEY,
+        task_name TEXT,
+        is_checked BOOLEAN,
+        checked_date TIMESTAMP,
+        training_course TEXT,
+        archived_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    ''',
+]
+
+INDEXES = [
+    Index("idx_irregular_tasks_course_task_date", "irregular_tasks",
+          "(training_course, task_name, checked_date DESC)"),
+]
@@ -0,0 +1,10 @@
+from app.models.schema import Index
+
+DESCRIPTION = "출퇴근 기록 / 이슈사항 다운로드의 과정별 기간 조회 인덱스"
+
+INDEXES = [
+    Index("idx_attendance_course_date", "attendance", "(training_course, date)"),
+    Index("idx_issues_course_date", "issues", "(training_course, date)"),
+    # 과정 필터 없이 기간만 지정한 이슈사항 다운로드 (date, id 순 정렬)
+    Index("idx_issues_date_id", "issues", "(date, id)"),
+]
@@ -0,0 +1,9 @@
+from app.models.schema import Index
+
+DESCRIPTION = "출퇴근 기록 (date, id) keyset 페이지네이션 인덱스"
+
+INDEXES = [
+    # ORDER BY date DESC, id DESC + (date, id) < (...) 조건 (역방향 스캔)
+    Index("idx_attendance_date_id", "attendance", "(date, id)"),
+    Index("idx_attendance_instructor_date_id", "attendance", "(instructor, date, id)"),
+]
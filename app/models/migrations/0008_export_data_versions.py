@@ -0,0 +1,17 @@
+DESCRIPTION = "내보내기 캐시용 attendance / issues 데이터 버전 트리거"
+
+STATEMENTS = [
+    "INSERT INTO catalog_versions (name) VALUES ('attendance'), ('issues') ON CONFLICT (name) DO NOTHING",
+    "DROP TRIGGER IF EXISTS trg_attendance_data_version ON attendance",
+    '''
+    CREATE TRIGGER trg_attendance_data_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON attendance
+    FOR EACH STATEMENT EXECUTE PROCEDURE bump_catalog_version('attendance')
+    ''',
+    "DROP TRIGGER IF EXISTS trg_issues_data_version ON issues",
+    '''
+    CREATE TRIGGER trg_issues_data_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON issues
+    FOR EACH STATEMENT EXECUTE PROCEDURE bump_catalog_version('issues')
+    ''',
+]
@@ -0,0 +1,36 @@
+from app.models.attendance_rollup import CHECK_IN_SECONDS, late_after_seconds
+
+DESCRIPTION = "강사/훈련과정별 월간 출퇴근 집계 테이블 (저장 시 함께 갱신)"
+
+STATEMENTS = [
+    '''
+    CREATE TABLE IF NOT EXISTS attendance_monthly_rollup (
+        month DATE NOT NULL,
+        instructor TEXT NOT NULL,
+        training_course TEXT NOT NULL,
+        records INTEGER NOT NULL DEFAULT 0,
+        days_present INTEGER NOT NULL DEFAULT 0,
+        check_in_count INTEGER NOT NULL DEFAULT 0,
+        check_in_seconds BIGINT NOT NULL DEFAULT 0,
+        late_count INTEGER NOT NULL DEFAULT 0,
+        missing_log_count INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (month, instructor, training_course)
+    )
+    ''',
+    # 기존 기록으로 채우기 (지각 기준은 마이그레이션 시점의 ATTENDANCE_LATE_AFTER)
+    f'''
+    INSERT INTO attendance_monthly_rollup
+        (month, instructor, training_course, records, days_present,
+         check_in_count, check_in_seconds, late_count, missing_log_count)
+    SELECT date_trunc('month', date)::date, instructor, training_course,
+           COUNT(*), COUNT(DISTINCT date),
+           COUNT(check_in_seconds), COALESCE(SUM(check_in_seconds), 0),
+           COUNT(*) FILTER (WHERE check_in_seconds > {late_after_seconds()}),
+           COUNT(*) FILTER (WHERE NOT COALESCE(daily_log, FALSE))
+    FROM (SELECT attendance.*, {CHECK_IN_SECONDS} AS check_in_seconds FROM attendance) a
+    WHERE date IS NOT NULL AND instructor IS NOT NULL AND training_course IS NOT NULL
+    GROUP BY 1, 2, 3
+    ON CONFLICT (month, instructor, training_course) DO NOTHING
+    ''',
+]
@@ -0,0 +1,41 @@
+from app.models.schema import Index
+
+DESCRIPTION = "알림 outbox 테이블 (엔티티와 같은 트랜잭션으로 기록, 백그라운드에서 전송)"
+
+STATEMENTS = [
+    '''
+    CREATE TABLE IF NOT EXISTS notification_outbox (
+        id BIGSERIAL PRIMARY KEY,
+        channel_type TEXT NOT NULL,
+        message TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        last_error TEXT,
+        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        sent_at TIMESTAMP
+    )
+    ''',
+    # 커밋 시점에 전송 스레드를 깨움 (알림을 놓쳐도 주기적으로 확인)
+    '''
+    CREATE OR REPLACE FUNCTION notify_notification_outbox() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('notification_outbox', '');
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    "DROP TRIGGER IF EXISTS trg_notification_outbox_notify ON notification_outbox",
+    '''
+    CREATE TRIGGER trg_notification_outbox_notify
+    AFTER INSERT ON notification_outbox
+    FOR EACH STATEMENT EXECUTE PROCEDURE notify_notification_outbox()
+    ''',
+]
+
+INDEXES = [
+    # 전송 대기 중인 알림만 (보낸 알림/dead letter 가 쌓여도 크기가 작게 유지됨)
+    Index("idx_notification_outbox_pending", "notification_outbox", "(next_attempt_at, id)",
+          where="status = 'pending'"),
+    Index("idx_notification_outbox_status_created", "notification_outbox", "(status, created_at)"),
+]
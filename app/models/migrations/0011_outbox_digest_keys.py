@@ -0,0 +1,6 @@
+DESCRIPTION = "알림 outbox 묶음 전송(digest)용 이벤트 종류 / 묶음 키 컬럼"
+
+STATEMENTS = [
+    "ALTER TABLE notification_outbox ADD COLUMN IF NOT EXISTS event_type TEXT",
+    "ALTER TABLE notification_outbox ADD COLUMN IF NOT EXISTS group_key TEXT",
+]
@@ -0,0 +1,21 @@
+from app.models.schema import Index
+
+DESCRIPTION = "알림 outbox 전송 대상(sink) 구분과 과정 담당자 이메일"
+
+STATEMENTS = [
+    # 같은 이벤트도 전송 대상(slack, email)마다 한 행씩 기록해 따로 재시도
+    "ALTER TABLE notification_outbox ADD COLUMN IF NOT EXISTS sink TEXT NOT NULL DEFAULT 'slack'",
+    "ALTER TABLE notification_outbox ADD COLUMN IF NOT EXISTS training_course TEXT",
+    # training_info.manager_name 별 이메일 주소
+    '''
+    CREATE TABLE IF NOT EXISTS manager_contacts (
+        manager_name TEXT PRIMARY KEY,
+        email TEXT NOT NULL,
+        updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    ''',
+]
+
+INDEXES = [
+    Index("idx_training_info_manager_name", "training_info", "(manager_name)"),
+]
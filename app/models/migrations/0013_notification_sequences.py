@@ -0,0 +1,64 @@
+DESCRIPTION = "미확인 알림 개수용 엔티티별 순번 카운터와 사용자별 마지막 확인 순번"
+
+STATEMENTS = [
+    '''
+    CREATE TABLE IF NOT EXISTS notification_sequences (
+        entity TEXT PRIMARY KEY,
+        seq BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    ''',
+    # 기존 행 수로 시작 (이후 INSERT 마다 추가된 행 수만큼 증가)
+    '''
+    INSERT INTO notification_sequences (entity, seq)
+    VALUES ('notice', (SELECT COUNT(*) FROM notices)),
+           ('issue', (SELECT COUNT(*) FROM issues)),
+           ('comment', (SELECT COUNT(*) FROM issue_comments))
+    ON CONFLICT (entity) DO NOTHING
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS user_seen_sequences (
+        username TEXT PRIMARY KEY,
+        notice_seq BIGINT NOT NULL DEFAULT 0,
+        issue_seq BIGINT NOT NULL DEFAULT 0,
+        comment_seq BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    ''',
+    # 문장 단위로 추가된 행 수만큼 순번을 올리고 notification_sequence 채널로 "<entity>:<seq>" 를 알림
+    '''
+    CREATE OR REPLACE FUNCTION bump_notification_sequence() RETURNS trigger AS $$
+    DECLARE
+        added BIGINT;
+        current_seq BIGINT;
+    BEGIN
+        SELECT COUNT(*) INTO added FROM inserted_rows;
+        IF added > 0 THEN
+            UPDATE notification_sequences SET seq = seq + added, updated_at = NOW()
+            WHERE entity = TG_ARGV[0]
+            RETURNING seq INTO current_seq;
+            PERFORM pg_notify('notification_sequence', TG_ARGV[0] || ':' || current_seq);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+    "DROP TRIGGER IF EXISTS trg_notices_notification_sequence ON notices",
+    '''
+    CREATE TRIGGER trg_notices_notification_sequence
+    AFTER INSERT ON notices REFERENCING NEW TABLE AS inserted_rows
+    FOR EACH STATEMENT EXECUTE PROCEDURE bump_notification_sequence('notice')
+    ''',
+    "DROP TRIGGER IF EXISTS trg_issues_notification_sequence ON issues",
+    '''
+    CREATE TRIGGER trg_issues_notification_sequence
+    AFTER INSERT ON issues REFERENCING NEW TABLE AS inserted_rows
+    FOR EACH STATEMENT EXECUTE PROCEDURE bump_notification_sequence('issue')
+    ''',
+    "DROP TRIGGER IF EXISTS trg_issue_comments_notification_sequence ON issue_comments",
+    '''
+    CREATE TRIGGER trg_issue_comments_notification_sequence
+    AFTER INSERT ON issue_comments REFERENCING NEW TABLE AS inserted_rows
+    FOR EACH STATEMENT EXECUTE PROCEDURE bump_notification_sequence('comment')
+    ''',
+]
@@ -0,0 +1,18 @@
+from app.models.schema import Index
+
+DESCRIPTION = "공지사항 목록 캐시용 데이터 버전 트리거와 삭제되지 않은 공지사항 인덱스"
+
+STATEMENTS = [
+    "INSERT INTO catalog_versions (name) VALUES ('notices') ON CONFLICT (name) DO NOTHING",
+    "DROP TRIGGER IF EXISTS trg_notices_data_version ON notices",
+    '''
+    CREATE TRIGGER trg_notices_data_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON notices
+    FOR EACH STATEMENT EXECUTE PROCEDURE bump_catalog_version('notices')
+    ''',
+]
+
+INDEXES = [
+    # get_notices 의 (date, id) keyset 페이지 조회 (삭제된 공지사항 제외)
+    Index("idx_notices_active_date_id", "notices", "(date DESC, id DESC)", where="is_deleted = FALSE"),
+]
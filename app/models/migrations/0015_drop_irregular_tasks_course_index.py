@@ -0,0 +1,4 @@
+DESCRIPTION = "사용하지 않는 비정기 업무 이력 과정별 인덱스 삭제"
+
+# 과정별 조회는 irregular_task_state (PK), 압축은 checked_date / history_id 로 조회하므로 사용처 없음
+DROP_INDEXES = ["idx_irregular_tasks_course_task_date"]
@@ -0,0 +1,10 @@
+from app.models.schema import Index
+
+DESCRIPTION = "미해결 이슈 과정별 페이지 조회용 인덱스 (created_at NULL 은 -infinity 로 정렬)"
+
+INDEXES = [
+    # get_issues 의 LATERAL 페이지 조회: ORDER BY COALESCE(created_at, '-infinity') DESC, id DESC
+    Index("idx_issues_unresolved_page", "issues",
+          "(training_course, (COALESCE(created_at, '-infinity'::timestamp)) DESC, id DESC)",
+          where="resolved = FALSE"),
+]
@@ -0,0 +1,4 @@
+DESCRIPTION = "사용하지 않는 체크리스트 DATE(checked_date) 인덱스 삭제"
+
+# 당일 데이터 조회/저장은 check_day 유니크 키(uq_task_checklist_task_course_day)를 사용하므로 사용처 없음
+DROP_INDEXES = ["idx_task_checklist_task_course_day"]
@@ -0,0 +1,10 @@
+from app.models.schema import Index
+
+DESCRIPTION = "비정기 업무 이력 압축 배치용 인덱스"
+
+INDEXES = [
+    # 보존 기간이 지난 이력 찾기 (checked_date < NOW() - 보존 기간)
+    Index("idx_irregular_tasks_checked_date", "irregular_tasks", "(checked_date)"),
+    # 최신 상태로 참조 중인 이력 제외 (NOT EXISTS ... s.history_id = h.id)
+    Index("idx_irregular_task_state_history", "irregular_task_state", "(history_id)"),
+]
@@ -0,0 +1,14 @@
+from app.models.schema import Index
+
+DESCRIPTION = "출퇴근 기록 페이지 조회 인덱스를 COALESCE(date, '-infinity') 기준으로 교체"
+
+# (date, id) 인덱스는 페이지/다운로드 조회가 COALESCE 한 값으로 바뀌어 사용처 없음
+# (idx_attendance_instructor_date_id 는 월간 집계/중복 확인의 (instructor, date) 조회에 계속 사용)
+DROP_INDEXES = ["idx_attendance_date_id"]
+
+INDEXES = [
+    # ORDER BY COALESCE(date, '-infinity') DESC, id DESC + keyset / from, to 조건 (역방향 스캔)
+    Index("idx_attendance_page", "attendance", "((COALESCE(date, '-infinity'::date)), id)"),
+    Index("idx_attendance_instructor_page", "attendance",
+          "(instructor, (COALESCE(date, '-infinity'::date)), id)"),
+]
@@ -0,0 +1,9 @@
+from app.models.attendance_rollup import RECOMPUTE_LATE_COUNTS, late_after_seconds
+
+DESCRIPTION = "월간 출퇴근 집계에 지각 기준(late_after) 저장 후 현재 기준으로 지각 횟수 다시 계산"
+
+STATEMENTS = [
+    "ALTER TABLE attendance_monthly_rollup ADD COLUMN IF NOT EXISTS late_after INTEGER",
+    # 0009 의 채우기는 그 시점의 기준을 기록하지 않았으므로 현재 ATTENDANCE_LATE_AFTER 로 다시 계산
+    RECOMPUTE_LATE_COUNTS % ((late_after_seconds(),) * 3),
+]
@@ -0,0 +1,12 @@
+from app.models.schema import Index
+
+DESCRIPTION = "공지사항 페이지 조회 인덱스를 COALESCE(date, '-infinity') 기준으로 교체"
+
+# get_notices 가 COALESCE 한 값으로 정렬/비교하도록 바뀌어 (date, id) 인덱스는 사용처 없음
+DROP_INDEXES = ["idx_notices_active_date_id"]
+
+INDEXES = [
+    # get_notices 의 keyset 페이지 조회: ORDER BY COALESCE(date, '-infinity') DESC, id DESC (삭제된 공지사항 제외)
+    Index("idx_notices_active_page", "notices",
+          "((COALESCE(date, '-infinity'::timestamp)) DESC, id DESC)", where="is_deleted = FALSE"),
+]
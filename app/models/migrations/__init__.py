@@ -0,0 +1,8 @@
+# 버전별 스키마 마이그레이션 모듈
+# 파일명 앞의 숫자가 버전 (예: 0001_hot_path_indexes.py -> 1)
+#
+# 각 모듈은 다음 값을 정의합니다.
+#   DESCRIPTION: 설명
+#   STATEMENTS: 트랜잭션 안에서 순서대로 실행할 DDL 목록 (선택)
+#   INDEXES: CREATE INDEX CONCURRENTLY 로 생성하고 시작 시 존재 여부를 검사할 인덱스 목록 (선택)
+#   DROP_INDEXES: 이전 마이그레이션의 INDEXES 중 DROP INDEX CONCURRENTLY 로 삭제하고 검사 대상에서 뺄 인덱스 이름 목록 (선택)
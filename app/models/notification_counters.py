@@ -0,0 +1,77 @@
+import logging
+import threading
+import time
+
+from app import config
+from app.models import queries
+from app.models.db import get_db_connection
+from app.models.listener import listener
+
+logger = logging.getLogger(__name__)
+
+ENTITIES = ('notice', 'issue', 'comment')
+
+NOTIFICATION_SEQUENCES = queries.register('notification_sequences', '''
+    SELECT entity, seq FROM notification_sequences
+''')
+
+
+class NotificationCounters:
+    """워커 프로세스 단위 엔티티별 순번(notification_sequences) 캐시
+
+    - notification_sequence 알림(LISTEN)의 "<entity>:<seq>" 로 DB 조회 없이 바로 갱신
+    - 알림을 놓치더라도 NOTIFICATION_COUNTER_CHECK_INTERVAL 마다 다시 조회
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seqs = {}
+        self._checked_at = 0.0
+        self._dirty = True
+        self._subscribed = False
+
+    def on_notify(self, payload=None):
+        if payload is None:
+            self._dirty = True
+            return
+        entity, _, seq = payload.partition(':')
+        try:
+            seq = int(seq)
+        except ValueError:
+            self._dirty = True
+            return
+        with self._lock:
+            # 알림 순서가 바뀌어도 순번은 줄어들지 않음
+            if seq > self._seqs.get(entity, 0):
+                self._seqs[entity] = seq
+
+    def _subscribe(self):
+        if config.DB_LISTEN_ENABLED and not self._subscribed:
+            self._subscribed = True
+            listener.subscribe('notification_sequence', self.on_notify)
+
+    def refresh(self, force=False):
+        self._subscribe()
+        now = time.monotonic()
+        if not force and not self._dirty and now - self._checked_at < config.NOTIFICATION_COUNTER_CHECK_INTERVAL:
+            return
+
+        self._dirty = False
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            NOTIFICATION_SEQUENCES.execute(cursor)
+            rows = cursor.fetchall()
+            cursor.close()
+        with self._lock:
+            for entity, seq in rows:
+                self._seqs[entity] = max(seq, self._seqs.get(entity, 0))
+        self._checked_at = time.monotonic()
+
+    def current(self):
+        """엔티티별 현재 순번 {entity: seq}"""
+        self.refresh()
+        with self._lock:
+            return {entity: self._seqs.get(entity, 0) for entity in ENTITIES}
+
+
+notification_counters = NotificationCounters()
@@ -0,0 +1,338 @@
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+
+from app import config
+from app.models import jobs, queries
+from app.models.db import get_pool
+from app.models.listener import listener
+
+logger = logging.getLogger(__name__)
+
+PENDING, SENT, DEAD = 'pending', 'sent', 'dead'
+
+# 전송 대상(sink)마다 한 행씩 기록 (email 은 과정 담당자 이메일이 있을 때만)
+ENQUEUE = queries.register('outbox_enqueue', '''
+    INSERT INTO notification_outbox (sink, channel_type, message, event_type, group_key, training_course)
+    SELECT s.sink, %s, %s, %s, %s, %s
+    FROM unnest(%s::text[]) AS s(sink)
+    WHERE s.sink <> 'email' OR EXISTS (
+        SELECT 1 FROM training_info ti
+        JOIN manager_contacts mc ON mc.manager_name = ti.manager_name
+        WHERE ti.training_course = %s
+    )
+    RETURNING id
+''')
+
+MANAGER_EMAILS = queries.register('outbox_manager_emails', '''
+    SELECT ti.training_course, array_agg(DISTINCT mc.email)
+    FROM training_info ti
+    JOIN manager_contacts mc ON mc.manager_name = ti.manager_name
+    WHERE ti.training_course = ANY(%s::text[])
+    GROUP BY ti.training_course
+''')
+
+# 전송할 알림을 가져오면서 임대(lease) 시간만큼 다른 워커가 가져가지 못하게 미룸
+# - 같은 group_key 의 알림은 가장 오래된 알림이 digest 대기 시간을 넘기거나
+#   즉시 전송 이벤트가 들어오면 함께 가져옴 (group_key 가 없으면 단독으로 바로 전송)
+CLAIM = queries.register('outbox_claim', '''
+    UPDATE notification_outbox o
+    SET attempts = o.attempts + 1,
+        next_attempt_at = NOW() + make_interval(secs => %s)
+    WHERE o.id IN (
+        SELECT id FROM notification_outbox
+        WHERE status = 'pending' AND next_attempt_at <= NOW()
+          AND (group_key IS NULL OR group_key IN (
+              SELECT group_key FROM notification_outbox
+              WHERE status = 'pending' AND next_attempt_at <= NOW() AND group_key IS NOT NULL
+                AND (event_type = ANY(%s::text[]) OR created_at <= NOW() - make_interval(secs => %s))
+          ))
+        ORDER BY next_attempt_at, id
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING o.id, o.sink, o.channel_type, o.message, o.attempts, o.group_key, o.training_course
+''')
+
+MARK_SENT = queries.register('outbox_mark_sent', '''
+    UPDATE notification_outbox SET status = 'sent', sent_at = NOW(), last_error = NULL WHERE id = ANY(%s::bigint[])
+''')
+
+MARK_RETRY = queries.register('outbox_mark_retry', '''
+    UPDATE notification_outbox
+    SET next_attempt_at = NOW() + make_interval(secs => %s), last_error = %s
+    WHERE id = ANY(%s::bigint[])
+''')
+
+# 전송 제한으로 미룬 경우는 시도 횟수에 포함하지 않음
+MARK_DEFERRED = queries.register('outbox_mark_deferred', '''
+    UPDATE notification_outbox
+    SET next_attempt_at = NOW() + make_interval(secs => %s), last_error = %s,
+        attempts = GREATEST(attempts - 1, 0)
+    WHERE id = ANY(%s::bigint[])
+''')
+
+MARK_DEAD = queries.register('outbox_mark_dead', '''
+    UPDATE notification_outbox SET status = 'dead', last_error = %s WHERE id = ANY(%s::bigint[])
+''')
+
+PURGE_SENT = queries.register('outbox_purge_sent', '''
+    DELETE FROM notification_outbox
+    WHERE id IN (
+        SELECT id FROM notification_outbox
+        WHERE status = 'sent' AND created_at < NOW() - make_interval(days => %s)
+        LIMIT 1000
+    )
+''')
+
+
+def enabled_sinks():
+    """설정된 전송 대상 목록 (email 은 SMTP_HOST 가 있을 때만)"""
+    return [sink for sink in config.NOTIFICATION_SINKS if sink in SINKS and (sink != 'email' or config.SMTP_HOST)]
+
+
+def enqueue(cursor, channel_type, message, event_type=None, group_key=None, training_course=None):
+    """알림을 전송 대상별로 outbox 에 기록하고 id 목록 반환 (호출한 쪽의 트랜잭션과 함께 커밋되어야 전송됨)
+
+    group_key 가 같은 알림은 NOTIFICATION_DIGEST_WINDOW 동안 모았다가 하나의 digest 로 보냅니다.
+    event_type 이 NOTIFICATION_IMMEDIATE_TYPES 에 있으면 모인 알림과 함께 바로 보냅니다.
+    training_course 를 지정하면 해당 과정 담당자에게도 메일로 보냅니다.
+    """
+    ENQUEUE.execute(cursor, (channel_type, message, event_type, group_key, training_course,
+                             enabled_sinks(), training_course))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _deliver_slack(channel_type, messages, recipients):
+    from app.utils.notifications import get_notifier
+    notifier = get_notifier()
+    message = messages[0] if len(messages) == 1 else notifier.format_digest(messages, channel_type)
+    notifier.post(message, channel_type)
+
+
+def _deliver_email(channel_type, messages, recipients):
+    from app.utils.notifications import get_email_notifier
+    notifier = get_email_notifier()
+    subject, body = notifier.format_message(messages, channel_type)
+    notifier.send(recipients, subject, body)
+
+
+# sink 이름 -> 전송 함수 (channel_type, messages, recipients)
+SINKS = {
+    'slack': _deliver_slack,
+    'email': _deliver_email,
+}
+
+# sink 별 동시 전송 수 (email 은 SMTP 연결 하나를 재사용하므로 한 번에 하나씩)
+SINK_WORKERS = {
+    'email': 1,
+}
+
+
+def backoff_seconds(attempts):
+    """시도 횟수에 따른 재시도 대기 시간 (지수 증가 + 최대 20% jitter)"""
+    delay = min(config.OUTBOX_BACKOFF_BASE * 2 ** (attempts - 1), config.OUTBOX_BACKOFF_MAX)
+    return delay * random.uniform(1.0, 1.2)
+
+
+class OutboxDispatcher:
+    """notification_outbox 의 알림을 전송하는 백그라운드 스레드 (워커 프로세스당 하나)
+
+    - FOR UPDATE SKIP LOCKED 로 가져오므로 여러 워커/서버가 동시에 실행해도 중복 전송하지 않음
+    - notification_outbox 채널 알림(LISTEN)을 받으면 바로, 아니면 OUTBOX_POLL_INTERVAL 마다 확인
+    - 같은 group_key 로 함께 가져온 알림은 digest 메시지 하나로 전송
+    - 전송 대상(slack, email)마다 별도의 스레드 풀에서 보내므로 느린 sink 가 다른 sink 를 막지 않음
+    - 결과는 끝나는 대로 기록하고, NOTIFICATION_SINK_TIMEOUT 안에 끝나지 않은 전송도 끝나면 기록
+      (lease 의 절반이 지나도록 시작하지 못한 전송은 보내지 않고 바로 다시 대기열로 돌림)
+    - Slack 전송 제한(429 Retry-After)에 걸리면 시도 횟수를 늘리지 않고 그만큼 미룸
+    - 실패하면 지수 backoff 로 재시도하고 OUTBOX_MAX_ATTEMPTS 를 넘기거나 재시도할 수 없는 오류면 dead 로 표시
+    """
+
+    def __init__(self):
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._subscribed = False
+        self._purged_at = 0.0
+        self._executors = {}
+        self._executor_pid = None
+
+    def wake(self, payload=None):
+        self._wakeup.set()
+
+    def ensure_started(self):
+        if config.OUTBOX_POLL_INTERVAL <= 0:
+            return
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._wakeup = threading.Event()
+            self._thread = threading.Thread(target=self._loop, name="outbox-dispatcher", daemon=True)
+            self._thread.start()
+        if config.DB_LISTEN_ENABLED and not self._subscribed:
+            self._subscribed = True
+            listener.subscribe('notification_outbox', self.wake)
+
+    def _executor_for(self, sink):
+        """sink 별 스레드 풀 (fork 된 워커에서는 새로 생성)"""
+        pid = os.getpid()
+        with self._lock:
+            if self._executor_pid != pid:
+                self._executor_pid = pid
+                self._executors = {}
+            executor = self._executors.get(sink)
+            if executor is None:
+                executor = self._executors[sink] = ThreadPoolExecutor(
+                    max_workers=SINK_WORKERS.get(sink, config.NOTIFICATION_SINK_WORKERS),
+                    thread_name_prefix=f"notification-{sink}")
+            return executor
+
+    def _deliver(self, sink, channel_type, messages, recipients=(), start_deadline=None):
+        from app.utils.notifications import NotificationError
+        if start_deadline is not None and time.monotonic() > start_deadline:
+            # lease 가 끝나 다른 워커가 다시 가져갈 수 있으므로 늦게 보내지 않음 (시도 횟수에 포함하지 않음)
+            raise NotificationError("전송 대기 시간 초과", retry_after=0)
+        deliver = SINKS.get(sink)
+        if deliver is None:
+            raise NotificationError(f"알 수 없는 알림 전송 대상: {sink}", retryable=False)
+        deliver(channel_type, messages, list(recipients))
+
+    def dispatch_once(self, conn):
+        """전송 가능한 알림을 한 batch 처리하고 처리한 건수 반환"""
+        with conn.cursor() as cursor:
+            CLAIM.execute(cursor, (
+                config.OUTBOX_LEASE, config.NOTIFICATION_IMMEDIATE_TYPES,
+                config.NOTIFICATION_DIGEST_WINDOW, config.OUTBOX_BATCH_SIZE,
+            ))
+            claimed = cursor.fetchall()
+            courses = sorted({row[6] for row in claimed if row[1] == 'email' and row[6]})
+            recipients = {}
+            if courses:
+                MANAGER_EMAILS.execute(cursor, (courses,))
+                recipients = dict(cursor.fetchall())
+        conn.commit()
+
+        # (sink, group_key 또는 단독 알림 id) 별로 묶어 한 번씩 전송
+        groups = {}
+        for outbox_id, sink, channel_type, message, attempts, group_key, training_course in sorted(claimed):
+            group = groups.setdefault((sink, group_key or outbox_id), {
+                "sink": sink, "channel_type": channel_type, "ids": [], "messages": [], "attempts": 0,
+                "recipients": recipients.get(training_course) or [],
+            })
+            group["ids"].append(outbox_id)
+            group["messages"].append(message)
+            group["attempts"] = max(group["attempts"], attempts)
+
+        start_deadline = time.monotonic() + config.OUTBOX_LEASE / 2
+        futures = {
+            self._executor_for(group["sink"]).submit(
+                self._deliver, group["sink"], group["channel_type"], group["messages"], group["recipients"],
+                start_deadline,
+            ): group
+            for group in groups.values()
+        }
+        recorded = set()
+        try:
+            for future in as_completed(futures, timeout=config.NOTIFICATION_SINK_TIMEOUT):
+                self._record(conn, futures[future], future.exception())
+                recorded.add(future)
+        except TimeoutError:
+            pass
+        finally:
+            # 시간 초과나 기록 실패로 빠져나와도 모든 전송 결과를 기록해야 lease 만료 후 같은 알림을 다시 보내지 않음
+            self._record_remaining(futures, recorded)
+        return len(claimed)
+
+    def _record_remaining(self, futures, recorded):
+        """dispatch_once 에서 기록하지 못한 전송 결과를 기록 (아직 전송 중이면 끝나는 대로 기록)"""
+        for future, group in futures.items():
+            if future in recorded:
+                continue
+            if future.done():
+                self._record_late(group, future)
+            else:
+                logger.warning(f"알림 전송이 늦어져 끝나는 대로 기록 (sink={group['sink']}, ids={group['ids']})")
+                future.add_done_callback(lambda done, group=group: self._record_late(group, done))
+
+    def _record_late(self, group, future):
+        """dispatch_once 가 기록하지 못한 전송 결과를 별도 연결로 기록
+
+        dispatch_once 의 연결은 기록 실패로 오류 상태일 수 있으므로 풀에서 새 연결을 사용합니다.
+        (늦게 끝난 전송은 전송 스레드에서 호출)
+        """
+        pool = get_pool()
+        conn = pool.getconn()
+        try:
+            self._record(conn, group, future.exception())
+        except Exception:
+            conn.rollback()
+            logger.error(f"늦게 끝난 알림 전송 결과 기록 실패 (ids={group['ids']})", exc_info=True)
+        finally:
+            pool.putconn(conn)
+
+    def _record(self, conn, group, e):
+        """전송 결과 기록 (e 가 None 이면 성공)"""
+        from app.utils.notifications import NotificationError
+
+        ids, attempts = group["ids"], group["attempts"]
+        if e is None:
+            query, params = MARK_SENT, (ids,)
+        else:
+            retryable = not isinstance(e, NotificationError) or e.retryable
+            error = str(e)[:1000]
+            retry_after = getattr(e, 'retry_after', None)
+            if retry_after is not None:
+                logger.info(f"전송 제한으로 알림 전송 연기 (sink={group['sink']}, ids={ids}, {retry_after:.1f}초)")
+                query, params = MARK_DEFERRED, (retry_after, error, ids)
+            elif retryable and attempts < config.OUTBOX_MAX_ATTEMPTS:
+                logger.warning(f"알림 전송 실패, 재시도 예정 (sink={group['sink']}, ids={ids}, {attempts}회): {error}")
+                query, params = MARK_RETRY, (backoff_seconds(attempts), error, ids)
+            else:
+                logger.error(f"알림 전송 포기 (dead letter, sink={group['sink']}, ids={ids}, {attempts}회): {error}")
+                query, params = MARK_DEAD, (error, ids)
+        with conn.cursor() as cursor:
+            query.execute(cursor, params)
+        conn.commit()
+
+    def _purge(self, conn):
+        if time.monotonic() - self._purged_at < 3600:
+            return
+        self._purged_at = time.monotonic()
+        with conn.cursor() as cursor:
+            PURGE_SENT.execute(cursor, (config.OUTBOX_RETENTION_DAYS,))
+        conn.commit()
+
+    def run_once(self):
+        pool = get_pool()
+        conn = pool.getconn()
+        try:
+            total = 0
+            while True:
+                handled = self.dispatch_once(conn)
+                total += handled
+                if handled < config.OUTBOX_BATCH_SIZE:
+                    break
+            self._purge(conn)
+            return total
+        finally:
+            pool.putconn(conn)
+
+    def _loop(self):
+        while True:
+            self._wakeup.clear()
+            try:
+                self.run_once()
+            except Exception:
+                logger.error("알림 outbox 전송 중 오류", exc_info=True)
+            self._wakeup.wait(config.OUTBOX_POLL_INTERVAL)
+
+
+dispatcher = jobs.register(OutboxDispatcher())
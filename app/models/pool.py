@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from collections import deque
+
+import psycopg2
+from psycopg2 import extensions
+
+logger = logging.getLogger(__name__)
+
+
+class PoolConnection(extensions.connection):
+    """풀에서 관리하는 연결 (연결별로 PREPARE 된 문장 이름을 보관)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+
+class PoolTimeoutError(Exception):
+    """풀에서 제한 시간 내에 연결을 얻지 못한 경우"""
+
+
+class ConnectionPool:
+    """프로세스 단위 PostgreSQL 연결 풀
+
+    - 체크아웃 시 헬스 체크 (일정 시간 이상 유휴 상태였던 연결만 SELECT 1 실행)
+    - 최대 수명(max_lifetime)이 지난 연결은 반납 시 폐기
+    - 유휴 시간(idle_timeout)이 지난 연결은 minconn 개수까지 정리
+    """
+
+    def __init__(self, dsn, minconn=1, maxconn=10, max_lifetime=1800,
+                 idle_timeout=300, checkout_timeout=10, health_check_interval=30):
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError("풀 크기 설정이 올바르지 않습니다 (0 <= minconn <= maxconn, maxconn >= 1)")
+
+        self.dsn = dsn
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (conn, last_used) - 오른쪽이 가장 최근 반납된 연결
+        self._created_at = {}  # id(conn) -> 생성 시각
+        self._in_use = 0
+        self._closed = False
+
+        for _ in range(minconn):
+            conn = self._connect()
+            self._idle.append((conn, time.monotonic()))
+
+    def _connect(self):
+        conn = psycopg2.connect(self.dsn, connection_factory=PoolConnection)
+        self._created_at[id(conn)] = time.monotonic()
+        return conn
+
+    def _discard(self, conn):
+        self._created_at.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            logger.debug("연결 종료 중 오류 무시", exc_info=True)
+
+    def _expired(self, conn, now):
+        created = self._created_at.get(id(conn), now)
+        return self.max_lifetime and now - created > self.max_lifetime
+
+    def _healthy(self, conn, last_used, now):
+        if conn.closed:
+            return False
+        if now - last_used < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            logger.warning("헬스 체크 실패로 연결을 폐기합니다", exc_info=True)
+            return False
+
+    def _evict_idle(self, now):
+        # 가장 오래 유휴 상태였던 연결은 왼쪽에 있음
+        while len(self._idle) > self.minconn:
+            conn, last_used = self._idle[0]
+            if now - last_used <= self.idle_timeout and not self._expired(conn, now):
+                break
+            self._idle.popleft()
+            self._discard(conn)
+
+    def getconn(self, timeout=None):
+        """연결 체크아웃 (풀이 가득 찬 경우 timeout 초 동안 대기)"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            conn, last_used = self._reserve(deadline, timeout)
+            if conn is None:
+                # 새 연결 생성은 락 밖에서 수행 (핸드셰이크 동안 다른 스레드를 막지 않음)
+                try:
+                    return self._connect()
+                except Exception:
+                    self._release_slot()
+                    raise
+
+            # 헬스 체크도 락 밖에서 수행
+            if not self._expired(conn, time.monotonic()) and self._healthy(conn, last_used, time.monotonic()):
+                return conn
+            self._discard(conn)
+            self._release_slot()
+
+    def _reserve(self, deadline, timeout):
+        """유휴 연결 하나 또는 새 연결 슬롯 하나를 예약"""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise psycopg2.InterfaceError("연결 풀이 종료되었습니다")
+
+                now = time.monotonic()
+                self._evict_idle(now)
+
+                if self._idle:
+                    self._in_use += 1
+                    return self._idle.pop()
+
+                if self._in_use < self.maxconn:
+                    self._in_use += 1
+                    return None, None
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise PoolTimeoutError(f"{timeout}초 안에 DB 연결을 얻지 못했습니다 (maxconn={self.maxconn})")
+                self._cond.wait(remaining)
+
+    def _release_slot(self):
+        with self._cond:
+            self._in_use -= 1
+            self._cond.notify()
+
+    def putconn(self, conn, discard=False):
+        """연결 반납 (열린 트랜잭션은 롤백, 손상되었거나 수명이 지난 연결은 폐기)"""
+        if not discard and not conn.closed:
+            try:
+                status = conn.info.transaction_status
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    discard = True
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                logger.warning("반납 중 롤백 실패로 연결을 폐기합니다", exc_info=True)
+                discard = True
+
+        with self._cond:
+            self._in_use -= 1
+            now = time.monotonic()
+            if discard or conn.closed or self._closed or self._expired(conn, now):
+                self._discard(conn)
+            else:
+                self._idle.append((conn, now))
+            self._evict_idle(now)
+            self._cond.notify()
+
+    def closeall(self):
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._discard(conn)
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "minconn": self.minconn,
+                "maxconn": self.maxconn,
+            }
@@ -0,0 +1,107 @@
+import logging
+import re
+import threading
+import time
+
+from psycopg2 import errors
+
+from app import config
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _to_positional(sql):
+    """%s 자리표시자를 PREPARE 용 $1, $2 ... 로 변환 (%% 는 % 로)"""
+    counter = iter(range(1, 1000))
+    converted = re.sub(r'%s|%%', lambda m: '%' if m.group(0) == '%%' else f'${next(counter)}', sql)
+    return converted, next(counter) - 1
+
+
+class NamedQuery:
+    """이름으로 등록된 SQL
+
+    연결마다 처음 실행할 때 한 번 PREPARE 하고, 이후에는 EXECUTE 로 실행해
+    매 호출마다 파싱/플래닝하는 비용을 줄입니다.
+    SQL 은 psycopg2 와 같은 %s 자리표시자를 사용합니다 (리터럴 % 는 %%).
+    """
+
+    def __init__(self, name, sql):
+        self.name = name
+        self.sql = sql
+        self.statement = f"q_{name}"
+        self.prepared_sql, self.param_count = _to_positional(sql.strip().rstrip(';'))
+
+    def _prepare(self, cursor, prepared):
+        if self.statement not in prepared:
+            cursor.execute(f"PREPARE {self.statement} AS {self.prepared_sql}")
+            prepared.add(self.statement)
+
+    def execute(self, cursor, params=()):
+        """cursor 로 쿼리 실행 (결과는 cursor.fetch* 로 조회)"""
+        params = tuple(params)
+        if len(params) != self.param_count:
+            raise ValueError(f"{self.name}: 파라미터 {self.param_count}개가 필요합니다 (전달: {len(params)}개)")
+
+        prepared = getattr(cursor.connection, 'prepared_statements', None)
+        start = time.perf_counter()
+        try:
+            if not config.DB_PREPARED_STATEMENTS or prepared is None:
+                cursor.execute(self.sql, params)
+            else:
+                self._prepare(cursor, prepared)
+                placeholders = ', '.join(['%s'] * len(params))
+                cursor.execute(f"EXECUTE {self.statement}({placeholders})" if params else f"EXECUTE {self.statement}", params)
+        except errors.InvalidSqlStatementName:
+            # 세션이 바뀐 경우 (DISCARD ALL 등) 다음 호출에서 다시 PREPARE
+            if prepared is not None:
+                prepared.discard(self.statement)
+            raise
+        finally:
+            _record(self.name, time.perf_counter() - start)
+        return cursor
+
+
+def _record(name, elapsed):
+    with _stats_lock:
+        entry = _stats.setdefault(name, {"calls": 0, "total_time": 0.0, "max_time": 0.0})
+        entry["calls"] += 1
+        entry["total_time"] += elapsed
+        entry["max_time"] = max(entry["max_time"], elapsed)
+
+
+def register(name, sql):
+    """쿼리 등록 (같은 이름으로 다른 SQL 을 등록하면 오류)"""
+    existing = _registry.get(name)
+    if existing is not None:
+        if existing.sql != sql:
+            raise ValueError(f"이미 다른 SQL 로 등록된 쿼리 이름입니다: {name}")
+        return existing
+    query = NamedQuery(name, sql)
+    _registry[name] = query
+    return query
+
+
+def get(name):
+    return _registry[name]
+
+
+def registered():
+    return list(_registry.values())
+
+
+def stats():
+    """쿼리별 호출 횟수 / 누적·평균·최대 소요 시간(ms)"""
+    with _stats_lock:
+        return {
+            name: {
+                "calls": entry["calls"],
+                "total_ms": round(entry["total_time"] * 1000, 2),
+                "avg_ms": round(entry["total_time"] * 1000 / entry["calls"], 2) if entry["calls"] else 0,
+                "max_ms": round(entry["max_time"] * 1000, 2),
+            }
+            for name, entry in _stats.items()
+        }
@@ -0,0 +1,193 @@
+import logging
+import queue
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from flask import has_request_context, request
+
+from app import config
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_statements = {}  # (endpoint, fingerprint) -> 집계
+_slow_log = deque(maxlen=config.SLOW_QUERY_LOG_SIZE)
+_explains = deque(maxlen=config.SLOW_QUERY_LOG_SIZE)
+_last_explained = {}  # fingerprint -> 마지막 EXPLAIN 시각
+
+_explain_queue = queue.Queue(maxsize=10)
+_explain_worker = None
+_explain_worker_lock = threading.Lock()
+
+_EXECUTE_RE = re.compile(r'^\s*EXECUTE\s+(\w+)', re.IGNORECASE)
+_READ_ONLY_RE = re.compile(r'^\s*(SELECT|WITH)\b', re.IGNORECASE)
+_WRITE_RE = re.compile(r'\b(INSERT|UPDATE|DELETE|MERGE)\b', re.IGNORECASE)
+
+
+def _fingerprint(sql):
+    return ' '.join(sql.split())
+
+
+def _tags():
+    if has_request_context():
+        return request.blueprint or '-', request.endpoint or '-'
+    return 'background', threading.current_thread().name
+
+
+def _resolve_sql(sql):
+    """EXECUTE q_xxx 형태는 등록된 원본 SQL 로 되돌림 (EXPLAIN 용)"""
+    match = _EXECUTE_RE.match(sql)
+    if not match:
+        return sql
+    from app.models import queries
+    for named in queries.registered():
+        if named.statement == match.group(1):
+            return named.sql
+    return None
+
+
+def _describe_params(params):
+    """로그/관리자 화면용 파라미터 요약 (비밀번호 등이 남지 않도록 값은 기록하지 않고 개수와 타입만)"""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {key: type(value).__name__ for key, value in params.items()}
+    try:
+        return [type(value).__name__ for value in params]
+    except TypeError:
+        return type(params).__name__
+
+
+def _explainable(sql):
+    # 실행 계획만 보므로(ANALYZE 없이) 문장이 다시 실행되지는 않지만, 쓰기 문장은 대상에서 제외
+    return sql is not None and _READ_ONLY_RE.match(sql) and not _WRITE_RE.search(sql)
+
+
+def record(sql, params, elapsed, rowcount, pool_name):
+    """실행된 SQL 한 건의 소요 시간/행 수를 blueprint, endpoint 별로 집계"""
+    blueprint, endpoint = _tags()
+    fingerprint = _fingerprint(sql)
+    elapsed_ms = elapsed * 1000
+
+    with _lock:
+        entry = _statements.get((endpoint, fingerprint))
+        if entry is None:
+            if len(_statements) >= config.QUERY_STATS_MAX_ENTRIES:
+                return
+            entry = _statements[(endpoint, fingerprint)] = {
+                "blueprint": blueprint,
+                "endpoint": endpoint,
+                "sql": fingerprint,
+                "calls": 0,
+                "rows": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+            }
+        entry["calls"] += 1
+        entry["rows"] += max(rowcount or 0, 0)
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+    if elapsed_ms < config.SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    param_types = _describe_params(params)
+    logger.warning(f"느린 쿼리 {elapsed_ms:.1f}ms [{endpoint}] {fingerprint[:200]} params={param_types}")
+    with _lock:
+        _slow_log.append({
+            "at": datetime.now().isoformat(timespec='seconds'),
+            "blueprint": blueprint,
+            "endpoint": endpoint,
+            "sql": fingerprint,
+            "params": param_types,
+            "duration_ms": round(elapsed_ms, 2),
+            "rows": rowcount,
+        })
+    _schedule_explain(fingerprint, sql, params, pool_name)
+
+
+def _schedule_explain(fingerprint, sql, params, pool_name):
+    """같은 문장은 SLOW_QUERY_EXPLAIN_INTERVAL 마다 한 번만 EXPLAIN (백그라운드에서 실행)"""
+    if not config.SLOW_QUERY_EXPLAIN:
+        return
+    source_sql = _resolve_sql(sql)
+    if not _explainable(source_sql):
+        return
+
+    now = time.monotonic()
+    with _lock:
+        last = _last_explained.get(fingerprint)
+        if last is not None and now - last < config.SLOW_QUERY_EXPLAIN_INTERVAL:
+            return
+        _last_explained[fingerprint] = now
+
+    _ensure_explain_worker()
+    try:
+        _explain_queue.put_nowait((fingerprint, source_sql, params, pool_name))
+    except queue.Full:
+        pass
+
+
+def _ensure_explain_worker():
+    global _explain_worker
+    with _explain_worker_lock:
+        if _explain_worker is None or not _explain_worker.is_alive():
+            _explain_worker = threading.Thread(target=_explain_loop, name="slow-query-explain", daemon=True)
+            _explain_worker.start()
+
+
+def _explain_loop():
+    from app.models.db import get_pool
+    while True:
+        fingerprint, sql, params, pool_name = _explain_queue.get()
+        conn = None
+        pool = get_pool(pool_name)
+        try:
+            conn = pool.getconn()
+            with conn.cursor() as cursor:
+                cursor.execute("SET LOCAL statement_timeout = %s", (int(config.SLOW_QUERY_EXPLAIN_TIMEOUT * 1000),))
+                # ANALYZE 는 문장을 다시 실행하므로 사용하지 않음
+                # (pg_notify 는 이벤트를 중복 발행하고, pg_advisory_xact_lock 은 원래 요청이 잡은 락을 기다림)
+                cursor.execute("EXPLAIN " + sql, params)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            with _lock:
+                _explains.append({
+                    "at": datetime.now().isoformat(timespec='seconds'),
+                    "sql": fingerprint,
+                    "params": _describe_params(params),
+                    "plan": plan,
+                })
+        except Exception:
+            logger.warning(f"느린 쿼리 EXPLAIN 실패: {fingerprint[:200]}", exc_info=True)
+        finally:
+            if conn is not None:
+                # EXPLAIN 결과는 커밋하지 않음
+                pool.putconn(conn)
+
+
+def snapshot(limit=50):
+    """관리자 조회용 집계 (누적 시간 순 상위 limit 개, 느린 쿼리 로그, EXPLAIN 결과)"""
+    with _lock:
+        statements = sorted(_statements.values(), key=lambda e: e["total_ms"], reverse=True)[:limit]
+        statements = [
+            dict(entry, total_ms=round(entry["total_ms"], 2), max_ms=round(entry["max_ms"], 2),
+                 avg_ms=round(entry["total_ms"] / entry["calls"], 2))
+            for entry in statements
+        ]
+        return {
+            "threshold_ms": config.SLOW_QUERY_THRESHOLD_MS,
+            "statements": statements,
+            "slow_queries": list(reversed(_slow_log)),
+            "explains": list(reversed(_explains)),
+        }
+
+
+def reset():
+    with _lock:
+        _statements.clear()
+        _slow_log.clear()
+        _explains.clear()
+        _last_explained.clear()
@@ -0,0 +1,78 @@
+import itertools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 복제 지연 측정 쿼리 (수신한 WAL 을 모두 재생했다면 지연 0 으로 간주)
+LAG_QUERY = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM NOW() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+class ReplicaRouter:
+    """읽기 요청을 보낼 복제본 선택
+
+    - 복제본별 지연 시간을 check_interval 마다 측정해 캐시
+    - 지연이 max_lag 를 넘거나 측정에 실패한 복제본은 제외
+    - 사용 가능한 복제본이 없으면 None (호출자가 primary 사용)
+    """
+
+    def __init__(self, replica_names, max_lag, check_interval):
+        self.replica_names = list(replica_names)
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lag = {}  # name -> (측정 시각, 지연 초)
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(self.replica_names) if self.replica_names else None
+
+    @property
+    def enabled(self):
+        return bool(self.replica_names)
+
+    def _measure(self, name, pool):
+        conn = None
+        try:
+            conn = pool.getconn()
+            with conn.cursor() as cursor:
+                cursor.execute(LAG_QUERY)
+                lag = float(cursor.fetchone()[0])
+            pool.putconn(conn)
+            return lag
+        except Exception:
+            logger.warning(f"복제본 지연 측정 실패: {name}", exc_info=True)
+            if conn is not None:
+                pool.putconn(conn, discard=True)
+            return float('inf')
+
+    def lag(self, name, get_pool):
+        now = time.monotonic()
+        checked_at, lag = self._lag.get(name, (None, None))
+        if checked_at is not None and now - checked_at < self.check_interval:
+            return lag
+
+        lag = self._measure(name, get_pool(name))
+        with self._lock:
+            self._lag[name] = (now, lag)
+        if lag > self.max_lag:
+            logger.warning(f"복제본 지연 {lag:.1f}s 로 primary 로 우회합니다: {name}")
+        return lag
+
+    def choose(self, get_pool):
+        """지연이 허용 범위 안인 복제본 이름을 라운드로빈으로 선택"""
+        if not self.enabled:
+            return None
+        for _ in range(len(self.replica_names)):
+            with self._lock:
+                name = next(self._cycle)
+            if self.lag(name, get_pool) <= self.max_lag:
+                return name
+        return None
+
+    def status(self):
+        with self._lock:
+            return {name: lag for name, (_, lag) in self._lag.items()}
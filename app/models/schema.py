@@ -0,0 +1,270 @@
+import functools
+import importlib
+import logging
+import pkgutil
+import re
+
+import click
+import psycopg2
+from flask.cli import AppGroup
+
+from app import config
+
+logger = logging.getLogger(__name__)
+
+# 여러 워커/배포가 동시에 마이그레이션하지 않도록 사용하는 advisory lock 키
+MIGRATION_LOCK_KEY = 724_001
+
+
+class Index:
+    """마이그레이션이 관리하는 인덱스 정의"""
+
+    def __init__(self, name, table, columns, where=None, unique=False):
+        self.name = name
+        self.table = table
+        self.columns = columns
+        self.where = where
+        self.unique = unique
+
+    def create_sql(self):
+        sql = f"CREATE {'UNIQUE ' if self.unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {self.name} ON {self.table} {self.columns}"
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return sql
+
+
+class Migration:
+    def __init__(self, version, name, module):
+        self.version = version
+        self.name = name
+        self.description = getattr(module, 'DESCRIPTION', name)
+        self.statements = list(getattr(module, 'STATEMENTS', []))
+        self.indexes = list(getattr(module, 'INDEXES', []))
+        # 이전 마이그레이션에서 만든 인덱스 중 더 이상 필요 없는 인덱스 이름
+        self.dropped_indexes = list(getattr(module, 'DROP_INDEXES', []))
+
+
+def load_migrations():
+    """app/models/migrations 아래 모듈을 버전 순으로 로드"""
+    from app.models import migrations as package
+
+    found = []
+    for info in pkgutil.iter_modules(package.__path__):
+        match = re.match(r'^(\d+)_(\w+)$', info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f"{package.__name__}.{info.name}")
+        found.append(Migration(int(match.group(1)), info.name, module))
+
+    found.sort(key=lambda m: m.version)
+    versions = [m.version for m in found]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"마이그레이션 버전이 중복되었습니다: {versions}")
+    return found
+
+
+def _required_indexes(migrations):
+    """마이그레이션 순서대로 생성/삭제를 반영한 최종 필수 인덱스 목록"""
+    indexes = {}
+    for migration in migrations:
+        for name in migration.dropped_indexes:
+            indexes.pop(name, None)
+        for index in migration.indexes:
+            indexes[index.name] = index
+    return list(indexes.values())
+
+
+def required_indexes():
+    return _required_indexes(load_migrations())
+
+
+def _connect():
+    # CREATE INDEX CONCURRENTLY 는 트랜잭션 밖에서 실행해야 하므로 풀을 쓰지 않고 autocommit 연결 사용
+    conn = psycopg2.connect(config.DATABASE_URL)
+    conn.autocommit = True
+    return conn
+
+
+def _ensure_version_table(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+    ''')
+
+
+def applied_versions(cursor):
+    _ensure_version_table(cursor)
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def index_states(cursor, names):
+    """인덱스 이름 -> 유효 여부 (존재하지 않으면 키 없음)"""
+    cursor.execute('''
+        SELECT c.relname, i.indisvalid
+        FROM pg_class c
+        JOIN pg_index i ON i.indexrelid = c.oid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema() AND c.relname = ANY(%s)
+    ''', (list(names),))
+    return dict(cursor.fetchall())
+
+
+def _create_index(cursor, index):
+    # 이전에 CONCURRENTLY 생성이 중단되어 INVALID 상태로 남은 인덱스는 삭제 후 재생성
+    state = index_states(cursor, [index.name]).get(index.name)
+    if state is False:
+        logger.warning(f"INVALID 인덱스 재생성: {index.name}")
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}")
+    cursor.execute(index.create_sql())
+
+
+def upgrade(target=None):
+    """적용되지 않은 마이그레이션을 순서대로 적용하고 적용한 버전 목록 반환"""
+    conn = _connect()
+    applied_now = []
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+        try:
+            applied = applied_versions(cursor)
+            for migration in load_migrations():
+                if migration.version in applied or (target is not None and migration.version > target):
+                    continue
+                logger.info(f"마이그레이션 적용: {migration.name} - {migration.description}")
+
+                # DDL 은 하나의 트랜잭션으로 실행
+                if migration.statements:
+                    cursor.execute("BEGIN")
+                    try:
+                        for statement in migration.statements:
+                            cursor.execute(statement)
+                        cursor.execute("COMMIT")
+                    except Exception:
+                        cursor.execute("ROLLBACK")
+                        raise
+
+                for name in migration.dropped_indexes:
+                    cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+                for index in migration.indexes:
+                    _create_index(cursor, index)
+
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                    (migration.version, migration.name)
+                )
+                applied_now.append(migration.version)
+        finally:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+            cursor.close()
+    finally:
+        conn.close()
+    return applied_now
+
+
+def verify():
+    """(대기 중인 마이그레이션 버전 목록, 없거나 INVALID 인 필수 인덱스 이름 목록)"""
+    migrations = load_migrations()
+    indexes = _required_indexes(migrations)
+    conn = _connect()
+    try:
+        cursor = conn.cursor()
+        applied = applied_versions(cursor)
+        states = index_states(cursor, [index.name for index in indexes])
+        cursor.close()
+    finally:
+        conn.close()
+
+    pending = [m.version for m in migrations if m.version not in applied]
+    missing = [index.name for index in indexes if not states.get(index.name)]
+    return pending, missing
+
+
+def check_on_startup():
+    """대기 중인 마이그레이션이 있거나 필수 인덱스가 없으면 서버 시작을 중단"""
+    if not config.SCHEMA_CHECK_ON_STARTUP:
+        return
+    pending, missing = verify()
+    problems = []
+    if pending:
+        problems.append(f"적용되지 않은 마이그레이션: {pending}")
+    if missing:
+        problems.append(f"필수 인덱스 없음: {', '.join(missing)}")
+    if problems:
+        raise RuntimeError(
+            f"{' / '.join(problems)} - 'FLASK_APP=app flask db upgrade' 를 먼저 실행하세요."
+        )
+
+
+db_cli = AppGroup('db', help="DB 스키마 마이그레이션 / 인덱스 관리")
+
+
+@db_cli.command('upgrade')
+@click.option('--target', type=int, default=None, help="이 버전까지만 적용")
+def upgrade_command(target):
+    """대기 중인 마이그레이션 적용"""
+    applied = upgrade(target)
+    click.echo(f"적용된 마이그레이션: {applied}" if applied else "적용할 마이그레이션이 없습니다.")
+
+
+@db_cli.command('verify')
+def verify_command():
+    """마이그레이션 적용 여부와 필수 인덱스 확인 (문제가 있으면 종료 코드 1)"""
+    pending, missing = verify()
+    for version in pending:
+        click.echo(f"대기 중인 마이그레이션: {version}")
+    for name in missing:
+        click.echo(f"누락된 인덱스: {name}")
+    if pending or missing:
+        raise SystemExit(1)
+    click.echo("스키마가 최신 상태입니다.")
+
+
+@db_cli.command('status')
+def status_command():
+    """마이그레이션 목록과 적용 여부 출력"""
+    conn = _connect()
+    try:
+        cursor = conn.cursor()
+        applied = applied_versions(cursor)
+        cursor.close()
+    finally:
+        conn.close()
+    for migration in load_migrations():
+        mark = "적용됨" if migration.version in applied else "대기"
+        click.echo(f"{migration.version:04d} [{mark}] {migration.description}")
+
+
+@db_cli.command('compact-irregular-tasks')
+@click.option('--retention-days', type=int, default=None, help="이 기간(일)보다 오래된 이력 압축")
+def compact_irregular_tasks_command(retention_days):
+    """비정기 업무 이력을 일별 요약으로 압축하고 보관 테이블로 이동"""
+    from app.models.compaction import irregular_tasks_compaction, compact_irregular_tasks
+    moved = irregular_tasks_compaction.run_once(
+        functools.partial(compact_irregular_tasks, retention_days=retention_days)
+    )
+    if moved is None:
+        click.echo("다른 프로세스에서 압축 작업이 실행 중입니다.")
+    else:
+        click.echo(f"압축된 이력: {moved}건")
+
+
+@db_cli.command('recompute-attendance-late')
+def recompute_attendance_late_command():
+    """ATTENDANCE_LATE_AFTER 변경 후 월간 출퇴근 집계의 지각 횟수를 현재 기준으로 다시 계산"""
+    from app.models.attendance_rollup import recompute_late_counts
+    conn = psycopg2.connect(config.DATABASE_URL)
+    try:
+        with conn.cursor() as cursor:
+            updated = recompute_late_counts(cursor)
+        conn.commit()
+    finally:
+        conn.close()
+    click.echo(f"다시 계산한 월간 집계: {updated}건")
+
+
+def init_app(app):
+    app.cli.add_command(db_cli)
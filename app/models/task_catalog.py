@@ -0,0 +1,142 @@
+import logging
+import threading
+import time
+
+from app import config
+from app.models import queries
+from app.models.db import get_dedicated_connection
+from app.models.listener import listener
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = queries.register('catalog_version', '''
+    SELECT version FROM catalog_versions WHERE name = %s
+''')
+
+TASK_ITEMS_CATALOG = queries.register('task_items_catalog', '''
+    SELECT id, task_name, task_period, task_category, guide, due FROM task_items ORDER BY id ASC
+''')
+
+
+class TaskCatalog:
+    """워커 프로세스 단위 task_items 캐시
+
+    - catalog_changed 알림(LISTEN)을 받으면 다음 조회 때 버전을 확인해 다시 로드
+    - 알림을 놓치더라도 TASK_CATALOG_CHECK_INTERVAL 마다 버전 확인
+    - 캐시에 없는 task_name 조회 시 (새로 추가된 항목일 수 있으므로) 제한된 빈도로 버전 확인
+    - 버전과 목록은 primary 에서 읽고 이전보다 큰 버전만 받아들임 (지연된 복제본 때문에 되돌아가지 않도록)
+    """
+
+    NAME = 'task_items'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._items = []
+        self._by_id = {}
+        self._by_name = {}
+        self._by_category = {}
+        self._checked_at = 0.0
+        self._miss_checked_at = 0.0
+        self._dirty = True
+        self._subscribed = False
+
+    def invalidate(self, payload=None):
+        if payload is None or payload == self.NAME:
+            self._dirty = True
+
+    def _subscribe(self):
+        if config.DB_LISTEN_ENABLED and not self._subscribed:
+            self._subscribed = True
+            listener.subscribe('catalog_changed', self.invalidate)
+
+    def _current_version(self, cursor):
+        CATALOG_VERSION.execute(cursor, (self.NAME,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _load(self, cursor, version):
+        TASK_ITEMS_CATALOG.execute(cursor)
+        items = [
+            {
+                "id": row[0],
+                "task_name": row[1],
+                "task_period": row[2],
+                "task_category": row[3],
+                "guide": row[4],
+                "due": row[5],
+            }
+            for row in cursor.fetchall()
+        ]
+        by_name = {}
+        by_category = {}
+        for item in items:
+            # 같은 이름이 여러 개면 id 가 가장 작은 항목 사용
+            by_name.setdefault(item["task_name"], item)
+            by_category.setdefault(item["task_category"], []).append(item)
+
+        self._items = items
+        self._by_id = {item["id"]: item for item in items}
+        self._by_name = by_name
+        self._by_category = by_category
+        self._version = version
+        logger.info(f"업무 카탈로그 로드: {len(items)}개 (version={version})")
+
+    def refresh(self, force=False):
+        """필요한 경우 버전을 확인하고 바뀌었으면 다시 로드"""
+        self._subscribe()
+        now = time.monotonic()
+        if not force and not self._dirty and now - self._checked_at < config.TASK_CATALOG_CHECK_INTERVAL:
+            return
+
+        with self._lock:
+            if not force and not self._dirty and now - self._checked_at < config.TASK_CATALOG_CHECK_INTERVAL:
+                return
+            # 버전을 먼저 읽고 목록을 읽으므로, 그 사이 변경이 있으면 다음 확인 때 다시 로드됨
+            self._dirty = False
+            try:
+                # @use_replica 라우트에서도 요청 연결(복제본일 수 있음)이 아닌 primary 에서 확인
+                with get_dedicated_connection() as conn:
+                    cursor = conn.cursor()
+                    version = self._current_version(cursor)
+                    if force or version is None or self._version is None or version > self._version:
+                        self._load(cursor, version)
+                    cursor.close()
+            except Exception:
+                self._dirty = True
+                raise
+            self._checked_at = time.monotonic()
+
+    def all(self):
+        self.refresh()
+        return list(self._items)
+
+    def by_category(self, category):
+        self.refresh()
+        return list(self._by_category.get(category, []))
+
+    def by_id(self, task_id):
+        self.refresh()
+        return self._by_id.get(task_id)
+
+    def by_name(self, task_name):
+        self.refresh()
+        item = self._by_name.get(task_name)
+        if item is None and time.monotonic() - self._miss_checked_at > config.TASK_CATALOG_MISS_REFRESH_INTERVAL:
+            self._miss_checked_at = time.monotonic()
+            self._dirty = True
+            self.refresh()
+            item = self._by_name.get(task_name)
+        return item
+
+    def resolve_ids(self, task_names):
+        """task_name 목록 -> task_id 목록 (없는 이름은 None)"""
+        self.refresh()
+        missing = [name for name in task_names if name not in self._by_name]
+        if missing:
+            # 캐시에 없는 이름이 있으면 (제한된 빈도로) 한 번만 다시 확인
+            self.by_name(missing[0])
+        return [self._by_name[name]["id"] if name in self._by_name else None for name in task_names]
+
+
+task_catalog = TaskCatalog()
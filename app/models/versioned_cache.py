@@ -0,0 +1,88 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from app import config
+from app.models.db import get_dedicated_connection
+from app.models.listener import listener
+from app.models.task_catalog import CATALOG_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+class VersionedCache:
+    """catalog_versions 의 버전을 기준으로 하는 워커 프로세스 단위 캐시
+
+    - 버전이 바뀌면 이전 버전의 항목은 모두 버리고 다시 만듦
+    - catalog_changed 알림(LISTEN)을 받거나 invalidate() 를 호출하면 다음 조회 때 버전 확인
+    - 알림을 놓치더라도 check_interval 초마다 버전 확인
+    - 버전은 primary 에서 읽고 이전보다 큰 값만 받아들임 (지연된 복제본 때문에 이전 버전으로 돌아가지 않도록)
+    - 항목은 최근 사용 순으로 max_entries 개까지 보관
+    """
+
+    def __init__(self, name, check_interval, max_entries=256):
+        self.name = name
+        self.check_interval = check_interval
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._version = None
+        self._entries = OrderedDict()
+        self._checked_at = 0.0
+        self._dirty = True
+        self._subscribed = False
+
+    def invalidate(self, payload=None):
+        if payload is None or payload == self.name:
+            self._dirty = True
+
+    def _subscribe(self):
+        if config.DB_LISTEN_ENABLED and not self._subscribed:
+            self._subscribed = True
+            listener.subscribe('catalog_changed', self.invalidate)
+
+    def version(self):
+        """현재 데이터 버전 (필요한 경우에만 DB 에서 확인)"""
+        self._subscribe()
+        if not self._dirty and time.monotonic() - self._checked_at < self.check_interval:
+            return self._version
+
+        # 읽는 동안 들어온 알림은 다시 dirty 로 표시되도록 먼저 지움 (읽기에 실패하면 되돌림)
+        self._dirty = False
+        try:
+            # @use_replica 라우트에서도 요청 연결(복제본일 수 있음)이 아닌 primary 에서 확인
+            with get_dedicated_connection() as conn:
+                cursor = conn.cursor()
+                CATALOG_VERSION.execute(cursor, (self.name,))
+                row = cursor.fetchone()
+                cursor.close()
+        except Exception:
+            self._dirty = True
+            raise
+        version = row[0] if row else None
+        if version is None:
+            return None
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._entries.clear()
+                self._version = version
+            self._checked_at = time.monotonic()
+            return self._version
+
+    def get(self, key, load):
+        """key 에 해당하는 값 반환 (없으면 load() 결과를 저장, 버전이 없으면 캐시하지 않음)"""
+        version = self.version()
+        if version is None:
+            return load()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = load()
+        with self._lock:
+            # load 하는 동안 버전이 바뀌었으면 저장하지 않음
+            if self._version == version:
+                self._entries[key] = value
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
@@ -10,6 +10,9 @@ def register_routes(app):
     from app.routes.training import training_bp
     from app.routes.admin import admin_bp
     from app.routes.views import views_bp
+    from app.routes.exports import exports_bp
+    from app.routes.notifications import notifications_bp
+    from app.routes.events import events_bp
     
     app.register_blueprint(auth_bp)
     app.register_blueprint(notices_bp)
@@ -19,6 +22,9 @@ def register_routes(app):
     app.register_blueprint(training_bp)
     app.register_blueprint(admin_bp)
     app.register_blueprint(views_bp)
+    app.register_blueprint(exports_bp)
+    app.register_blueprint(notifications_bp)
+    app.register_blueprint(events_bp)
     
     # 시스템 상태 확인 라우트
     @app.route('/healthcheck', methods=['GET'])
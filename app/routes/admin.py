@@ -1,10 +1,53 @@
 from flask import Blueprint, request, jsonify
 import logging
-from app.models.db import get_db_connection
+from app.models import queries, query_log
+from app.models.db import get_db_connection, get_pool, use_replica, router
+from app.utils.auth import admin_required
 
 admin_bp = Blueprint('admin', __name__)
 
+TASK_STATUS_TODAY = queries.register('admin_task_status_today', '''
+    SELECT tc.training_course, ti.dept, 
+           COUNT(*) AS total_tasks, 
+           SUM(CASE WHEN tc.is_checked THEN 1 ELSE 0 END) AS checked_tasks
+    FROM task_checklist tc
+    JOIN training_info ti ON tc.training_course = ti.training_course
+    WHERE DATE(tc.checked_date) = CURRENT_DATE  -- 당일 체크된 데이터만 필터링
+    GROUP BY tc.training_course, ti.dept
+''')
+
+TASK_STATUS_OVERALL = queries.register('admin_task_status_overall', '''
+    SELECT tc.training_course, ti.dept, 
+           COUNT(*) AS total_tasks, 
+           SUM(CASE WHEN tc.is_checked THEN 1 ELSE 0 END) AS checked_tasks
+    FROM task_checklist tc
+    JOIN training_info ti ON tc.training_course = ti.training_course
+    GROUP BY tc.training_course, ti.dept
+''')
+
+TASK_STATUS_COMBINED = queries.register('admin_task_status_combined', '''
+    SELECT 
+        tc.training_course, 
+        ti.dept,
+        ti.manager_name,
+        ti.end_date,  -- end_date 컬럼 추가
+        COUNT(*) AS total_tasks,
+        SUM(CASE WHEN tc.is_checked THEN 1 ELSE 0 END) AS checked_tasks,
+        -- 당일 체크 데이터
+        SUM(CASE WHEN tc.is_checked AND DATE(tc.checked_date) = CURRENT_DATE THEN 1 ELSE 0 END) AS daily_checked_tasks,
+        COUNT(CASE WHEN DATE(tc.checked_date) = CURRENT_DATE THEN 1 ELSE NULL END) AS daily_total_tasks,
+        -- 전날 체크 데이터
+        SUM(CASE WHEN tc.is_checked AND DATE(tc.checked_date) = CURRENT_DATE - INTERVAL '1 day' THEN 1 ELSE 0 END) AS yesterday_checked_tasks,
+        COUNT(CASE WHEN DATE(tc.checked_date) = CURRENT_DATE - INTERVAL '1 day' THEN 1 ELSE NULL END) AS yesterday_total_tasks
+    FROM task_checklist tc
+    JOIN training_info ti ON tc.training_course = ti.training_course
+    WHERE ti.end_date >= CURRENT_DATE - INTERVAL '7 days'  -- 종료된 지 1주일 이내의 과정만 포함
+    GROUP BY tc.training_course, ti.dept, ti.manager_name, ti.end_date  -- end_date 추가
+    ORDER BY ti.end_date DESC
+''')
+
 @admin_bp.route('/admin/task_status', methods=['GET'])
+@use_replica
 def get_task_status():
     """
     훈련 과정별 업무 체크리스트의 체크율을 조회하는 API
@@ -19,22 +62,13 @@ def get_task_status():
         description: 체크 상태 조회 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # training_info 테이블을 조인하여 dept 정보 포함
-        cursor.execute('''
-            SELECT tc.training_course, ti.dept, 
-                   COUNT(*) AS total_tasks, 
-                   SUM(CASE WHEN tc.is_checked THEN 1 ELSE 0 END) AS checked_tasks
-            FROM task_checklist tc
-            JOIN training_info ti ON tc.training_course = ti.training_course
-            WHERE DATE(tc.checked_date) = CURRENT_DATE  -- 당일 체크된 데이터만 필터링
-            GROUP BY tc.training_course, ti.dept
-        ''')
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # training_info 테이블을 조인하여 dept 정보 포함
+            TASK_STATUS_TODAY.execute(cursor)
+            results = cursor.fetchall()
+            cursor.close()
 
         task_status = []
         for row in results:
@@ -57,6 +91,7 @@ def get_task_status():
 
 
 @admin_bp.route('/admin/task_status_overall', methods=['GET'])
+@use_replica
 def get_overall_task_status():
     """
     훈련 과정별 전체 체크율을 조회하는 API
@@ -70,21 +105,13 @@ def get_overall_task_status():
         description: 체크율 조회 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT tc.training_course, ti.dept, 
-                   COUNT(*) AS total_tasks, 
-                   SUM(CASE WHEN tc.is_checked THEN 1 ELSE 0 END) AS checked_tasks
-            FROM task_checklist tc
-            JOIN training_info ti ON tc.training_course = ti.training_course
-            GROUP BY tc.training_course, ti.dept
-        ''')
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            TASK_STATUS_OVERALL.execute(cursor)
         
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+            results = cursor.fetchall()
+            cursor.close()
 
         task_status = []
         for row in results:
@@ -104,6 +131,7 @@ def get_overall_task_status():
 
 
 @admin_bp.route('/admin/task_status_combined', methods=['GET'])
+@use_replica
 def get_combined_task_status():
     """
     훈련 과정별 업무 체크리스트의 체크율(당일, 전날, 전체)을 조회하는 API
@@ -119,33 +147,13 @@ def get_combined_task_status():
         description: 체크 상태 조회 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT 
-                tc.training_course, 
-                ti.dept,
-                ti.manager_name,
-                ti.end_date,  -- end_date 컬럼 추가
-                COUNT(*) AS total_tasks,
-                SUM(CASE WHEN tc.is_checked THEN 1 ELSE 0 END) AS checked_tasks,
-                -- 당일 체크 데이터
-                SUM(CASE WHEN tc.is_checked AND DATE(tc.checked_date) = CURRENT_DATE THEN 1 ELSE 0 END) AS daily_checked_tasks,
-                COUNT(CASE WHEN DATE(tc.checked_date) = CURRENT_DATE THEN 1 ELSE NULL END) AS daily_total_tasks,
-                -- 전날 체크 데이터
-                SUM(CASE WHEN tc.is_checked AND DATE(tc.checked_date) = CURRENT_DATE - INTERVAL '1 day' THEN 1 ELSE 0 END) AS yesterday_checked_tasks,
-                COUNT(CASE WHEN DATE(tc.checked_date) = CURRENT_DATE - INTERVAL '1 day' THEN 1 ELSE NULL END) AS yesterday_total_tasks
-            FROM task_checklist tc
-            JOIN training_info ti ON tc.training_course = ti.training_course
-            WHERE ti.end_date >= CURRENT_DATE - INTERVAL '7 days'  -- 종료된 지 1주일 이내의 과정만 포함
-            GROUP BY tc.training_course, ti.dept, ti.manager_name, ti.end_date  -- end_date 추가
-            ORDER BY ti.end_date DESC
-        ''')
-
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            TASK_STATUS_COMBINED.execute(cursor)
+
+            results = cursor.fetchall()
+            cursor.close()
 
         task_status = []
         for row in results:
@@ -178,4 +186,219 @@ def get_combined_task_status():
         return jsonify({"success": True, "data": task_status}), 200
     except Exception as e:
         logging.error("Error retrieving combined task status", exc_info=True)
-        return jsonify({"success": False, "message": "체크율 정보를 불러오는데 실패했습니다."}), 500
\ No newline at end of file
+        return jsonify({"success": False, "message": "체크율 정보를 불러오는데 실패했습니다."}), 500
+
+
+@admin_bp.route('/admin/query_stats', methods=['GET'])
+@admin_required
+def get_query_stats():
+    """
+    SQL 실행 통계 / 느린 쿼리 로그 조회 API (관리자 전용)
+    ---
+    tags:
+      - Admin
+    summary: "엔드포인트별 SQL 실행 시간, 느린 쿼리와 EXPLAIN 결과를 조회합니다."
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: "누적 시간 기준 상위 몇 개의 문장을 반환할지 (기본값 50)"
+    responses:
+      200:
+        description: 쿼리 통계 반환
+      401:
+        description: 로그인 필요
+      403:
+        description: 관리자 권한 없음
+    """
+    try:
+        limit = request.args.get('limit', 50, type=int)
+        data = query_log.snapshot(limit=limit)
+        data["named_queries"] = queries.stats()
+        data["pool"] = get_pool().stats()
+        data["replica_lag"] = router.status()
+        return jsonify({"success": True, "data": data}), 200
+    except Exception as e:
+        logging.error("Error retrieving query stats", exc_info=True)
+        return jsonify({"success": False, "message": "쿼리 통계 조회 실패"}), 500
+
+
+@admin_bp.route('/admin/query_stats/reset', methods=['POST'])
+@admin_required
+def reset_query_stats():
+    """
+    SQL 실행 통계 초기화 API (관리자 전용)
+    ---
+    tags:
+      - Admin
+    responses:
+      200:
+        description: 통계 초기화 완료
+    """
+    query_log.reset()
+    return jsonify({"success": True, "message": "쿼리 통계가 초기화되었습니다."}), 200
+
+
+@admin_bp.route('/admin/notification_outbox', methods=['GET'])
+@admin_required
+def get_notification_outbox():
+    """
+    알림 outbox 상태 조회 API (관리자 전용)
+    ---
+    tags:
+      - Admin
+    summary: "상태별 알림 개수와 전송에 실패한(dead) 알림 목록을 조회합니다."
+    responses:
+      200:
+        description: outbox 상태 반환
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT status, COUNT(*) FROM notification_outbox GROUP BY status")
+            counts = dict(cursor.fetchall())
+            cursor.execute('''
+                SELECT id, sink, channel_type, message, attempts, last_error, created_at
+                FROM notification_outbox
+                WHERE status = 'dead'
+                ORDER BY created_at DESC
+                LIMIT 50
+            ''')
+            dead = [
+                {"id": row[0], "sink": row[1], "channel_type": row[2], "message": row[3], "attempts": row[4],
+                 "last_error": row[5], "created_at": row[6]}
+                for row in cursor.fetchall()
+            ]
+            cursor.close()
+        return jsonify({"success": True, "data": {"counts": counts, "dead": dead}}), 200
+    except Exception as e:
+        logging.error("Error retrieving notification outbox", exc_info=True)
+        return jsonify({"success": False, "message": "알림 outbox 조회 실패"}), 500
+
+
+@admin_bp.route('/admin/notification_outbox/retry', methods=['POST'])
+@admin_required
+def retry_notification_outbox():
+    """
+    전송 실패(dead) 알림 재전송 API (관리자 전용)
+    ---
+    tags:
+      - Admin
+    parameters:
+      - in: body
+        name: body
+        required: false
+        schema:
+          type: object
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+              description: "재전송할 알림 ID (생략하면 dead 상태 전체)"
+    responses:
+      200:
+        description: 재전송 대기열로 이동한 개수 반환
+    """
+    try:
+        ids = (request.get_json(silent=True) or {}).get('ids')
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE notification_outbox
+                SET status = 'pending', attempts = 0, next_attempt_at = NOW()
+                WHERE status = 'dead' AND (%s::bigint[] IS NULL OR id = ANY(%s::bigint[]))
+            ''', (ids, ids))
+            retried = cursor.rowcount
+            conn.commit()
+            cursor.close()
+        return jsonify({"success": True, "retried": retried}), 200
+    except Exception as e:
+        logging.error("Error retrying notification outbox", exc_info=True)
+        return jsonify({"success": False, "message": "알림 재전송 요청 실패"}), 500
+
+
+@admin_bp.route('/admin/manager_contacts', methods=['GET'])
+@admin_required
+def get_manager_contacts():
+    """
+    과정 담당자 알림 메일 주소 목록 조회 API (관리자 전용)
+    ---
+    tags:
+      - Admin
+    responses:
+      200:
+        description: training_info 의 담당자별 이메일 (등록되지 않았으면 null)
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT m.manager_name, mc.email
+                FROM (SELECT DISTINCT manager_name FROM training_info WHERE manager_name IS NOT NULL) m
+                LEFT JOIN manager_contacts mc ON mc.manager_name = m.manager_name
+                ORDER BY m.manager_name
+            ''')
+            contacts = [{"manager_name": row[0], "email": row[1]} for row in cursor.fetchall()]
+            cursor.close()
+        return jsonify({"success": True, "data": contacts}), 200
+    except Exception as e:
+        logging.error("Error retrieving manager contacts", exc_info=True)
+        return jsonify({"success": False, "message": "담당자 연락처 조회 실패"}), 500
+
+
+@admin_bp.route('/admin/manager_contacts', methods=['PUT'])
+@admin_required
+def update_manager_contact():
+    """
+    과정 담당자 알림 메일 주소 등록/삭제 API (관리자 전용)
+    ---
+    tags:
+      - Admin
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - manager_name
+          properties:
+            manager_name:
+              type: string
+              example: "홍길동"
+            email:
+              type: string
+              example: "manager@example.com"
+              description: "비우면 등록된 주소 삭제"
+    responses:
+      200:
+        description: 저장 성공
+      400:
+        description: 담당자 이름 누락 또는 이메일 형식 오류
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        manager_name = (data.get('manager_name') or '').strip()
+        email = (data.get('email') or '').strip()
+        if not manager_name:
+            return jsonify({"success": False, "message": "담당자 이름이 필요합니다."}), 400
+        if email and '@' not in email:
+            return jsonify({"success": False, "message": "이메일 형식이 올바르지 않습니다."}), 400
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            if email:
+                cursor.execute('''
+                    INSERT INTO manager_contacts (manager_name, email) VALUES (%s, %s)
+                    ON CONFLICT (manager_name) DO UPDATE SET email = EXCLUDED.email, updated_at = NOW()
+                ''', (manager_name, email))
+            else:
+                cursor.execute("DELETE FROM manager_contacts WHERE manager_name = %s", (manager_name,))
+            conn.commit()
+            cursor.close()
+        return jsonify({"success": True, "message": "담당자 연락처가 저장되었습니다."}), 200
+    except Exception as e:
+        logging.error("Error updating manager contact", exc_info=True)
+        return jsonify({"success": False, "message": "담당자 연락처 저장 실패"}), 500
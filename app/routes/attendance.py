@@ -1,15 +1,99 @@
-from flask import Blueprint, request, jsonify, send_file
-import io
-import pandas as pd
+from flask import Blueprint, request, jsonify
+import datetime
 import logging
-from app.models.db import get_db_connection
+import pandas as pd
+from app import config
+from app.models import attendance_import, queries
+from app.models.attendance_rollup import ROLLUP_INSERTED, late_after_seconds, lock_writes
+from app.models.db import get_db_connection, use_replica
+from app.utils.export import StreamedQuery, csv_response, xlsx_response
+from app.utils.export_jobs import export_jobs
+from app.utils.filters import parse_filters, where_clause
 
 attendance_bp = Blueprint('attendance', __name__)
 
+ATTENDANCE_COLUMNS = ['ID', '날짜', '강사', '훈련과정', '출근 시간', '퇴근 시간', '일지 작성 완료']
+
+SAVE_ATTENDANCE = queries.register('attendance_save', f'''
+    WITH inserted AS (
+        INSERT INTO attendance (date, instructor, instructor_name, training_course, check_in, check_out, daily_log)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        RETURNING date, instructor, training_course, check_in, daily_log
+    ),
+    {ROLLUP_INSERTED}
+    SELECT COUNT(*) FROM inserted
+''')
+
+ATTENDANCE_SUMMARY = queries.register('attendance_monthly_summary', '''
+    SELECT month, instructor, training_course, records, days_present,
+           check_in_count, check_in_seconds, late_count, missing_log_count, late_after
+    FROM attendance_monthly_rollup
+    WHERE month BETWEEN %s AND %s
+      AND (%s::text IS NULL OR instructor = %s)
+      AND (%s::text IS NULL OR training_course = %s)
+    ORDER BY month DESC, training_course, instructor
+''')
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# date 가 NULL 인 기록은 '-infinity' 로 취급해 마지막에 정렬 ((date, id) < (...) 는 NULL 이면 항상 거짓)
+# from / to 조건도 같은 값으로 비교해 페이지 인덱스(idx_attendance_page)를 사용
+SORT_KEY = "COALESCE(date, '-infinity'::date)"
+NULL_DATE = '-infinity'
+
+
+def _export_query(args):
+    """csv / excel 다운로드용 조회 쿼리 (날짜 형식 오류 시 ValueError)"""
+    conditions, params = parse_filters(args, SORT_KEY, ('instructor', 'training_course'))
+    return (
+        'SELECT id, date, instructor, training_course, check_in, check_out, daily_log '
+        f'FROM attendance {where_clause(conditions)} ORDER BY {SORT_KEY} DESC, id DESC'
+    ), params
+
+
+export_jobs.register(
+    'attendance', ('from', 'to', 'instructor', 'training_course'), _export_query,
+    ATTENDANCE_COLUMNS, "출퇴근_기록.xlsx", "출퇴근 기록", version_name='attendance',
+)
+
+
+def _parse_month(value):
+    """YYYY-MM -> 해당 월 1일 (값이 없으면 None, 형식 오류 시 ValueError)"""
+    if not value:
+        return None
+    return datetime.datetime.strptime(value, '%Y-%m').date()
+
+
+def _shift_month(month, delta):
+    index = month.year * 12 + month.month - 1 + delta
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def _format_seconds(seconds):
+    """자정부터의 초 -> HH:MM"""
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}"
+
+
+def _page_cursor(record):
+    """페이지 마지막 기록 (id, date, ...) 의 next_cursor (date 가 NULL 이면 '-infinity')"""
+    record_id, record_date = record[0], record[1]
+    return f"{record_date.isoformat() if record_date else NULL_DATE}:{record_id}"
+
+
+def _parse_cursor(value):
+    """next_cursor ("YYYY-MM-DD:id") 를 (date, id) 로 변환 (형식 오류 시 ValueError)"""
+    date_part, _, id_part = value.rpartition(':')
+    if date_part == NULL_DATE:
+        return NULL_DATE, int(id_part)
+    return datetime.date.fromisoformat(date_part), int(id_part)
+
+
 @attendance_bp.route('/attendance', methods=['GET'])
+@use_replica
 def get_attendance():
     """
-    출퇴근 기록 파일 다운로드 API
+    출퇴근 기록 조회 / 파일 다운로드 API
     ---
     tags:
       - Attendance
@@ -19,43 +103,93 @@ def get_attendance():
         type: string
         required: false
         description: "csv 또는 excel 형식으로 다운로드 (기본값 JSON 반환)"
+      - name: from
+        in: query
+        type: string
+        format: date
+        required: false
+        description: "시작 날짜 (YYYY-MM-DD)"
+      - name: to
+        in: query
+        type: string
+        format: date
+        required: false
+        description: "종료 날짜 (YYYY-MM-DD, 해당 날짜 포함)"
+      - name: instructor
+        in: query
+        type: string
+        required: false
+        description: "강사"
+      - name: training_course
+        in: query
+        type: string
+        required: false
+        description: "훈련 과정"
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: "JSON 응답의 한 페이지 크기 (기본값 100, 최대 1000)"
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: "이전 응답의 next_cursor 값 (다음 페이지 조회)"
     responses:
       200:
-        description: 출퇴근 기록 데이터 반환 또는 파일 다운로드
+        description: 출퇴근 기록 데이터 반환 (날짜, ID 내림차순) 또는 파일 다운로드
+      400:
+        description: 잘못된 포맷, 날짜 또는 cursor 형식
       500:
         description: 데이터 조회 실패
     """
     try:
         format_type = request.args.get('format', 'json')  # 기본값 JSON
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, date, instructor, training_course, check_in, check_out, daily_log FROM attendance ORDER BY date DESC')
-        attendance_records = cursor.fetchall()
-        cursor.close()
-        conn.close()
-
-        columns = ['ID', '날짜', '강사', '훈련과정', '출근 시간', '퇴근 시간', '일지 작성 완료']
-        df = pd.DataFrame(attendance_records, columns=columns)
-
-        # JSON 응답 (기본값)
-        if format_type == 'json':
-            return jsonify({"success": True, "data": df.to_dict(orient='records')}), 200
-
-        # Excel 파일 다운로드
-        elif format_type == 'excel':
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                df.to_excel(writer, index=False, sheet_name="출퇴근 기록")
-            output.seek(0)
-            return send_file(
-                output,
-                mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                as_attachment=True,
-                download_name="출퇴근_기록.xlsx"
+        if format_type not in ('json', 'csv', 'excel'):
+            return jsonify({"success": False, "message": "잘못된 포맷 요청"}), 400
+
+        try:
+            conditions, params = parse_filters(request.args, SORT_KEY, ('instructor', 'training_course'))
+        except ValueError:
+            return jsonify({"success": False, "message": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"}), 400
+
+        # 파일 다운로드는 서버 측 커서로 batch 단위로 읽음 (전체를 메모리에 올리지 않음)
+        # 큰 기간의 excel 은 POST /exports/attendance 로 백그라운드에서 만드는 것을 권장
+        if format_type in ('csv', 'excel'):
+            streamed = StreamedQuery(*_export_query(request.args))
+            if format_type == 'csv':
+                return csv_response(streamed, ATTENDANCE_COLUMNS, "출퇴근_기록.csv")
+            return xlsx_response(streamed, ATTENDANCE_COLUMNS, "출퇴근_기록.xlsx", "출퇴근 기록")
+
+        # JSON 응답 (기본값) - (COALESCE(date, '-infinity'), id) 기준 keyset 페이지네이션
+        limit = min(max(request.args.get('limit', DEFAULT_PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+        cursor_value = request.args.get('cursor')
+        if cursor_value:
+            try:
+                cursor_date, cursor_id = _parse_cursor(cursor_value)
+            except ValueError:
+                return jsonify({"success": False, "message": "cursor 형식이 올바르지 않습니다"}), 400
+            conditions.append(f"({SORT_KEY}, id) < (%s::date, %s)")
+            params += [cursor_date, cursor_id]
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+            cursor.execute(
+                'SELECT id, date, instructor, training_course, check_in, check_out, daily_log '
+                f'FROM attendance {where_clause(conditions)} ORDER BY {SORT_KEY} DESC, id DESC LIMIT %s',
+                params + [limit + 1]
             )
+            attendance_records = cursor.fetchall()
+            cursor.close()
 
-        else:
-            return jsonify({"success": False, "message": "잘못된 포맷 요청"}), 400
+        next_cursor = None
+        if len(attendance_records) > limit:
+            attendance_records = attendance_records[:limit]
+            next_cursor = _page_cursor(attendance_records[-1])
+
+        data = [dict(zip(ATTENDANCE_COLUMNS, record)) for record in attendance_records]
+        return jsonify({"success": True, "data": data, "next_cursor": next_cursor}), 200
 
     except Exception as e:
         logging.error("출퇴근 기록 조회 오류", exc_info=True)
@@ -128,17 +262,203 @@ def save_attendance():
         if not date or not instructor or not instructor_name or not training_course or not check_in or not check_out:
             return jsonify({"success": False, "message": "Missing required fields"}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO attendance (date, instructor, instructor_name, training_course, check_in, check_out, daily_log)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        ''', (date, instructor, instructor_name, training_course, check_in, check_out, daily_log))
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            # 같은 날짜를 동시에 저장해도 출근 일수가 한 번만 더해지도록 대량 등록과 같은 락으로 직렬화
+            lock_writes(cursor)
+            # 기록 저장과 월간 집계 갱신을 한 문장으로 처리
+            SAVE_ATTENDANCE.execute(cursor, (
+                date, instructor, instructor_name, training_course, check_in, check_out, daily_log,
+                late_after_seconds(),
+            ))
+            conn.commit()
+            cursor.close()
 
         return jsonify({"success": True, "message": "Attendance saved!"}), 201
     except Exception as e:
         logging.error("Error saving attendance", exc_info=True)
-        return jsonify({"success": False, "message": "Failed to save attendance"}), 500
\ No newline at end of file
+        return jsonify({"success": False, "message": "Failed to save attendance"}), 500
+
+@attendance_bp.route('/attendance/summary', methods=['GET'])
+@use_replica
+def get_attendance_summary():
+    """
+    강사/훈련과정별 월간 출퇴근 요약 API
+    ---
+    tags:
+      - Attendance
+    summary: "월별 출근 일수, 평균 출근 시간, 지각 횟수, 일지 미작성 횟수를 집계 테이블에서 조회합니다."
+    parameters:
+      - name: from_month
+        in: query
+        type: string
+        required: false
+        description: "시작 월 (YYYY-MM, 기본값: 종료 월 기준 11개월 전)"
+      - name: to_month
+        in: query
+        type: string
+        required: false
+        description: "종료 월 (YYYY-MM, 기본값: 이번 달)"
+      - name: instructor
+        in: query
+        type: string
+        required: false
+      - name: training_course
+        in: query
+        type: string
+        required: false
+    responses:
+      200:
+        description: "월간 요약 반환 (월별 late_after 는 그 달의 late_count 를 센 지각 기준)"
+      400:
+        description: 월 형식 오류
+      500:
+        description: 요약 조회 실패
+    """
+    try:
+        try:
+            to_month = _parse_month(request.args.get('to_month')) or datetime.date.today().replace(day=1)
+            from_month = _parse_month(request.args.get('from_month')) or _shift_month(to_month, -11)
+        except ValueError:
+            return jsonify({"success": False, "message": "월 형식이 올바르지 않습니다 (YYYY-MM)"}), 400
+
+        instructor = request.args.get('instructor') or None
+        training_course = request.args.get('training_course') or None
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            ATTENDANCE_SUMMARY.execute(cursor, (
+                from_month, to_month, instructor, instructor, training_course, training_course,
+            ))
+            rows = cursor.fetchall()
+            cursor.close()
+
+        summary = []
+        for (month, instructor_id, course, records, days_present,
+             check_in_count, check_in_seconds, late_count, missing_log_count, late_after) in rows:
+            avg_check_in = None
+            if check_in_count:
+                avg_check_in = _format_seconds(round(check_in_seconds / check_in_count))
+            summary.append({
+                "month": month.strftime('%Y-%m'),
+                "instructor": instructor_id,
+                "training_course": course,
+                "records": records,
+                "days_present": days_present,
+                "avg_check_in": avg_check_in,
+                "late_count": late_count,
+                # late_count 를 센 지각 기준 (설정이 바뀐 뒤 다시 계산되지 않은 달은 이전 기준)
+                "late_after": _format_seconds(late_after) if late_after is not None else None,
+                "missing_log_count": missing_log_count,
+            })
+
+        return jsonify({"success": True, "data": summary}), 200
+    except Exception as e:
+        logging.error("Error retrieving attendance summary", exc_info=True)
+        return jsonify({"success": False, "message": "출퇴근 요약 조회 실패"}), 500
+
+@attendance_bp.route('/attendance/bulk', methods=['POST'])
+def bulk_save_attendance():
+    """
+    출퇴근 기록 대량 등록 API (CSV 또는 JSON 배열)
+    ---
+    tags:
+      - Attendance
+    summary: "여러 건의 출퇴근 기록을 한 번에 저장하고 행별 오류를 반환합니다."
+    description: |
+      - Content-Type: text/csv 본문 또는 multipart 의 file 필드로 CSV 를 보내거나, JSON 배열을 보냅니다.
+      - CSV 헤더/JSON 키: date, instructor, instructor_name, training_course, check_in, check_out, daily_log
+      - 같은 (date, instructor, training_course) 기록이 이미 있으면 저장하지 않고 오류로 보고합니다.
+      - 행 번호(row)는 CSV 헤더를 제외한 데이터 행 / JSON 배열 요소 기준으로 1부터 시작합니다.
+    consumes:
+      - application/json
+      - text/csv
+      - multipart/form-data
+    parameters:
+      - in: body
+        name: body
+        required: false
+        schema:
+          type: array
+          items:
+            type: object
+            properties:
+              date:
+                type: string
+                format: date
+                example: "2025-02-12"
+              instructor:
+                type: string
+                example: "1"
+              instructor_name:
+                type: string
+                example: "홍길동"
+              training_course:
+                type: string
+                example: "데이터 분석 스쿨"
+              check_in:
+                type: string
+                example: "09:00"
+              check_out:
+                type: string
+                example: "18:00"
+              daily_log:
+                type: boolean
+                example: true
+    responses:
+      200:
+        description: "처리 결과 (total, inserted, errors: [{row, errors}])"
+      400:
+        description: 잘못된 요청 형식 또는 필수 컬럼 누락
+      413:
+        description: 최대 행 수 초과
+      500:
+        description: 출퇴근 기록 대량 저장 실패
+    """
+    try:
+        if request.mimetype == 'text/csv':
+            df = attendance_import.read_records(request.get_data().decode('utf-8-sig'), 'csv')
+        elif 'file' in request.files:
+            df = attendance_import.read_records(request.files['file'].read().decode('utf-8-sig'), 'csv')
+        else:
+            data = request.get_json(silent=True)
+            if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+                return jsonify({"success": False, "message": "CSV 파일 또는 JSON 배열이 필요합니다"}), 400
+            df = attendance_import.read_records(data, 'json')
+    except (UnicodeDecodeError, pd.errors.ParserError, pd.errors.EmptyDataError):
+        return jsonify({"success": False, "message": "CSV 형식이 올바르지 않습니다 (UTF-8)"}), 400
+
+    if len(df) > config.ATTENDANCE_BULK_MAX_ROWS:
+        return jsonify({
+            "success": False,
+            "message": f"한 번에 최대 {config.ATTENDANCE_BULK_MAX_ROWS}건까지 등록할 수 있습니다"
+        }), 413
+
+    missing = attendance_import.missing_columns(df)
+    if missing:
+        return jsonify({"success": False, "message": f"필수 컬럼 누락: {', '.join(missing)}"}), 400
+
+    try:
+        valid, errors = attendance_import.validate_records(df)
+
+        with get_db_connection() as conn:
+            try:
+                inserted, duplicated = attendance_import.merge_records(conn, valid)
+                # 응답을 만들기 전에 커밋 (커밋 실패 시 inserted 를 돌려주지 않도록)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        for row in duplicated:
+            errors.setdefault(row, []).append("같은 날짜/강사/훈련과정 기록이 이미 있습니다")
+
+        return jsonify({
+            "success": True,
+            "total": len(df),
+            "inserted": inserted,
+            "errors": [{"row": row, "errors": errors[row]} for row in sorted(errors)],
+        }), 200
+    except Exception as e:
+        logging.error("Error bulk saving attendance", exc_info=True)
+        return jsonify({"success": False, "message": "출퇴근 기록 대량 저장 실패"}), 500
@@ -43,12 +43,11 @@ def login():
         return jsonify({"success": False, "message": "ID와 비밀번호를 입력하세요."}), 400
 
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, password FROM users WHERE username = %s", (username,))
-        user = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, password FROM users WHERE username = %s", (username,))
+            user = cursor.fetchone()
+            cursor.close()
 
         if not user or user[1] != password:
             return jsonify({"success": False, "message": "잘못된 ID 또는 비밀번호입니다."}), 401
@@ -155,41 +154,38 @@ def change_password():
                 "message": "새 비밀번호는 최소 4자 이상이어야 합니다."
             }), 400
             
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 현재 비밀번호 확인
-        cursor.execute(
-            "SELECT id FROM users WHERE username = %s AND password = %s",
-            (username, current_password)
-        )
-        user = cursor.fetchone()
+            # 현재 비밀번호 확인
+            cursor.execute(
+                "SELECT id FROM users WHERE username = %s AND password = %s",
+                (username, current_password)
+            )
+            user = cursor.fetchone()
         
-        if not user:
-            cursor.close()
-            conn.close()
-            return jsonify({
-                "success": False,
-                "message": "사용자명 또는 현재 비밀번호가 일치하지 않습니다."
-            }), 401
+            if not user:
+                cursor.close()
+                return jsonify({
+                    "success": False,
+                    "message": "사용자명 또는 현재 비밀번호가 일치하지 않습니다."
+                }), 401
             
-        # 비밀번호 업데이트
-        cursor.execute(
-            "UPDATE users SET password = %s WHERE username = %s AND password = %s",
-            (new_password, username, current_password)
-        )
+            # 비밀번호 업데이트
+            cursor.execute(
+                "UPDATE users SET password = %s WHERE username = %s AND password = %s",
+                (new_password, username, current_password)
+            )
         
-        if cursor.rowcount == 0:
-            cursor.close()
-            conn.close()
-            return jsonify({
-                "success": False,
-                "message": "비밀번호 변경에 실패했습니다."
-            }), 500
+            if cursor.rowcount == 0:
+                cursor.close()
+                return jsonify({
+                    "success": False,
+                    "message": "비밀번호 변경에 실패했습니다."
+                }), 500
             
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
+            cursor.close()
         
         return jsonify({
             "success": True,
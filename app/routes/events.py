@@ -0,0 +1,84 @@
+from flask import Blueprint, Response, request, jsonify
+import json
+import logging
+import time
+from app import config
+from app.models.events import event_hub
+from app.utils import gevent_compat
+
+events_bp = Blueprint('events', __name__)
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPES = ('notice', 'issue', 'comment', 'unchecked', 'unchecked_comment')
+
+
+def _format_event(event):
+    data = json.dumps(event["data"], ensure_ascii=False, default=str)
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+
+
+@events_bp.route('/events/stream', methods=['GET'])
+def stream_events():
+    """
+    대시보드 변경 이벤트 SSE 스트림 API
+    ---
+    tags:
+      - Events
+    summary: "공지사항/이슈/댓글/미체크 항목이 바뀌면 change 이벤트({type, action, id, training_course})를 보냅니다."
+    description: "resync 이벤트를 받으면 (놓친 이벤트가 있을 수 있으므로) 목록 전체를 다시 조회하세요."
+    produces:
+      - text/event-stream
+    parameters:
+      - name: types
+        in: query
+        type: string
+        required: false
+        description: "받을 이벤트 종류 (쉼표로 구분, 기본값 전체: notice,issue,comment,unchecked,unchecked_comment)"
+      - name: training_course
+        in: query
+        type: string
+        required: false
+        description: "특정 훈련 과정 이벤트만 (과정 구분이 없는 공지사항은 항상 포함)"
+    responses:
+      200:
+        description: 이벤트 스트림
+      400:
+        description: 알 수 없는 이벤트 종류
+      503:
+        description: "SSE 비활성화(SSE_ENABLED, gevent 워커 아님, LISTEN 비활성화) 또는 연결 수 초과 - 주기 조회로 대체"
+    """
+    types = [name.strip() for name in request.args.get('types', '').split(',') if name.strip()]
+    unknown = [name for name in types if name not in EVENT_TYPES]
+    if unknown:
+        return jsonify({"success": False, "message": f"알 수 없는 이벤트 종류: {', '.join(unknown)}"}), 400
+    # sync 워커에서는 연결 하나가 워커를 SSE_MAX_DURATION 동안 차지하므로 gevent 워커에서만 허용
+    if not (config.SSE_ENABLED and config.DB_LISTEN_ENABLED and gevent_compat.is_patched()):
+        return jsonify({"success": False, "message": "실시간 이벤트를 사용할 수 없습니다"}), 503
+
+    client = event_hub.connect(types, request.args.get('training_course'))
+    if client is None:
+        return jsonify({"success": False, "message": "연결이 너무 많습니다. 잠시 후 다시 시도해 주세요"}), 503
+
+    # 재연결이면 끊긴 동안의 이벤트는 다시 보낼 수 없으므로 resync 부터 보냄
+    reconnected = bool(request.headers.get('Last-Event-ID'))
+
+    def generate():
+        try:
+            yield f"retry: {config.SSE_RETRY_MS}\n\n"
+            if reconnected:
+                client.overflowed = True
+            deadline = time.monotonic() + config.SSE_MAX_DURATION
+            while time.monotonic() < deadline:
+                event = client.get(timeout=config.SSE_HEARTBEAT_INTERVAL)
+                if event is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield _format_event(event)
+        finally:
+            event_hub.disconnect(client)
+
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # nginx 등 프록시 버퍼링 비활성화
+    return response
@@ -0,0 +1,132 @@
+from flask import Blueprint, request, jsonify, send_file
+import logging
+import os
+from app.utils.export import XLSX_MIMETYPE
+from app.utils.export_jobs import export_jobs, DONE
+
+exports_bp = Blueprint('exports', __name__)
+
+logger = logging.getLogger(__name__)
+
+
+def _job_response(job):
+    data = {key: job[key] for key in ("id", "kind", "params", "status", "cached", "created_at", "finished_at", "error")}
+    if job["status"] == DONE:
+        data["download_url"] = f"/exports/{job['id']}/download"
+    return data
+
+
+@exports_bp.route('/exports/<kind>', methods=['POST'])
+def create_export(kind):
+    """
+    Excel 내보내기 작업 등록 API
+    ---
+    tags:
+      - Exports
+    summary: "파일을 백그라운드에서 만들고 작업 ID 를 반환합니다. 같은 조건/데이터면 캐시된 파일을 바로 사용합니다."
+    parameters:
+      - name: kind
+        in: path
+        type: string
+        required: true
+        description: "attendance 또는 issues"
+      - in: body
+        name: body
+        required: false
+        schema:
+          type: object
+          properties:
+            from:
+              type: string
+              format: date
+              example: "2025-02-01"
+            to:
+              type: string
+              format: date
+              example: "2025-02-28"
+            instructor:
+              type: string
+              description: "attendance 만 해당"
+            training_course:
+              type: string
+              example: "데이터 분석 스쿨"
+    responses:
+      202:
+        description: 작업 등록 (status 가 done 이면 바로 다운로드 가능)
+      400:
+        description: 날짜 형식 오류
+      404:
+        description: 알 수 없는 내보내기 종류
+      503:
+        description: 대기 중인 작업이 너무 많음
+    """
+    try:
+        args = request.get_json(silent=True) or request.args
+        try:
+            job = export_jobs.submit(kind, args)
+        except KeyError:
+            return jsonify({"success": False, "message": f"지원하지 않는 내보내기 종류입니다 ({', '.join(export_jobs.kinds())})"}), 404
+        except ValueError:
+            return jsonify({"success": False, "message": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"}), 400
+        except RuntimeError as e:
+            return jsonify({"success": False, "message": str(e)}), 503
+        return jsonify({"success": True, "job": _job_response(job)}), 202
+    except Exception as e:
+        logging.error("Error creating export job", exc_info=True)
+        return jsonify({"success": False, "message": "내보내기 작업 등록 실패"}), 500
+
+
+@exports_bp.route('/exports/<job_id>', methods=['GET'])
+def get_export(job_id):
+    """
+    내보내기 작업 상태 조회 API
+    ---
+    tags:
+      - Exports
+    parameters:
+      - name: job_id
+        in: path
+        type: string
+        required: true
+    responses:
+      200:
+        description: "작업 상태 (pending, running, done, failed)"
+      404:
+        description: 작업 없음 (만료 포함)
+    """
+    job = export_jobs.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "message": "내보내기 작업을 찾을 수 없습니다"}), 404
+    return jsonify({"success": True, "job": _job_response(job)}), 200
+
+
+@exports_bp.route('/exports/<job_id>/download', methods=['GET'])
+def download_export(job_id):
+    """
+    완료된 내보내기 파일 다운로드 API
+    ---
+    tags:
+      - Exports
+    parameters:
+      - name: job_id
+        in: path
+        type: string
+        required: true
+    responses:
+      200:
+        description: Excel 파일
+      404:
+        description: 작업 또는 파일 없음 (만료 포함)
+      409:
+        description: 아직 완료되지 않은 작업
+    """
+    job = export_jobs.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "message": "내보내기 작업을 찾을 수 없습니다"}), 404
+    if job["status"] != DONE:
+        return jsonify({"success": False, "message": "아직 파일이 준비되지 않았습니다", "job": _job_response(job)}), 409
+
+    path = export_jobs.artifact_path(job)
+    if not os.path.exists(path):
+        return jsonify({"success": False, "message": "파일이 만료되었습니다. 다시 요청해 주세요"}), 404
+    return send_file(path, mimetype=XLSX_MIMETYPE, as_attachment=True, download_name=job["filename"])
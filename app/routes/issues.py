@@ -1,15 +1,122 @@
-from flask import Blueprint, request, jsonify, send_file
-import io
-import pandas as pd
+from flask import Blueprint, request, jsonify
 import logging
-from app.models.db import get_db_connection
-from app.utils.notifications import SlackNotifier
+from app.models import events, outbox, queries
+from app.models.db import get_db_connection, use_replica
+from app.utils.export import StreamedQuery, xlsx_response
+from app.utils.export_jobs import export_jobs
+from app.utils.filters import parse_filters, where_clause
 from datetime import datetime
 
 issues_bp = Blueprint('issues', __name__)
 
+# 미해결 이슈를 과정별로 최신순 한 페이지씩 조회 (과정별 LATERAL 조회는 idx_issues_unresolved_page 사용)
+# created_at 이 NULL 인 이슈는 '-infinity' 로 취급해 마지막 페이지에 포함 (total 과 개수가 맞도록)
+# 댓글은 페이지에 포함된 이슈만 한 번에 모아 최신 N개로 자름
+_UNRESOLVED_ISSUES_PAGE = '''
+    WITH courses AS (
+        SELECT training_course, COUNT(*) AS total, MIN(created_at) AS first_created_at
+        FROM issues
+        WHERE resolved = FALSE {course_filter}
+        GROUP BY training_course
+    ),
+    page AS (
+        SELECT p.*
+        FROM courses c
+        CROSS JOIN LATERAL (
+            SELECT i.id, i.content, i.date, i.created_at, i.created_by, i.resolved, i.training_course,
+                   COALESCE(i.created_at, '-infinity'::timestamp) AS sort_key
+            FROM issues i
+            WHERE i.resolved = FALSE AND i.training_course = c.training_course
+              AND (COALESCE(i.created_at, '-infinity'::timestamp), i.id) < (%s::timestamp, %s)
+            ORDER BY COALESCE(i.created_at, '-infinity'::timestamp) DESC, i.id DESC
+            LIMIT %s
+        ) p
+    ),
+    comments AS (
+        SELECT issue_id,
+               MAX(total) AS comment_count,
+               json_agg(json_build_object(
+                   'id', id,
+                   'comment', comment,
+                   'created_at', created_at,
+                   'created_by', COALESCE(created_by, '작성자 없음')
+               ) ORDER BY created_at ASC, id ASC) FILTER (WHERE rn <= %s) AS comments
+        FROM (
+            SELECT ic.id, ic.issue_id, ic.comment, ic.created_at, ic.created_by,
+                   ROW_NUMBER() OVER (PARTITION BY ic.issue_id ORDER BY ic.created_at DESC, ic.id DESC) AS rn,
+                   COUNT(*) OVER (PARTITION BY ic.issue_id) AS total
+            FROM issue_comments ic
+            WHERE ic.issue_id IN (SELECT id FROM page)
+        ) ranked
+        GROUP BY issue_id
+    )
+    SELECT c.training_course, c.total, json_agg(json_build_object(
+        'id', p.id,
+        'content', p.content,
+        'date', p.date,
+        'created_at', p.created_at,
+        'created_by', COALESCE(p.created_by, '작성자 없음'),
+        'resolved', p.resolved,
+        'comments', cm.comments,
+        'comment_count', COALESCE(cm.comment_count, 0)
+    ) ORDER BY p.sort_key DESC, p.id DESC) FILTER (WHERE p.id IS NOT NULL) AS issues
+    FROM courses c
+    LEFT JOIN page p ON p.training_course = c.training_course
+    LEFT JOIN comments cm ON cm.issue_id = p.id
+    GROUP BY c.training_course, c.total, c.first_created_at
+    ORDER BY c.first_created_at DESC
+'''
+
+UNRESOLVED_ISSUES = queries.register(
+    'issues_unresolved_page', _UNRESOLVED_ISSUES_PAGE.format(course_filter=''))
+UNRESOLVED_ISSUES_BY_COURSE = queries.register(
+    'issues_unresolved_course_page', _UNRESOLVED_ISSUES_PAGE.format(course_filter='AND training_course = %s'))
+
+ISSUE_COMMENTS = queries.register('issue_comments_by_issue', '''
+    SELECT id, comment, created_at, created_by FROM issue_comments WHERE issue_id = %s ORDER BY created_at ASC
+''')
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_ISSUES_PER_COURSE = 50
+MAX_ISSUES_PER_COURSE = 200
+NO_LIMIT = 2147483647
+# cursor 가 없을 때의 (created_at, id) 기준값 - 모든 이슈보다 뒤
+END_OF_PAGE = (datetime.max, NO_LIMIT)
+
+
+NULL_CREATED_AT = '-infinity'
+
+
+def _page_cursor(issue):
+    """페이지 마지막 이슈의 next_cursor (created_at 이 NULL 이면 '-infinity')"""
+    return f"{issue['created_at'] or NULL_CREATED_AT}:{issue['id']}"
+
+
+def _parse_cursor(value):
+    """next_cursor ("<created_at ISO>:<id>") 를 (created_at, id) 로 변환 (형식 오류 시 ValueError)"""
+    created_at, _, issue_id = value.rpartition(':')
+    if created_at == NULL_CREATED_AT:
+        return NULL_CREATED_AT, int(issue_id)
+    return datetime.fromisoformat(created_at), int(issue_id)
+
+ISSUE_EXPORT_COLUMNS = ["ID", "이슈 내용", "날짜", "훈련 과정", "생성일", "해결됨"]
+
+
+def _export_query(args):
+    """이슈사항 다운로드용 조회 쿼리 (날짜 형식 오류 시 ValueError)"""
+    conditions, params = parse_filters(args, 'date')
+    return (
+        "SELECT id, content, date, training_course, created_at, resolved "
+        f"FROM issues {where_clause(conditions)} ORDER BY date, id"
+    ), params
+
+
+export_jobs.register(
+    'issues', ('from', 'to', 'training_course'), _export_query,
+    ISSUE_EXPORT_COLUMNS, "이슈사항.xlsx", "이슈사항", version_name='issues',
+)
+
 @issues_bp.route('/issues', methods=['POST'])
 def add_issue():
     """
@@ -44,25 +151,27 @@ def add_issue():
         if not all([issue, training_course, created_by]):
             return jsonify({"success": False, "message": "필수 데이터가 누락되었습니다."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 'issue' 대신 'content' 컬럼 사용
-        cursor.execute('''
-            INSERT INTO issues (content, training_course, date, created_by)
-            VALUES (%s, %s, %s, %s)
-            RETURNING id
-        ''', (issue, training_course, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), created_by))
+            # 'issue' 대신 'content' 컬럼 사용
+            cursor.execute('''
+                INSERT INTO issues (content, training_course, date, created_by)
+                VALUES (%s, %s, %s, %s)
+                RETURNING id
+            ''', (issue, training_course, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), created_by))
         
-        issue_id = cursor.fetchone()[0]
-        conn.commit()
-        cursor.close()
-        conn.close()
+            issue_id = cursor.fetchone()[0]
+            events.publish(cursor, 'issue', 'created', issue_id, training_course)
 
-        # 이슈 등록 알림
-        notifier = SlackNotifier()
-        notification_message = f"새로운 이슈가 등록되었습니다!\n과정명: {training_course}\n이슈: {issue}"
-        notifier.send_notification(notification_message, channel_type='issue')
+            # 이슈 등록 알림 (같은 트랜잭션으로 outbox 에 기록, 전송은 백그라운드에서)
+            notification_message = f"새로운 이슈가 등록되었습니다!\n과정명: {training_course}\n이슈: {issue}"
+            outbox.enqueue(cursor, 'issue', notification_message,
+                           event_type='issue', group_key=f"issue:{training_course}",
+                           training_course=training_course)
+
+            conn.commit()
+            cursor.close()
 
         return jsonify({"success": True, "message": "이슈가 등록되었습니다.", "id": issue_id}), 201
     except Exception as e:
@@ -71,56 +180,81 @@ def add_issue():
 
 
 @issues_bp.route('/issues', methods=['GET'])
+@use_replica
 def get_issues():
     """
     해결되지 않은 이슈 목록 조회 API
     ---
     tags:
       - Issues
-    summary: "해결되지 않은 이슈 목록을 조회합니다."
+    summary: "해결되지 않은 이슈 목록을 과정별로 최신순 한 페이지씩 조회합니다."
+    parameters:
+      - name: training_course
+        in: query
+        type: string
+        required: false
+        description: "특정 훈련 과정만 조회"
+      - name: per_course
+        in: query
+        type: integer
+        required: false
+        description: "과정별 이슈 개수 (기본값 50, 최대 200)"
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: "과정의 next_cursor 값 (training_course 와 함께 지정해 다음 페이지 조회)"
+      - name: comments_limit
+        in: query
+        type: integer
+        required: false
+        description: "이슈별로 포함할 최신 댓글 수 (기본값 전체, comment_count 에 전체 개수 포함)"
     responses:
       200:
         description: 해결되지 않은 이슈 목록 반환
+      400:
+        description: cursor 형식 오류
       500:
         description: 이슈 목록 조회 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT training_course, json_agg(json_build_object(
-                'id', i.id, 
-                'content', i.content, 
-                'date', i.date, 
-                'created_at', i.created_at,
-                'created_by', COALESCE(i.created_by, '작성자 없음'),
-                'resolved', i.resolved,
-                'comments', (
-                    SELECT json_agg(json_build_object(
-                        'id', ic.id, 
-                        'comment', ic.comment,
-                        'created_at', ic.created_at,
-                        'created_by', COALESCE(ic.created_by, '작성자 없음')
-                    )) FROM issue_comments ic WHERE ic.issue_id = i.id
-                )
-            )) AS issues
-            FROM issues i
-            WHERE i.resolved = FALSE  
-            GROUP BY training_course
-            ORDER BY MIN(i.created_at) DESC;
-        ''')
-        issues_grouped = cursor.fetchall()
+        training_course = request.args.get('training_course')
+        per_course = min(max(request.args.get('per_course', DEFAULT_ISSUES_PER_COURSE, type=int), 1),
+                         MAX_ISSUES_PER_COURSE)
+        comments_limit = request.args.get('comments_limit', type=int)
+        comments_limit = NO_LIMIT if comments_limit is None else max(comments_limit, 0)
+
+        cursor_created_at, cursor_id = END_OF_PAGE
+        cursor_value = request.args.get('cursor')
+        if cursor_value:
+            if not training_course:
+                return jsonify({"success": False, "message": "cursor 는 training_course 와 함께 지정해야 합니다"}), 400
+            try:
+                cursor_created_at, cursor_id = _parse_cursor(cursor_value)
+            except ValueError:
+                return jsonify({"success": False, "message": "cursor 형식이 올바르지 않습니다"}), 400
+
+        # 다음 페이지 존재 여부 확인을 위해 과정별로 한 건 더 조회
+        page_params = (cursor_created_at, cursor_id, per_course + 1, comments_limit)
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            if training_course:
+                UNRESOLVED_ISSUES_BY_COURSE.execute(cursor, (training_course,) + page_params)
+            else:
+                UNRESOLVED_ISSUES.execute(cursor, page_params)
+            issues_grouped = cursor.fetchall()
+            cursor.close()
 
-        cursor.close()
-        conn.close()
+        data = []
+        for course, total, issues in issues_grouped:
+            issues = issues or []
+            next_cursor = None
+            if len(issues) > per_course:
+                issues = issues[:per_course]
+                next_cursor = _page_cursor(issues[-1])
+            data.append({"training_course": course, "total": total, "issues": issues, "next_cursor": next_cursor})
 
-        return jsonify({
-            "success": True,
-            "data": [
-                {"training_course": row[0], "issues": row[1]} for row in issues_grouped
-            ]
-        }), 200
+        return jsonify({"success": True, "data": data}), 200
     except Exception as e:
         logging.error("Error retrieving issues", exc_info=True)
         return jsonify({"success": False, "message": "이슈 목록을 불러오는 중 오류 발생"}), 500
@@ -138,34 +272,40 @@ def add_comment():
         if not all([issue_id, comment, created_by]):
             return jsonify({"success": False, "message": "필수 데이터가 누락되었습니다."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
 
-        # 이슈 정보 조회 시 'issue' 대신 'content' 사용
-        cursor.execute('''
-            SELECT content, training_course FROM issues WHERE id = %s
-        ''', (issue_id,))
-        issue_info = cursor.fetchone()
+            # 이슈 정보 조회 시 'issue' 대신 'content' 사용
+            cursor.execute('''
+                SELECT content, training_course FROM issues WHERE id = %s
+            ''', (issue_id,))
+            issue_info = cursor.fetchone()
         
-        if not issue_info:
+            if not issue_info:
+                cursor.close()
+                return jsonify({"success": False, "message": "해당 이슈를 찾을 수 없습니다."}), 404
+
+            # 댓글 저장
+            cursor.execute('''
+                INSERT INTO issue_comments (issue_id, comment, created_by, created_at)
+                VALUES (%s, %s, %s, %s)
+                RETURNING id
+            ''', (issue_id, comment, created_by, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            comment_id = cursor.fetchone()[0]
+            events.publish(cursor, 'comment', 'created', comment_id, issue_info[1], issue_id=issue_id)
+
+            # 댓글 등록 알림 (같은 트랜잭션으로 outbox 에 기록, 전송은 백그라운드에서)
+            # 과정별로 digest 를 묶으므로 어느 이슈의 댓글인지 메시지에 함께 표시
+            notification_message = (
+                f"이슈에 새로운 댓글이 등록되었습니다!\n과정명: {issue_info[1]}\n"
+                f"이슈 #{issue_id}: {(issue_info[0] or '')[:100]}\n댓글: {comment}"
+            )
+            outbox.enqueue(cursor, 'comment', notification_message,
+                           event_type='comment', group_key=f"comment:{issue_info[1]}",
+                           training_course=issue_info[1])
+
+            conn.commit()
             cursor.close()
-            conn.close()
-            return jsonify({"success": False, "message": "해당 이슈를 찾을 수 없습니다."}), 404
-
-        # 댓글 저장
-        cursor.execute('''
-            INSERT INTO issue_comments (issue_id, comment, created_by, created_at)
-            VALUES (%s, %s, %s, %s)
-        ''', (issue_id, comment, created_by, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
-
-        # 댓글 등록 알림
-        notifier = SlackNotifier()
-        notification_message = f"이슈에 새로운 댓글이 등록되었습니다!\n과정명: {issue_info[1]}\n댓글: {comment}"
-        notifier.send_notification(notification_message, channel_type='comment')
 
         return jsonify({"success": True, "message": "댓글이 등록되었습니다."}), 201
     except Exception as e:
@@ -174,6 +314,7 @@ def add_comment():
 
 # 이슈에 대한 댓글 조회
 @issues_bp.route('/issues/comments', methods=['GET'])
+@use_replica
 def get_issue_comments():
     """
     이슈사항의 댓글 조회 API
@@ -199,15 +340,11 @@ def get_issue_comments():
         if not issue_id:
             return jsonify({"success": False, "message": "이슈 ID를 입력하세요."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, comment, created_at, created_by FROM issue_comments WHERE issue_id = %s ORDER BY created_at ASC",
-            (issue_id,)
-        )
-        comments = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            ISSUE_COMMENTS.execute(cursor, (issue_id,))
+            comments = cursor.fetchall()
+            cursor.close()
 
         return jsonify({
             "success": True,
@@ -258,15 +395,16 @@ def resolve_issue():
         if not issue_id:
             return jsonify({"success": False, "message": "이슈 ID가 필요합니다."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE issues SET resolved = TRUE WHERE id = %s",
-            (issue_id,)
-        )
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE issues SET resolved = TRUE WHERE id = %s RETURNING training_course",
+                (issue_id,)
+            )
+            for (training_course,) in cursor.fetchall():
+                events.publish(cursor, 'issue', 'resolved', issue_id, training_course)
+            conn.commit()
+            cursor.close()
 
         return jsonify({"success": True, "message": "이슈가 해결되었습니다."}), 200
     except Exception as e:
@@ -281,37 +419,39 @@ def download_issues():
     ---
     tags:
       - Issues
+    parameters:
+      - name: from
+        in: query
+        type: string
+        format: date
+        required: false
+        description: "시작 날짜 (YYYY-MM-DD)"
+      - name: to
+        in: query
+        type: string
+        format: date
+        required: false
+        description: "종료 날짜 (YYYY-MM-DD, 해당 날짜 포함)"
+      - name: training_course
+        in: query
+        type: string
+        required: false
+        description: "훈련 과정"
     responses:
       200:
         description: 이슈사항을 Excel 파일로 다운로드
+      400:
+        description: 날짜 형식 오류
       500:
         description: 이슈사항 다운로드 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT id, content, date, training_course, created_at, resolved FROM issues")
-        issues = cursor.fetchall()
-        cursor.close()
-        conn.close()
-
-        # DataFrame 생성
-        columns = ["ID", "이슈 내용", "날짜", "훈련 과정", "생성일", "해결됨"]
-        df = pd.DataFrame(issues, columns=columns)
-
-        # Excel 파일 생성
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name="이슈사항")
-        output.seek(0)
-
-        return send_file(
-            output,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            as_attachment=True,
-            download_name="이슈사항.xlsx"
-        )
+        try:
+            query, params = _export_query(request.args)
+        except ValueError:
+            return jsonify({"success": False, "message": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"}), 400
+
+        return xlsx_response(StreamedQuery(query, params), ISSUE_EXPORT_COLUMNS, "이슈사항.xlsx", "이슈사항")
     except Exception as e:
         logging.error("이슈사항 다운로드 실패", exc_info=True)
         return jsonify({"success": False, "message": "이슈 다운로드 실패"}), 500
@@ -1,14 +1,48 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, json
 from datetime import datetime
 import logging
-from app.models.db import get_db_connection
-from app.utils.notifications import SlackNotifier
+from app import config
+from app.models.db import get_db_connection, get_dedicated_connection, use_replica
+from app.models import events, outbox, queries
+from app.models.versioned_cache import VersionedCache
 import os
 
 notices_bp = Blueprint('notices', __name__)
 logger = logging.getLogger(__name__)
 
-# SlackNotifier 인스턴스를 전역 변수로 생성하지 않음
+NOTICE_COLUMNS = ('id', 'type', 'title', 'content', 'date', 'created_by')
+
+# 삭제되지 않은 공지사항을 (date, id) 최신순으로 한 페이지 (idx_notices_active_page 사용)
+# date 가 NULL 인 공지사항은 '-infinity' 로 취급해 마지막에 정렬 ((date, id) < (...) 는 NULL 이면 항상 거짓)
+ACTIVE_NOTICES_PAGE = queries.register('notices_active_page', f'''
+    SELECT {', '.join(NOTICE_COLUMNS)}
+    FROM notices
+    WHERE is_deleted = FALSE
+      AND (COALESCE(date, '-infinity'::timestamp), id) < (%s::timestamp, %s)
+    ORDER BY COALESCE(date, '-infinity'::timestamp) DESC, id DESC
+    LIMIT %s
+''')
+
+# cursor 가 없을 때의 (date, id) 기준값 - 모든 공지사항보다 뒤
+END_OF_PAGE = (datetime.max, 2147483647)
+NULL_DATE = '-infinity'
+
+# 공지사항 목록 응답 캐시 (공지사항 INSERT/UPDATE/DELETE 시 트리거가 notices 버전을 올림)
+notices_cache = VersionedCache('notices', config.NOTICES_CACHE_CHECK_INTERVAL)
+
+
+def _page_cursor(notice):
+    """페이지 마지막 공지사항의 next_cursor (date 가 NULL 이면 '-infinity')"""
+    return f"{notice['date'] or NULL_DATE}:{notice['id']}"
+
+
+def _parse_cursor(value):
+    """next_cursor ("<date ISO>:<id>") 를 (date, id) 로 변환 (형식 오류 시 ValueError)"""
+    date, _, notice_id = value.rpartition(':')
+    if date == NULL_DATE:
+        return NULL_DATE, int(notice_id)
+    return datetime.fromisoformat(date), int(notice_id)
+
 @notices_bp.route('/notices', methods=['POST'])
 def add_notice():
     try:
@@ -30,21 +64,23 @@ def add_notice():
             }), 403
 
         # DB 작업
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO notices (title, content, date, created_by, type)
-            VALUES (%s, %s, %s, %s, %s)
-        ''', (title, content, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), created_by, notice_type))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO notices (title, content, date, created_by, type)
+                VALUES (%s, %s, %s, %s, %s)
+                RETURNING id
+            ''', (title, content, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), created_by, notice_type))
+            notice_id = cursor.fetchone()[0]
+            events.publish(cursor, 'notice', 'created', notice_id)
 
-        # Slack 알림 전송 (channel -> channel_type으로 수정)
-        notifier = SlackNotifier()
-        notification_message = f"새로운 공지사항이 등록되었습니다!\n제목: {title}\n작성자: {created_by}"
-        notifier.send_notification(notification_message, channel_type='notice')
+            # Slack 알림은 같은 트랜잭션으로 outbox 에 기록 (전송은 백그라운드에서)
+            notification_message = f"새로운 공지사항이 등록되었습니다!\n제목: {title}\n작성자: {created_by}"
+            outbox.enqueue(cursor, 'notice', notification_message, event_type='notice', group_key='notice')
+
+            conn.commit()
+            cursor.close()
+        notices_cache.invalidate()
 
         return jsonify({"success": True, "message": "공지사항이 저장되었습니다!"}), 201
     except Exception as e:
@@ -52,43 +88,61 @@ def add_notice():
         return jsonify({"success": False, "message": "공지사항 추가 실패"}), 500
 
 @notices_bp.route('/notices', methods=['GET'])
+@use_replica
 def get_notices():
     """
     공지사항 조회 API
     ---
     tags:
       - Notices
+    summary: "삭제되지 않은 공지사항을 최신순으로 한 페이지씩 조회합니다."
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: "페이지 크기 (기본값 50, 최대 200)"
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: "이전 응답의 next_cursor (다음 페이지 조회)"
     responses:
       200:
-        description: 모든 공지사항 데이터를 포함한 응답
+        description: 공지사항 목록과 next_cursor (마지막 페이지면 null)
+      400:
+        description: cursor 형식 오류
       500:
         description: 공지사항을 불러오는 데 실패함
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # 'created_at' 대신 'date' 컬럼 사용
-        cursor.execute("SELECT * FROM notices WHERE is_deleted = FALSE ORDER BY date DESC")
-        
-        # 결과를 딕셔너리 형태로 변환
-        columns = ['id', 'type', 'title', 'content', 'date', 'created_by']
-        notice_rows = cursor.fetchall()
-        notices = []
-        
-        for row in notice_rows:
-            notice_dict = {}
-            for i, column in enumerate(columns):
-                notice_dict[column] = row[i]
-            notices.append(notice_dict)
-        
-        cursor.close()
-        conn.close()
-        
-        return jsonify({
-            "success": True,
-            "data": notices
-        }), 200
+        limit = min(max(request.args.get('limit', config.NOTICES_PAGE_SIZE, type=int), 1),
+                    config.NOTICES_MAX_PAGE_SIZE)
+        cursor_value = request.args.get('cursor') or None
+        page_start = END_OF_PAGE
+        if cursor_value:
+            try:
+                page_start = _parse_cursor(cursor_value)
+            except ValueError:
+                return jsonify({"success": False, "message": "cursor 형식이 올바르지 않습니다"}), 400
+
+        def load_page():
+            # 캐시에 저장되는 페이지가 캐시 버전(primary 에서 확인)보다 오래되지 않도록 primary 에서 조회
+            # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+            with get_dedicated_connection() as conn:
+                cursor = conn.cursor()
+                ACTIVE_NOTICES_PAGE.execute(cursor, page_start + (limit + 1,))
+                rows = cursor.fetchall()
+                cursor.close()
+
+            notices = [dict(zip(NOTICE_COLUMNS, row)) for row in rows[:limit]]
+            next_cursor = None
+            if len(rows) > limit:
+                next_cursor = _page_cursor(notices[-1])
+            return json.dumps({"success": True, "data": notices, "next_cursor": next_cursor})
+
+        body = notices_cache.get((cursor_value, limit), load_page)
+        return Response(body, status=200, mimetype='application/json')
     except Exception as e:
         logging.error("Error retrieving notices", exc_info=True)
         return jsonify({"success": False, "message": "공지사항을 불러오는데 실패했습니다."}), 500
@@ -144,42 +198,41 @@ def update_notice(notice_id):
         if not title or not content or not username:
             return jsonify({"success": False, "message": "제목, 내용, 사용자명을 모두 입력하세요."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # 먼저 해당 공지사항이 존재하는지 확인
-        cursor.execute("SELECT id FROM notices WHERE id = %s", (notice_id,))
-        notice = cursor.fetchone()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        if not notice:
-            cursor.close()
-            conn.close()
-            return jsonify({"success": False, "message": "해당 공지사항을 찾을 수 없습니다."}), 404
+            # 먼저 해당 공지사항이 존재하는지 확인
+            cursor.execute("SELECT id FROM notices WHERE id = %s", (notice_id,))
+            notice = cursor.fetchone()
         
-        # 공지사항 업데이트
-        update_fields = ["title = %s", "content = %s", "date = NOW()"]
-        params = [title, content]
+            if not notice:
+                cursor.close()
+                return jsonify({"success": False, "message": "해당 공지사항을 찾을 수 없습니다."}), 404
         
-        if notice_type:
-            update_fields.append("type = %s")
-            params.append(notice_type)
+            # 공지사항 업데이트
+            update_fields = ["title = %s", "content = %s", "date = NOW()"]
+            params = [title, content]
         
-        # 수정자 정보 추가
-        update_fields.append("modified_by = %s")
-        params.append(username)
+            if notice_type:
+                update_fields.append("type = %s")
+                params.append(notice_type)
         
-        params.append(notice_id)  # WHERE 조건용
+            # 수정자 정보 추가
+            update_fields.append("modified_by = %s")
+            params.append(username)
         
-        query = f"UPDATE notices SET {', '.join(update_fields)} WHERE id = %s"
-        cursor.execute(query, tuple(params))
+            params.append(notice_id)  # WHERE 조건용
         
-        if cursor.rowcount == 0:
-            conn.close()
-            return jsonify({"success": False, "message": "공지사항 수정에 실패했습니다."}), 500
+            query = f"UPDATE notices SET {', '.join(update_fields)} WHERE id = %s"
+            cursor.execute(query, tuple(params))
         
-        conn.commit()
-        cursor.close()
-        conn.close()
+            if cursor.rowcount == 0:
+                return jsonify({"success": False, "message": "공지사항 수정에 실패했습니다."}), 500
+
+            events.publish(cursor, 'notice', 'updated', notice_id)
+            conn.commit()
+            cursor.close()
+        notices_cache.invalidate()
         
         return jsonify({"success": True, "message": "공지사항이 성공적으로 수정되었습니다."}), 200
         
@@ -209,28 +262,27 @@ def delete_notice(notice_id):
         description: 서버 오류 발생
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 공지사항 존재 확인
-        cursor.execute("SELECT id FROM notices WHERE id = %s", (notice_id,))
-        notice = cursor.fetchone()
-        
-        if not notice:
-            cursor.close()
-            conn.close()
-            return jsonify({"success": False, "message": "해당 공지사항을 찾을 수 없습니다."}), 404
+            # 공지사항 존재 확인
+            cursor.execute("SELECT id FROM notices WHERE id = %s", (notice_id,))
+            notice = cursor.fetchone()
         
-        # 실제 삭제 대신 is_deleted 필드 업데이트
-        cursor.execute("UPDATE notices SET is_deleted = TRUE WHERE id = %s", (notice_id,))
+            if not notice:
+                cursor.close()
+                return jsonify({"success": False, "message": "해당 공지사항을 찾을 수 없습니다."}), 404
         
-        if cursor.rowcount == 0:
-            conn.close()
-            return jsonify({"success": False, "message": "공지사항 삭제에 실패했습니다."}), 500
+            # 실제 삭제 대신 is_deleted 필드 업데이트
+            cursor.execute("UPDATE notices SET is_deleted = TRUE WHERE id = %s", (notice_id,))
         
-        conn.commit()
-        cursor.close()
-        conn.close()
+            if cursor.rowcount == 0:
+                return jsonify({"success": False, "message": "공지사항 삭제에 실패했습니다."}), 500
+
+            events.publish(cursor, 'notice', 'deleted', notice_id)
+            conn.commit()
+            cursor.close()
+        notices_cache.invalidate()
         
         return jsonify({"success": True, "message": "공지사항이 성공적으로 삭제되었습니다."}), 200
         
@@ -277,19 +329,18 @@ def mark_notice_read():
         if not notice_id or not username:
             return jsonify({"success": False, "message": "공지사항 ID와 사용자 이름이 필요합니다."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        # ON CONFLICT DO NOTHING을 사용하여 동일한 사용자가 같은 공지를 여러 번 읽음 표시해도 에러가 나지 않도록 함
-        cursor.execute('''
-            INSERT INTO notice_reads (notice_id, username, read_at)
-            VALUES (%s, %s, NOW())
-            ON CONFLICT (notice_id, username) DO NOTHING
-        ''', (notice_id, username))
+            # ON CONFLICT DO NOTHING을 사용하여 동일한 사용자가 같은 공지를 여러 번 읽음 표시해도 에러가 나지 않도록 함
+            cursor.execute('''
+                INSERT INTO notice_reads (notice_id, username, read_at)
+                VALUES (%s, %s, NOW())
+                ON CONFLICT (notice_id, username) DO NOTHING
+            ''', (notice_id, username))
         
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
+            cursor.close()
 
         return jsonify({"success": True, "message": "공지사항 읽음 표시 완료"}), 201
     except Exception as e:
@@ -297,6 +348,7 @@ def mark_notice_read():
         return jsonify({"success": False, "message": "공지사항 읽음 표시 실패"}), 500
 
 @notices_bp.route('/notices/reads', methods=['GET'])
+@use_replica
 def get_notice_reads():
     """
     공지사항별 읽은 사용자 목록 조회 API
@@ -323,18 +375,17 @@ def get_notice_reads():
         if not notice_id:
             return jsonify({"success": False, "message": "공지사항 ID가 필요합니다."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT username, read_at 
-            FROM notice_reads 
-            WHERE notice_id = %s 
-            ORDER BY read_at DESC
-        ''', (notice_id,))
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT username, read_at 
+                FROM notice_reads 
+                WHERE notice_id = %s 
+                ORDER BY read_at DESC
+            ''', (notice_id,))
         
-        reads = cursor.fetchall()
-        cursor.close()
-        conn.close()
+            reads = cursor.fetchall()
+            cursor.close()
 
         return jsonify({
             "success": True,
@@ -1,81 +1,82 @@
 # app/routes/notifications.py
 from flask import Blueprint, request, jsonify
-from datetime import datetime
+from app.models import queries
 from app.models.db import get_db_connection
-from app.utils.notifications import SlackNotifier
+from app.models.notification_counters import ENTITIES, notification_counters
 import logging
-import requests
 
 notifications_bp = Blueprint('notifications', __name__)
-slack_notifier = SlackNotifier()
+
+USER_SEEN_SEQUENCES = queries.register('user_seen_sequences', '''
+    SELECT notice_seq, issue_seq, comment_seq FROM user_seen_sequences WHERE username = %s
+''')
+
+# 처음 조회하는 사용자는 현재 순번부터 시작 (기존 항목은 모두 확인한 것으로 처리)
+INIT_USER_SEEN_SEQUENCES = queries.register('user_seen_sequences_init', '''
+    INSERT INTO user_seen_sequences (username, notice_seq, issue_seq, comment_seq)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (username) DO NOTHING
+''')
+
+# 순번은 줄어들지 않도록 GREATEST 로 갱신 (NULL 이면 기존 값 유지)
+MARK_SEEN = queries.register('user_seen_sequences_mark', '''
+    INSERT INTO user_seen_sequences (username, notice_seq, issue_seq, comment_seq)
+    VALUES (%s, COALESCE(%s, 0), COALESCE(%s, 0), COALESCE(%s, 0))
+    ON CONFLICT (username) DO UPDATE SET
+        notice_seq = GREATEST(user_seen_sequences.notice_seq, COALESCE(EXCLUDED.notice_seq, 0)),
+        issue_seq = GREATEST(user_seen_sequences.issue_seq, COALESCE(EXCLUDED.issue_seq, 0)),
+        comment_seq = GREATEST(user_seen_sequences.comment_seq, COALESCE(EXCLUDED.comment_seq, 0)),
+        updated_at = NOW()
+''')
+
 
 @notifications_bp.route('/notifications/unread-count', methods=['GET'])
 def get_unread_count():
-    """사용자별 미확인 알림 개수 조회"""
+    """
+    사용자별 미확인 알림 개수 조회 API
+    ---
+    tags:
+      - Notifications
+    summary: "엔티티별 현재 순번과 사용자의 마지막 확인 순번의 차이로 계산합니다 (조회만 하고 확인 처리는 하지 않음)."
+    parameters:
+      - name: username
+        in: query
+        type: string
+        required: true
+    responses:
+      200:
+        description: "미확인 개수와 현재 순번 (sequences 를 /notifications/seen 에 그대로 보내 확인 처리)"
+      400:
+        description: 사용자명 누락
+      500:
+        description: 알림 개수 조회 실패
+    """
     try:
         username = request.args.get('username')
         if not username:
             return jsonify({"success": False, "message": "사용자명이 필요합니다."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # 사용자의 마지막 확인 시간 조회
-        cursor.execute("""
-            SELECT last_notice_check, last_issue_check, last_comment_check 
-            FROM user_last_checks 
-            WHERE username = %s
-        """, (username,))
-        
-        last_check = cursor.fetchone()
-        if not last_check:
-            # 첫 로그인인 경우 현재 시간으로 초기화
-            cursor.execute("""
-                INSERT INTO user_last_checks 
-                (username, last_notice_check, last_issue_check, last_comment_check)
-                VALUES (%s, NOW(), NOW(), NOW())
-            """, (username,))
-            conn.commit()
-            return jsonify({
-                "success": True,
-                "data": {
-                    "new_notices": 0,
-                    "new_issues": 0,
-                    "new_comments": 0
-                }
-            }), 200
-
-        # 새로운 항목 개수 조회
-        last_notice_check, last_issue_check, last_comment_check = last_check
-
-        cursor.execute("""
-            SELECT 
-                (SELECT COUNT(*) FROM notices WHERE date > %s) as new_notices,
-                (SELECT COUNT(*) FROM issues WHERE created_at > %s) as new_issues,
-                (SELECT COUNT(*) FROM issue_comments WHERE created_at > %s) as new_comments
-        """, (last_notice_check, last_issue_check, last_comment_check))
-        
-        counts = cursor.fetchone()
-        
-        # 현재 시간으로 마지막 확인 시간 업데이트
-        cursor.execute("""
-            UPDATE user_last_checks 
-            SET last_notice_check = NOW(),
-                last_issue_check = NOW(),
-                last_comment_check = NOW()
-            WHERE username = %s
-        """, (username,))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        current = notification_counters.current()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            USER_SEEN_SEQUENCES.execute(cursor, (username,))
+            row = cursor.fetchone()
+            if row is None:
+                seen = [current[entity] for entity in ENTITIES]
+                INIT_USER_SEEN_SEQUENCES.execute(cursor, (username, *seen))
+                conn.commit()
+            else:
+                seen = list(row)
+            cursor.close()
 
+        unread = {entity: max(current[entity] - seen[i], 0) for i, entity in enumerate(ENTITIES)}
         return jsonify({
             "success": True,
             "data": {
-                "new_notices": counts[0],
-                "new_issues": counts[1],
-                "new_comments": counts[2]
+                "new_notices": unread['notice'],
+                "new_issues": unread['issue'],
+                "new_comments": unread['comment'],
+                "sequences": current,
             }
         }), 200
 
@@ -83,30 +84,71 @@ def get_unread_count():
         logging.error("알림 개수 조회 오류", exc_info=True)
         return jsonify({"success": False, "message": "알림 개수 조회 실패"}), 500
 
-def send_notification(self, message):
-    if not self.webhook_url:
-        logging.error("SLACK_WEBHOOK_URL이 설정되지 않았습니다.")
-        logging.error(f"현재 환경변수: WEBHOOK_URL={self.webhook_url}, CHANNEL={self.channel}")
-        return False
-        
+
+@notifications_bp.route('/notifications/seen', methods=['POST'])
+def mark_notifications_seen():
+    """
+    알림 확인 처리 API
+    ---
+    tags:
+      - Notifications
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - username
+          properties:
+            username:
+              type: string
+              example: "홍길동"
+            types:
+              type: array
+              items:
+                type: string
+                enum: [notice, issue, comment]
+              description: "확인 처리할 종류 (생략하면 전체)"
+            sequences:
+              type: object
+              description: "unread-count 응답의 sequences (생략하면 현재 순번까지 확인 처리)"
+              example: {"notice": 12, "issue": 40, "comment": 95}
+    responses:
+      200:
+        description: 확인 처리 성공
+      400:
+        description: 사용자명 누락 또는 잘못된 종류
+      500:
+        description: 확인 처리 실패
+    """
     try:
-        payload = {
-            "channel": self.channel,
-            "text": message,
-            "username": "Lion Helper Bot",
-            "icon_emoji": ":lion_face:"
-        }
-        
-        logging.info(f"Slack webhook 호출 시도 - Channel: {self.channel}")
-        response = requests.post(self.webhook_url, json=payload)
-        logging.info(f"Slack 응답 코드: {response.status_code}")
-        logging.info(f"Slack 응답 내용: {response.text}")
-        
-        if response.status_code == 200:
-            return True
-        else:
-            logging.error(f"Slack 알림 전송 실패: {response.status_code}, {response.text}")
-            return False
+        data = request.get_json(silent=True) or {}
+        username = data.get('username')
+        if not username:
+            return jsonify({"success": False, "message": "사용자명이 필요합니다."}), 400
+
+        types = data.get('types') or list(ENTITIES)
+        if not isinstance(types, list) or any(entity not in ENTITIES for entity in types):
+            return jsonify({"success": False, "message": f"types 는 {', '.join(ENTITIES)} 중에서 선택하세요."}), 400
+
+        # 현재 순번보다 큰 값은 받지 않음 (이후 알림이 미확인으로 잡히지 않는 것을 방지)
+        current = notification_counters.current()
+        sequences = data.get('sequences') or current
+        try:
+            seen = [min(int(sequences[entity]), current[entity]) if entity in types and entity in sequences else None
+                    for entity in ENTITIES]
+        except (TypeError, ValueError):
+            return jsonify({"success": False, "message": "sequences 값은 정수여야 합니다."}), 400
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            MARK_SEEN.execute(cursor, (username, *seen))
+            conn.commit()
+            cursor.close()
+
+        return jsonify({"success": True, "message": "알림을 확인했습니다."}), 200
+
     except Exception as e:
-        logging.error(f"Slack 알림 전송 중 오류 발생: {str(e)}", exc_info=True)
-        return False
\ No newline at end of file
+        logging.error("알림 확인 처리 오류", exc_info=True)
+        return jsonify({"success": False, "message": "알림 확인 처리 실패"}), 500
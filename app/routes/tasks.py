@@ -1,11 +1,83 @@
 from flask import Blueprint, request, jsonify
 from datetime import datetime
 import logging
-from app.models.db import get_db_connection
+from app.models import queries
+from app.models.db import get_db_connection, use_replica
+from app.models.task_catalog import task_catalog
 
 tasks_bp = Blueprint('tasks', __name__)
 
+# 체크리스트 일괄 저장: 당일 데이터를 한 문장으로 upsert (task_name -> id 변환은 task_catalog 캐시에서 처리)
+# 같은 task_id 가 여러 번 전달되면 마지막 값 사용
+UPSERT_CHECKLIST = queries.register('task_checklist_upsert_batch', '''
+    WITH submitted AS (
+        SELECT DISTINCT ON (u.task_id) u.task_id, u.is_checked
+        FROM unnest(%s::int[], %s::boolean[]) WITH ORDINALITY AS u(task_id, is_checked, ord)
+        ORDER BY u.task_id, u.ord DESC
+    )
+    INSERT INTO task_checklist (task_id, training_course, is_checked, checked_date, username, check_day)
+    SELECT task_id, %s::text, is_checked, NOW(), %s::text, %s::date
+    FROM submitted
+    ON CONFLICT (task_id, training_course, check_day)
+    DO UPDATE SET is_checked = EXCLUDED.is_checked,
+                  checked_date = EXCLUDED.checked_date,
+                  username = EXCLUDED.username
+    RETURNING task_id, id, (xmax = 0) AS inserted
+''')
+
+# 당일 체크리스트 일괄 업데이트: 전달된 값과 조인해 한 번에 UPDATE 하고 갱신된 (task_id, id) 반환
+UPDATE_CHECKLIST = queries.register('task_checklist_update_batch', '''
+    WITH submitted AS (
+        SELECT DISTINCT ON (u.task_id) u.task_id, u.is_checked
+        FROM unnest(%s::int[], %s::boolean[]) WITH ORDINALITY AS u(task_id, is_checked, ord)
+        ORDER BY u.task_id, u.ord DESC
+    )
+    UPDATE task_checklist tc
+    SET is_checked = s.is_checked, checked_date = NOW()
+    FROM submitted s
+    WHERE tc.task_id = s.task_id
+      AND tc.training_course = %s::text
+      AND tc.check_day = %s::date
+    RETURNING tc.task_id, tc.id
+''')
+
+# 비정기 업무 최신 상태는 irregular_task_state 에서만 조회 (이력 테이블은 스캔하지 않음)
+IRREGULAR_TASKS_LATEST = queries.register('irregular_task_state_latest', '''
+    SELECT DISTINCT ON (task_name) history_id, task_name, is_checked, checked_date
+    FROM irregular_task_state
+    ORDER BY task_name, checked_date DESC
+''')
+
+# 과정별 최신 상태 (irregular_task_state 기본키 (training_course, task_name) 사용)
+IRREGULAR_TASKS_LATEST_BY_COURSE = queries.register('irregular_task_state_by_course', '''
+    SELECT history_id, task_name, is_checked, checked_date
+    FROM irregular_task_state
+    WHERE training_course = %s
+    ORDER BY task_name
+''')
+
+# 이력 추가와 최신 상태 갱신을 한 문장(같은 트랜잭션)으로 처리
+SAVE_IRREGULAR_TASKS = queries.register('irregular_tasks_save_batch', '''
+    WITH inserted AS (
+        INSERT INTO irregular_tasks (task_name, is_checked, checked_date, training_course)
+        SELECT u.task_name, u.is_checked, NOW(), %s::text
+        FROM unnest(%s::text[], %s::boolean[]) WITH ORDINALITY AS u(task_name, is_checked, ord)
+        ORDER BY u.ord
+        RETURNING id, task_name, is_checked, checked_date, training_course
+    )
+    INSERT INTO irregular_task_state (training_course, task_name, history_id, is_checked, checked_date)
+    SELECT DISTINCT ON (task_name) training_course, task_name, id, is_checked, checked_date
+    FROM inserted
+    WHERE task_name IS NOT NULL
+    ORDER BY task_name, id DESC
+    ON CONFLICT (training_course, task_name)
+    DO UPDATE SET history_id = EXCLUDED.history_id,
+                  is_checked = EXCLUDED.is_checked,
+                  checked_date = EXCLUDED.checked_date
+''')
+
 @tasks_bp.route('/tasks', methods=['GET'])
+@use_replica
 def get_tasks():
     """
     업무 체크리스트 조회 API
@@ -28,35 +100,20 @@ def get_tasks():
     try:
         task_category = request.args.get('task_category')  # 선택적 필터링
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # guide 컬럼 추가
-        query = "SELECT id, task_name, task_period, task_category, guide FROM task_items"
-        params = []
-
-        if task_category:
-            query += " WHERE task_category = %s"
-            params.append(task_category)
-
-        query += " ORDER BY id ASC"
-
-        cursor.execute(query, tuple(params))
+        # task_items 는 거의 바뀌지 않으므로 워커별 캐시에서 조회
+        items = task_catalog.by_category(task_category) if task_category else task_catalog.all()
 
         tasks = [
             {
-                "id": row[0],
-                "task_name": row[1],
-                "task_period": row[2],
-                "task_category": row[3],
-                "guide": row[4] if row[4] else "업무 가이드 없음"  # NULL 값 기본 처리
+                "id": item["id"],
+                "task_name": item["task_name"],
+                "task_period": item["task_period"],
+                "task_category": item["task_category"],
+                "guide": item["guide"] if item["guide"] else "업무 가이드 없음"  # NULL 값 기본 처리
             }
-            for row in cursor.fetchall()
+            for item in items
         ]
 
-        cursor.close()
-        conn.close()
-
         return jsonify({"success": True, "data": tasks}), 200
     except Exception as e:
         logging.error("Error retrieving tasks", exc_info=True)
@@ -96,7 +153,7 @@ def save_tasks():
               type: string
     responses:
       201:
-        description: 업무 체크리스트 저장/업데이트 성공
+        description: "업무 체크리스트 저장/업데이트 성공 (results 에 항목별 처리 결과: inserted, updated, not_found)"
       400:
         description: 요청 데이터 없음
       500:
@@ -111,55 +168,46 @@ def save_tasks():
         if not updates or not training_course or not username:
             return jsonify({"success": False, "message": "업데이트 데이터, 훈련 과정명, 사용자명이 모두 필요합니다."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        task_names = [update.get("task_name") for update in updates]
+        task_ids = task_catalog.resolve_ids(task_names)
+        submitted = [
+            (task_id, bool(update.get("is_checked", False)))
+            for task_id, update in zip(task_ids, updates) if task_id is not None
+        ]
 
         # 현재 날짜 가져오기 (시간 제외)
         current_date = datetime.now().date()
 
-        for update in updates:
-            task_name = update.get("task_name")
-            is_checked = update.get("is_checked", False)
-
-            # task_id 찾기
-            cursor.execute("SELECT id FROM task_items WHERE task_name = %s", (task_name,))
-            task_item = cursor.fetchone()
-            if not task_item:
+        saved = {}
+        if submitted:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                UPSERT_CHECKLIST.execute(cursor, (
+                    [task_id for task_id, _ in submitted],
+                    [is_checked for _, is_checked in submitted],
+                    training_course, username, current_date
+                ))
+                saved = {task_id: (checklist_id, inserted) for task_id, checklist_id, inserted in cursor.fetchall()}
+                conn.commit()
+                cursor.close()
+
+        results = []
+        for task_name, task_id in zip(task_names, task_ids):
+            if task_id is None or task_id not in saved:
+                results.append({"task_name": task_name, "task_id": task_id, "checklist_id": None, "status": "not_found"})
                 continue
-            task_id = task_item[0]
-
-            # 동일 날짜의 기존 데이터 확인 (DATE 함수 사용하여 시간 제외)
-            cursor.execute("""
-                SELECT id 
-                FROM task_checklist 
-                WHERE task_id = %s 
-                AND training_course = %s 
-                AND DATE(checked_date)::date = %s::date
-            """, (task_id, training_course, current_date))
-            
-            existing_record = cursor.fetchone()
-
-            if existing_record:
-                # 기존 데이터가 있으면 업데이트
-                cursor.execute("""
-                    UPDATE task_checklist 
-                    SET is_checked = %s, checked_date = NOW(), username = %s
-                    WHERE id = %s
-                """, (is_checked, username, existing_record[0]))
-            else:
-                # 기존 데이터가 없으면 새로 삽입
-                cursor.execute("""
-                    INSERT INTO task_checklist (task_id, training_course, is_checked, checked_date, username)
-                    VALUES (%s, %s, %s, NOW(), %s)
-                """, (task_id, training_course, is_checked, username))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+            checklist_id, inserted = saved[task_id]
+            results.append({
+                "task_name": task_name,
+                "task_id": task_id,
+                "checklist_id": checklist_id,
+                "status": "inserted" if inserted else "updated"
+            })
 
         return jsonify({
             "success": True, 
-            "message": "체크리스트가 성공적으로 저장/업데이트되었습니다!"
+            "message": "체크리스트가 성공적으로 저장/업데이트되었습니다!",
+            "results": results
         }), 201
 
     except Exception as e:
@@ -225,51 +273,31 @@ def update_tasks():
                 "message": "업데이트할 데이터와 훈련 과정명이 필요합니다."
             }), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        updated_count = 0
-        not_found_items = []
-
-        for update in updates:
-            task_name = update.get("task_name")
-            is_checked = update.get("is_checked", False)
-
-            # task_id 찾기
-            cursor.execute("SELECT id FROM task_items WHERE task_name = %s", (task_name,))
-            task_item = cursor.fetchone()
-            if not task_item:
-                not_found_items.append(task_name)
-                continue
-                
-            task_id = task_item[0]
-
-            # 당일 날짜의 기존 데이터 확인
-            cursor.execute("""
-                SELECT id 
-                FROM task_checklist 
-                WHERE task_id = %s 
-                AND training_course = %s 
-                AND DATE(checked_date)::date = %s::date
-            """, (task_id, training_course, today))
-            
-            existing_record = cursor.fetchone()
-
-            if existing_record:
-                # 기존 데이터가 있으면 업데이트
-                cursor.execute("""
-                    UPDATE task_checklist 
-                    SET is_checked = %s, checked_date = NOW()
-                    WHERE id = %s
-                """, (is_checked, existing_record[0]))
-                updated_count += 1
-            else:
-                # 업데이트할 데이터가 없음
-                not_found_items.append(task_name)
+        task_names = [update.get("task_name") for update in updates]
+        task_ids = task_catalog.resolve_ids(task_names)
+        submitted = [
+            (task_id, bool(update.get("is_checked", False)))
+            for task_id, update in zip(task_ids, updates) if task_id is not None
+        ]
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+        updated_task_ids = set()
+        if submitted:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                UPDATE_CHECKLIST.execute(cursor, (
+                    [task_id for task_id, _ in submitted],
+                    [is_checked for _, is_checked in submitted],
+                    training_course, today
+                ))
+                updated_task_ids = {row[0] for row in cursor.fetchall()}
+                conn.commit()
+                cursor.close()
+
+        # task_name 이 없거나 당일 저장된 데이터가 없는 항목은 not_found_items 로 반환
+        updated_count = sum(1 for task_id in task_ids if task_id in updated_task_ids)
+        not_found_items = [
+            task_name for task_name, task_id in zip(task_names, task_ids) if task_id not in updated_task_ids
+        ]
 
         if updated_count == 0:
             return jsonify({
@@ -299,6 +327,7 @@ def update_tasks():
 
 
 @tasks_bp.route('/irregular_tasks', methods=['GET'])
+@use_replica
 def get_irregular_tasks():
     """
     비정기 업무 체크리스트 조회 API (가장 최근 상태만 반환)
@@ -306,6 +335,12 @@ def get_irregular_tasks():
     tags:
       - Irregular Tasks
     summary: "비정기 업무 체크리스트의 가장 최근 상태를 조회합니다."
+    parameters:
+      - name: training_course
+        in: query
+        type: string
+        required: false
+        description: "지정하면 해당 훈련 과정의 상태만 반환 (미지정 시 전체 과정 중 가장 최근 상태)"
     responses:
       200:
         description: 비정기 업무 체크리스트 조회 성공
@@ -313,17 +348,17 @@ def get_irregular_tasks():
         description: 비정기 업무 조회 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT DISTINCT ON (task_name) id, task_name, is_checked, checked_date
-            FROM irregular_tasks
-            ORDER BY task_name, checked_date DESC
-        ''')
-        tasks = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        training_course = request.args.get('training_course')  # 선택적 필터링
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            if training_course:
+                IRREGULAR_TASKS_LATEST_BY_COURSE.execute(cursor, (training_course,))
+            else:
+                IRREGULAR_TASKS_LATEST.execute(cursor)
+            tasks = cursor.fetchall()
+            cursor.close()
 
         return jsonify({
             "success": True,
@@ -376,20 +411,15 @@ def save_irregular_tasks():
         if not updates or not training_course:
             return jsonify({"success": False, "message": "No data provided"}), 400
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        for update in updates:
-            task_name = update.get("task_name")
-            is_checked = update.get("is_checked")
-            cursor.execute('''
-                INSERT INTO irregular_tasks (task_name, is_checked, checked_date, training_course)
-                VALUES (%s, %s, NOW(), %s)
-            ''', (task_name, is_checked, training_course))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            SAVE_IRREGULAR_TASKS.execute(cursor, (
+                training_course,
+                [update.get("task_name") for update in updates],
+                [update.get("is_checked") for update in updates]
+            ))
+            conn.commit()
+            cursor.close()
         
         return jsonify({"success": True, "message": "비정기 업무 체크리스트가 저장되었습니다!"}), 201
     except Exception as e:
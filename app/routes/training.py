@@ -1,11 +1,51 @@
 from flask import Blueprint, request, jsonify
 import logging
-from app.models.db import get_db_connection
+from app.models import events, queries
+from app.models.db import get_db_connection, use_replica
 from datetime import datetime
 
 training_bp = Blueprint('training', __name__)
 
+ACTIVE_TRAINING_COURSES = queries.register('training_courses_active', '''
+    SELECT training_course 
+    FROM training_info 
+    WHERE end_date >= CURRENT_DATE - INTERVAL '7 days'
+    ORDER BY start_date DESC
+''')
+
+TRAINING_INFO_LIST = queries.register('training_info_list', '''
+    SELECT training_course, start_date, end_date, dept FROM training_info ORDER BY start_date DESC
+''')
+
+UNRESOLVED_UNCHECKED = queries.register('unchecked_descriptions_unresolved', '''
+    SELECT 
+        ud.id, 
+        ud.content, 
+        ud.action_plan, 
+        ud.training_course, 
+        ti.dept, 
+        ud.created_at, 
+        ud.resolved,
+        COALESCE(ti2.due, 3) as due,  -- due가 없으면 기본값 3일
+        (ud.created_at + (COALESCE(ti2.due, 3) || ' days')::interval)::date as deadline,
+        CASE 
+            WHEN CURRENT_DATE > (ud.created_at + (COALESCE(ti2.due, 3) || ' days')::interval)::date 
+            THEN TRUE 
+            ELSE FALSE 
+        END as is_overdue
+    FROM unchecked_descriptions ud
+    JOIN training_info ti ON ud.training_course = ti.training_course
+    LEFT JOIN task_items ti2 ON ud.content LIKE ti2.task_name || '%%에 대한 미체크 사유'  -- LIKE 연산자 사용
+    WHERE ud.resolved = FALSE  
+    ORDER BY ud.created_at DESC;
+''')
+
+UNCHECKED_COMMENTS = queries.register('unchecked_comments_by_item', '''
+    SELECT id, comment, created_at FROM unchecked_comments WHERE unchecked_id = %s ORDER BY created_at ASC
+''')
+
 @training_bp.route('/training_courses', methods=['GET'])
+@use_replica
 def get_training_courses():
     """
     training_info 테이블에서 training_course 목록을 가져오는 API
@@ -20,20 +60,14 @@ def get_training_courses():
         description: 훈련과정 목록 불러오기 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 현재 날짜 기준으로 종료된 지 1주일 이내이거나 아직 진행 중인 과정만 조회
-        cursor.execute('''
-            SELECT training_course 
-            FROM training_info 
-            WHERE end_date >= CURRENT_DATE - INTERVAL '7 days'
-            ORDER BY start_date DESC
-        ''')
+            # 현재 날짜 기준으로 종료된 지 1주일 이내이거나 아직 진행 중인 과정만 조회
+            ACTIVE_TRAINING_COURSES.execute(cursor)
         
-        courses = cursor.fetchall()
-        cursor.close()
-        conn.close()
+            courses = cursor.fetchall()
+            cursor.close()
 
         return jsonify({
             "success": True,
@@ -101,17 +135,16 @@ def save_training_info():
         if not training_course or not start_date or not end_date or not dept or not manager_name:
             return jsonify({"success": False, "message": "모든 필드를 입력하세요."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute('''
-            INSERT INTO training_info (training_course, start_date, end_date, dept, manager_name)
-            VALUES (%s, %s, %s, %s, %s)
-        ''', (training_course, start_date, end_date, dept, manager_name))
+            cursor.execute('''
+                INSERT INTO training_info (training_course, start_date, end_date, dept, manager_name)
+                VALUES (%s, %s, %s, %s, %s)
+            ''', (training_course, start_date, end_date, dept, manager_name))
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
+            cursor.close()
 
         return jsonify({"success": True, "message": "훈련 과정이 저장되었습니다!"}), 201
     except Exception as e:
@@ -120,6 +153,7 @@ def save_training_info():
 
 
 @training_bp.route('/training_info', methods=['GET'])
+@use_replica
 def get_training_info():
     """
     훈련 과정 목록 조회 API
@@ -133,14 +167,13 @@ def get_training_info():
         description: 훈련 과정 목록 조회 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute('SELECT training_course, start_date, end_date, dept FROM training_info ORDER BY start_date DESC')
-        courses = cursor.fetchall()
+            TRAINING_INFO_LIST.execute(cursor)
+            courses = cursor.fetchall()
 
-        cursor.close()
-        conn.close()
+            cursor.close()
 
         return jsonify({
             "success": True,
@@ -155,6 +188,7 @@ def get_training_info():
 
 
 @training_bp.route('/unchecked_descriptions', methods=['GET'])
+@use_replica
 def get_unchecked_descriptions():
     """
     미체크 항목 설명 및 액션 플랜 조회 API (부서명 포함)
@@ -168,40 +202,18 @@ def get_unchecked_descriptions():
         description: 미체크 항목 목록 조회 실패
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT 
-                ud.id, 
-                ud.content, 
-                ud.action_plan, 
-                ud.training_course, 
-                ti.dept, 
-                ud.created_at, 
-                ud.resolved,
-                COALESCE(ti2.due, 3) as due,  -- due가 없으면 기본값 3일
-                (ud.created_at + (COALESCE(ti2.due, 3) || ' days')::interval)::date as deadline,
-                CASE 
-                    WHEN CURRENT_DATE > (ud.created_at + (COALESCE(ti2.due, 3) || ' days')::interval)::date 
-                    THEN TRUE 
-                    ELSE FALSE 
-                END as is_overdue
-            FROM unchecked_descriptions ud
-            JOIN training_info ti ON ud.training_course = ti.training_course
-            LEFT JOIN task_items ti2 ON ud.content LIKE ti2.task_name || '%에 대한 미체크 사유'  -- LIKE 연산자 사용
-            WHERE ud.resolved = FALSE  
-            ORDER BY ud.created_at DESC;
-        ''')
-        unchecked_items = cursor.fetchall()
-
-        # 디버깅을 위한 로깅 추가
-        logging.info(f"Found {len(unchecked_items)} unchecked items")
-        for item in unchecked_items:
-            logging.info(f"Item content: {item[1]}, due days: {item[7]}")
-
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            UNRESOLVED_UNCHECKED.execute(cursor)
+            unchecked_items = cursor.fetchall()
+
+            # 디버깅을 위한 로깅 추가
+            logging.info(f"Found {len(unchecked_items)} unchecked items")
+            for item in unchecked_items:
+                logging.info(f"Item content: {item[1]}, due days: {item[7]}")
+
+            cursor.close()
 
         return jsonify({
             "success": True,
@@ -269,17 +281,18 @@ def save_unchecked_description():
         if not description or not action_plan or not training_course:
             return jsonify({"success": False, "message": "설명, 액션 플랜, 훈련과정명을 모두 입력하세요."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute('''
-            INSERT INTO unchecked_descriptions (content, action_plan, training_course, created_at, resolved)
-            VALUES (%s, %s, %s, NOW(), FALSE)
-        ''', (description, action_plan, training_course))
+            cursor.execute('''
+                INSERT INTO unchecked_descriptions (content, action_plan, training_course, created_at, resolved)
+                VALUES (%s, %s, %s, NOW(), FALSE)
+                RETURNING id
+            ''', (description, action_plan, training_course))
+            events.publish(cursor, 'unchecked', 'created', cursor.fetchone()[0], training_course)
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
+            cursor.close()
 
         return jsonify({"success": True, "message": "미체크 항목과 액션 플랜이 저장되었습니다!"}), 201
 
@@ -325,15 +338,15 @@ def add_unchecked_comment():
         if not unchecked_id or not comment:
             return jsonify({"success": False, "message": "미체크 항목 ID와 댓글 내용을 입력하세요."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO unchecked_comments (unchecked_id, comment, created_at) VALUES (%s, %s, NOW())",
-            (unchecked_id, comment)
-        )
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO unchecked_comments (unchecked_id, comment, created_at) VALUES (%s, %s, NOW()) RETURNING id",
+                (unchecked_id, comment)
+            )
+            events.publish(cursor, 'unchecked_comment', 'created', cursor.fetchone()[0], unchecked_id=unchecked_id)
+            conn.commit()
+            cursor.close()
 
         return jsonify({"success": True, "message": "댓글이 저장되었습니다."}), 201
     except Exception as e:
@@ -374,12 +387,14 @@ def resolve_unchecked_description():
         if not unchecked_id:
             return jsonify({"success": False, "message": "미체크 항목 ID가 필요합니다."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("UPDATE unchecked_descriptions SET resolved = TRUE WHERE id = %s", (unchecked_id,))
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE unchecked_descriptions SET resolved = TRUE WHERE id = %s RETURNING training_course",
+                           (unchecked_id,))
+            for (training_course,) in cursor.fetchall():
+                events.publish(cursor, 'unchecked', 'resolved', unchecked_id, training_course)
+            conn.commit()
+            cursor.close()
 
         return jsonify({"success": True, "message": "미체크 항목이 해결되었습니다."}), 200
     except Exception as e:
@@ -388,6 +403,7 @@ def resolve_unchecked_description():
 
 
 @training_bp.route('/unchecked_comments', methods=['GET'])
+@use_replica
 def get_unchecked_comments():
     """
     미체크 항목의 댓글 조회 API
@@ -414,15 +430,11 @@ def get_unchecked_comments():
         if not unchecked_id:
             return jsonify({"success": False, "message": "미체크 항목 ID를 입력하세요."}), 400
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, comment, created_at FROM unchecked_comments WHERE unchecked_id = %s ORDER BY created_at ASC",
-            (unchecked_id,)
-        )
-        comments = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            UNCHECKED_COMMENTS.execute(cursor, (unchecked_id,))
+            comments = cursor.fetchall()
+            cursor.close()
 
         return jsonify({
             "success": True,
@@ -1,11 +1,22 @@
-from app import create_app
 import os
 
+# SSE 를 켜고 개발 서버로 직접 실행하면 다른 모듈을 불러오기 전에 gevent monkey patch
+# (gunicorn 에서는 gunicorn.conf.py 의 gevent 워커가 patch 함)
+if __name__ == '__main__' and os.getenv("SSE_ENABLED", "false").lower() == "true":
+    from gevent import monkey
+    monkey.patch_all()
+
+from app import create_app
+from app.models import schema
+
 # 직접 환경 변수에서 PORT 값을 읽습니다
 PORT = int(os.getenv("PORT", 10000))
 
 app = create_app()
 
+# 필수 인덱스가 없으면 여기서 시작을 중단 (SCHEMA_CHECK_ON_STARTUP=false 로 비활성화)
+schema.check_on_startup()
+
 if __name__ == '__main__':
     print(f"서버가 http://0.0.0.0:{PORT} 에서 실행됩니다.")
     app.run(host="0.0.0.0", port=PORT)
\ No newline at end of file
@@ -0,0 +1,16 @@
+import functools
+from flask import jsonify, session
+from app import config
+
+
+def admin_required(view):
+    """로그인한 사용자가 관리자(ADMIN_USERS)인 경우에만 접근 허용"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        user = session.get('user')
+        if not user:
+            return jsonify({"success": False, "message": "로그인이 필요합니다."}), 401
+        if user.get('username') not in config.ADMIN_USERS:
+            return jsonify({"success": False, "message": "관리자 권한이 필요합니다."}), 403
+        return view(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from app import config
+from app.models.db import get_db_connection
+from app.models.task_catalog import CATALOG_VERSION
+from app.utils.export import StreamedQuery, write_xlsx
+
+logger = logging.getLogger(__name__)
+
+PENDING, RUNNING, DONE, FAILED = 'pending', 'running', 'done', 'failed'
+
+_JOB_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+
+
+class ExportSpec:
+    """내보내기 종류 하나의 정의
+
+    build_query(params) 는 (sql, params) 를 반환하고 잘못된 값이면 ValueError 를 발생시킵니다.
+    version_name 은 catalog_versions 의 이름으로, 값이 바뀌면 캐시된 파일을 다시 만듭니다.
+    """
+
+    def __init__(self, name, fields, build_query, columns, filename, sheet_name, version_name):
+        self.name = name
+        self.fields = fields
+        self.build_query = build_query
+        self.columns = columns
+        self.filename = filename
+        self.sheet_name = sheet_name
+        self.version_name = version_name
+
+
+class ExportJobs:
+    """xlsx 내보내기를 백그라운드 스레드 풀에서 만들고 로컬 디스크에 캐시
+
+    - 작업 상태는 EXPORT_CACHE_DIR/jobs/<id>.json 에 기록하므로 같은 서버의 다른 워커에서도 조회 가능
+    - 파일은 (종류, 조건, 데이터 버전) 해시로 캐시하며, 같은 조건의 요청은 캐시된 파일을 바로 사용
+    - 스레드 풀과 진행 중 작업 목록은 워커 프로세스 단위 (fork 이후에는 새로 생성)
+    """
+
+    def __init__(self):
+        self._specs = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._inflight = {}  # 캐시 키 -> job id
+        self._cleaned_at = 0.0
+
+    def register(self, name, fields, build_query, columns, filename, sheet_name, version_name):
+        self._specs[name] = ExportSpec(name, fields, build_query, columns, filename, sheet_name, version_name)
+
+    def kinds(self):
+        return sorted(self._specs)
+
+    def _dir(self, *parts):
+        path = os.path.join(config.EXPORT_CACHE_DIR, *parts)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _job_path(self, job_id):
+        return os.path.join(self._dir('jobs'), f"{job_id}.json")
+
+    def artifact_path(self, job):
+        return os.path.join(self._dir('files'), f"{job['key']}.xlsx")
+
+    def _save(self, job):
+        path = self._job_path(job['id'])
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def get(self, job_id):
+        if not _JOB_ID_RE.match(job_id or ''):
+            return None
+        try:
+            with open(self._job_path(job_id), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _executor_for_process(self):
+        pid = os.getpid()
+        if self._pid != pid:
+            # 부모 프로세스의 스레드는 fork 된 워커로 이어지지 않음
+            self._pid = pid
+            self._inflight = {}
+            self._executor = ThreadPoolExecutor(max_workers=config.EXPORT_JOB_WORKERS,
+                                                thread_name_prefix="export-job")
+        return self._executor
+
+    def _data_version(self, name):
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            CATALOG_VERSION.execute(cursor, (name,))
+            row = cursor.fetchone()
+            cursor.close()
+        return row[0] if row else None
+
+    def submit(self, name, args):
+        """내보내기 작업 등록 후 작업 정보 반환
+
+        알 수 없는 종류면 KeyError, 조건이 잘못되면 ValueError,
+        대기 중인 작업이 너무 많으면 RuntimeError 를 발생시킵니다.
+        """
+        spec = self._specs[name]
+        params = {field: args.get(field) for field in spec.fields if args.get(field)}
+        spec.build_query(params)  # 조건 검증
+
+        version = self._data_version(spec.version_name)
+        key = hashlib.sha256(
+            json.dumps([name, params, version], sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()[:40]
+        job = {
+            "id": uuid.uuid4().hex,
+            "kind": name,
+            "params": params,
+            "data_version": version,
+            "key": key,
+            "filename": spec.filename,
+            "status": PENDING,
+            "created_at": datetime.now().isoformat(timespec='seconds'),
+            "finished_at": None,
+            "cached": False,
+            "error": None,
+        }
+        self._cleanup()
+
+        # 데이터가 바뀌지 않았으면 (version 이 있는 경우에만) 캐시된 파일을 그대로 사용
+        if version is not None and os.path.exists(self.artifact_path(job)):
+            os.utime(self.artifact_path(job))  # 자주 쓰는 파일은 정리 대상에서 늦춤
+            job.update(status=DONE, cached=True, finished_at=job["created_at"])
+            self._save(job)
+            return job
+
+        with self._lock:
+            executor = self._executor_for_process()
+            running_id = self._inflight.get(key)
+            if running_id is not None:
+                running = self.get(running_id)
+                if running is not None and running["status"] in (PENDING, RUNNING):
+                    return running
+            if len(self._inflight) >= config.EXPORT_JOB_MAX_PENDING:
+                raise RuntimeError("대기 중인 내보내기 작업이 너무 많습니다")
+            self._inflight[key] = job["id"]
+            self._save(job)
+            # 요청 쪽에 돌려줄 job 과 작업 스레드가 갱신하는 job 을 분리
+            executor.submit(self._run, spec, dict(job))
+        return job
+
+    def _run(self, spec, job):
+        job.update(status=RUNNING)
+        self._save(job)
+        path = self.artifact_path(job)
+        tmp = f"{path}.{job['id']}.tmp"
+        try:
+            sql, params = spec.build_query(job["params"])
+            # 데이터 버전과 맞추기 위해 복제본이 아닌 primary 에서 조회
+            streamed = StreamedQuery(sql, params, prefer_replica=False)
+            try:
+                with open(tmp, 'w+b') as output:
+                    write_xlsx(streamed, spec.columns, spec.sheet_name, output)
+            finally:
+                streamed.close()
+            os.replace(tmp, path)
+            job.update(status=DONE)
+        except Exception:
+            logger.error(f"내보내기 작업 실패: {job['kind']} {job['id']}", exc_info=True)
+            job.update(status=FAILED, error="파일 생성 실패")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        finally:
+            job.update(finished_at=datetime.now().isoformat(timespec='seconds'))
+            self._save(job)
+            with self._lock:
+                self._inflight.pop(job["key"], None)
+
+    def _cleanup(self):
+        """EXPORT_CACHE_TTL 이 지난 작업 기록과 파일 삭제 (TTL 의 1/10 간격으로만 확인)"""
+        now = time.time()
+        if now - self._cleaned_at < config.EXPORT_CACHE_TTL / 10:
+            return
+        self._cleaned_at = now
+        for sub in ('jobs', 'files'):
+            directory = self._dir(sub)
+            for entry in os.scandir(directory):
+                try:
+                    if now - entry.stat().st_mtime > config.EXPORT_CACHE_TTL:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+                except Exception:
+                    logger.debug(f"내보내기 캐시 정리 실패: {entry.path}", exc_info=True)
+
+
+export_jobs = ExportJobs()
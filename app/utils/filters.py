@@ -0,0 +1,28 @@
+import datetime
+
+
+def parse_filters(args, date_column, equal_columns=('training_course',)):
+    """from / to (YYYY-MM-DD) 와 값이 일치해야 하는 쿼리 파라미터로 조건 목록과 파라미터 구성
+
+    equal_columns 의 각 이름은 쿼리 파라미터 이름이자 컬럼 이름입니다.
+    날짜 형식이 잘못된 경우 ValueError 를 발생시킵니다.
+    """
+    conditions, params = [], []
+    date_from, date_to = args.get('from'), args.get('to')
+    if date_from:
+        conditions.append(f"{date_column} >= %s")
+        params.append(datetime.date.fromisoformat(date_from))
+    if date_to:
+        # to 는 해당 날짜를 포함
+        conditions.append(f"{date_column} < %s")
+        params.append(datetime.date.fromisoformat(date_to) + datetime.timedelta(days=1))
+    for column in equal_columns:
+        value = args.get(column)
+        if value:
+            conditions.append(f"{column} = %s")
+            params.append(value)
+    return conditions, params
+
+
+def where_clause(conditions):
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
@@ -0,0 +1,16 @@
+def is_patched():
+    """gevent 워커(-k gevent) 등으로 socket 이 monkey patch 된 프로세스인지 여부"""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('socket')
+
+
+def patch_psycopg():
+    """gevent 프로세스에서 psycopg2 의 DB 대기가 다른 요청(SSE 연결 등)을 막지 않도록 patch"""
+    if not is_patched():
+        return False
+    from psycogreen.gevent import patch_psycopg as _patch
+    _patch()
+    return True
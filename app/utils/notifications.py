@@ -1,8 +1,72 @@
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import logging
-from typing import Dict
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+from typing import Dict, List
+from app import config
+
+
+class NotificationError(Exception):
+    """알림 전송 실패 (retryable=False 면 다시 시도해도 성공할 수 없는 경우)"""
+
+    def __init__(self, message, retryable=True, retry_after=None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after  # 전송 제한(429 등)으로 미뤄야 하는 시간(초)
+
+
+class TokenBucket:
+    """초당 rate 개, 최대 capacity 개까지 모아 쓸 수 있는 전송 제한 (스레드 안전)
+
+    pause(seconds) 를 호출하면 그 시간 동안은 토큰을 주지 않습니다 (Slack 429 의 Retry-After).
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def acquire(self, timeout):
+        """토큰 하나를 가져오고 0 을, timeout 초 안에 가져올 수 없으면 더 기다려야 하는 시간(초)을 반환"""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    elapsed = now - max(self._updated, self._paused_until)
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return 0.0
+                    wait = (1 - self._tokens) / self.rate
+            if now + wait > deadline:
+                return wait
+            time.sleep(wait)
+
+
+# digest 메시지 제목 (채널 종류별)
+DIGEST_TITLES = {
+    'notice': "새 공지사항",
+    'issue': "새 이슈",
+    'comment': "새 댓글",
+}
+
 
 class SlackNotifier:
     def __init__(self):
@@ -29,30 +93,73 @@ class SlackNotifier:
                 print(f"ERROR: {channel}용 SLACK_CHANNEL이 설정되지 않았습니다!")
         
         self.logger.info(f"SlackNotifier 초기화: channels={self.channels}")
-        
-    def send_notification(self, message: str, channel_type: str = 'default') -> bool:
+
+        # 웹훅 호출은 keep-alive 세션으로 재사용 (재시도는 outbox 가 담당)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.webhooks), pool_maxsize=config.SLACK_POOL_SIZE, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.timeout = (config.SLACK_CONNECT_TIMEOUT, config.SLACK_TIMEOUT)
+
+        # 웹훅별 전송 제한 (Slack incoming webhook 은 초당 1건 정도)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+
+    def _bucket(self, webhook_url: str) -> TokenBucket:
+        with self._buckets_lock:
+            bucket = self._buckets.get(webhook_url)
+            if bucket is None:
+                bucket = self._buckets[webhook_url] = TokenBucket(config.SLACK_RATE_LIMIT, config.SLACK_RATE_BURST)
+            return bucket
+
+    def post(self, message: str, channel_type: str = 'default') -> None:
+        """Slack 웹훅으로 전송 (실패 시 NotificationError)
+
+        연결은 SLACK_CONNECT_TIMEOUT, 응답은 SLACK_TIMEOUT 초까지 기다립니다.
+        전송 제한에 걸려 SLACK_TIMEOUT 초 안에 보낼 수 없으면 retry_after 를 담아 실패합니다.
+        """
         webhook_url = self.webhooks.get(channel_type)
         channel_id = self.channels.get(channel_type, self.channels['notice'])  # 기본값은 공지사항 채널
-        
+
         if not webhook_url:
-            logging.error(f"ERROR: {channel_type}용 SLACK_WEBHOOK_URL이 설정되지 않았습니다!")
-            return False
+            raise NotificationError(f"{channel_type}용 SLACK_WEBHOOK_URL이 설정되지 않았습니다", retryable=False)
+
+        bucket = self._bucket(webhook_url)
+        wait = bucket.acquire(config.SLACK_TIMEOUT)
+        if wait:
+            raise NotificationError(f"Slack 전송 제한 대기 중 ({wait:.1f}초)", retry_after=wait)
+
+        try:
+            response = self.session.post(webhook_url, json={"text": message}, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise NotificationError(f"Slack 요청 실패: {e}")
+
+        if response.status_code == 429:
+            retry_after = _retry_after(response)
+            bucket.pause(retry_after)
+            raise NotificationError(f"Slack 전송 제한 (Retry-After {retry_after:g}초)", retry_after=retry_after)
+        if response.status_code != 200:
+            # 4xx 는 웹훅/메시지 문제이므로 재시도하지 않음
+            retryable = response.status_code >= 500
+            raise NotificationError(f"Slack 응답 {response.status_code}: {response.text[:200]}", retryable=retryable)
+        logging.info(f"Slack 알림 전송 성공 (채널: {channel_type}, 채널ID: {channel_id})")
 
+    def format_digest(self, messages, channel_type: str = 'default') -> str:
+        """여러 알림을 하나의 메시지로 묶음 (NOTIFICATION_DIGEST_MAX_ITEMS 개까지 나열)"""
+        shown = messages[:config.NOTIFICATION_DIGEST_MAX_ITEMS]
+        lines = [f"🔔 *{DIGEST_TITLES.get(channel_type, '알림')} {len(messages)}건이 있습니다*"]
+        for index, message in enumerate(shown, 1):
+            lines.append(f"\n*{index}.* {message.strip()[:500]}")
+        if len(messages) > len(shown):
+            lines.append(f"\n… 외 {len(messages) - len(shown)}건")
+        return "\n".join(lines)
+
+    def send_notification(self, message: str, channel_type: str = 'default') -> bool:
         try:
-            payload = {
-                "text": message,
-                "channel": channel_id
-            }
-            
-            response = requests.post(webhook_url, json={"text": message})
-            if response.status_code == 200:
-                logging.info(f"Slack 알림 전송 성공 (채널: {channel_type}, 채널ID: {channel_id})")
-                return True
-            else:
-                logging.error(f"Slack 알림 전송 실패 (채널: {channel_type}, 채널ID: {channel_id}): {response.status_code}")
-                return False
-        except Exception as e:
-            logging.error(f"Slack 알림 전송 중 오류 발생 (채널: {channel_type}, 채널ID: {channel_id}): {str(e)}")
+            self.post(message, channel_type)
+            return True
+        except NotificationError as e:
+            logging.error(f"Slack 알림 전송 실패 (채널: {channel_type}): {e}")
             return False
 
     def notify_new_notice(self, title, author):
@@ -79,4 +186,121 @@ class SlackNotifier:
 • 이슈: {issue_title}
 • 작성자: {author}
 """
-        return self.send_notification(message, 'comment')
\ No newline at end of file
+        return self.send_notification(message, 'comment')
+
+
+def _retry_after(response, default=1.0):
+    try:
+        return max(float(response.headers.get('Retry-After', default)), 0.0)
+    except ValueError:
+        return default
+
+
+class EmailNotifier:
+    """과정 담당자에게 SMTP 로 알림 메일 전송 (스레드 안전)
+
+    SMTP 연결은 열어 둔 채 재사용하고, SMTP_IDLE_TIMEOUT 초 넘게 쓰지 않았거나
+    서버가 연결을 끊은 경우에만 다시 연결합니다.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._smtp = None
+        self._used_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(config.SMTP_HOST and config.SMTP_SENDER)
+
+    def _connect(self):
+        smtp = smtplib.SMTP(config.SMTP_HOST, config.SMTP_PORT, timeout=config.SMTP_TIMEOUT)
+        if config.SMTP_USE_TLS:
+            smtp.starttls()
+        if config.SMTP_USERNAME:
+            smtp.login(config.SMTP_USERNAME, config.SMTP_PASSWORD)
+        return smtp
+
+    def _close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def _connection(self):
+        if self._smtp is not None and time.monotonic() - self._used_at > config.SMTP_IDLE_TIMEOUT:
+            self._close()
+        if self._smtp is None:
+            self._smtp = self._connect()
+        return self._smtp
+
+    def format_message(self, messages, channel_type: str = 'default'):
+        """알림 목록을 (제목, 본문) 으로 변환 (NOTIFICATION_DIGEST_MAX_ITEMS 개까지 포함)"""
+        title = DIGEST_TITLES.get(channel_type, '알림')
+        subject = f"[MVP 대시보드] {title}" if len(messages) == 1 else f"[MVP 대시보드] {title} {len(messages)}건"
+        shown = messages[:config.NOTIFICATION_DIGEST_MAX_ITEMS]
+        body = "\n\n----------\n\n".join(message.strip() for message in shown)
+        if len(messages) > len(shown):
+            body += f"\n\n… 외 {len(messages) - len(shown)}건"
+        return subject, body
+
+    def send(self, recipients: List[str], subject: str, body: str) -> None:
+        """메일 전송 (실패 시 NotificationError, 끊긴 연결은 한 번 다시 연결해 재시도)"""
+        if not self.enabled:
+            raise NotificationError("SMTP_HOST / SMTP_SENDER 가 설정되지 않았습니다", retryable=False)
+        if not recipients:
+            raise NotificationError("메일을 받을 담당자가 없습니다", retryable=False)
+
+        message = EmailMessage()
+        message['Subject'] = subject
+        message['From'] = config.SMTP_SENDER
+        message['To'] = ", ".join(recipients)
+        message.set_content(body)
+
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    self._connection().send_message(message)
+                    self._used_at = time.monotonic()
+                    self.logger.info(f"알림 메일 전송 성공 (수신자 {len(recipients)}명)")
+                    return
+                except smtplib.SMTPRecipientsRefused as e:
+                    raise NotificationError(f"메일 수신자 거부: {e.recipients}", retryable=False)
+                except smtplib.SMTPServerDisconnected as e:
+                    self._close()
+                    if attempt == 2:
+                        raise NotificationError(f"SMTP 연결 끊김: {e}")
+                except smtplib.SMTPResponseException as e:
+                    self._close()
+                    # 5xx 는 주소/인증 문제이므로 재시도하지 않음
+                    raise NotificationError(f"메일 전송 실패 ({e.smtp_code}): {e.smtp_error!r}",
+                                            retryable=not 500 <= e.smtp_code < 600)
+                except (smtplib.SMTPException, OSError) as e:
+                    self._close()
+                    raise NotificationError(f"메일 전송 실패: {e}")
+
+
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def _process_instance(cls):
+    """워커 프로세스당 하나의 인스턴스 반환 (fork 된 워커는 연결/세션을 새로 만듦)"""
+    pid = os.getpid()
+    entry = _instances.get(cls)
+    if entry is None or entry[0] != pid:
+        with _instances_lock:
+            entry = _instances.get(cls)
+            if entry is None or entry[0] != pid:
+                entry = _instances[cls] = (pid, cls())
+    return entry[1]
+
+
+def get_notifier() -> SlackNotifier:
+    return _process_instance(SlackNotifier)
+
+
+def get_email_notifier() -> EmailNotifier:
+    return _process_instance(EmailNotifier)
@@ -0,0 +1,12 @@
+# gunicorn 설정 (gunicorn "app.run:app" 실행 시 현재 디렉터리의 이 파일을 자동으로 읽음)
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", 2))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+
+# SSE(/events/stream) 는 연결이 오래 유지되므로 gevent 워커에서만 사용 (연결마다 워커를 차지하지 않음)
+# gevent 워커는 앱을 불러오기 전에 monkey patch 하고, psycopg2 는 create_app 에서 green patch
+if os.getenv("SSE_ENABLED", "false").lower() == "true":
+    worker_class = "gevent"
+    worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
@@ -0,0 +1,15 @@
+from datetime import date
+
+from app.routes.attendance import NULL_DATE, _page_cursor, _parse_cursor
+
+
+def test_cursor_round_trip():
+    record = (42, date(2025, 2, 12), "1", "데이터 분석 스쿨", "09:00", "18:00", True)
+    assert _parse_cursor(_page_cursor(record)) == (date(2025, 2, 12), 42)
+
+
+def test_cursor_for_null_date_continues_within_null_rows():
+    # 페이지 마지막 기록의 date 가 NULL 이어도 다음 페이지를 이어서 조회할 수 있어야 함
+    cursor = _page_cursor((9, None, "1", "데이터 분석 스쿨", "09:00", "18:00", False))
+    assert cursor == "-infinity:9"
+    assert _parse_cursor(cursor) == (NULL_DATE, 9)
@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+from app.routes import issues as issues_routes
+from app.routes.issues import NULL_CREATED_AT, _page_cursor, _parse_cursor
+
+COURSE = "데이터 분석 스쿨"
+
+# (id, created_at) - created_at 이 NULL 인 이슈가 페이지 경계에 걸리도록 배치
+ISSUES = [
+    (1, datetime(2025, 2, 1, 9, 0)),
+    (2, None),
+    (3, datetime(2025, 2, 3, 9, 0)),
+    (4, None),
+    (5, datetime(2025, 2, 3, 9, 0)),
+    (6, None),
+    (7, datetime(2025, 2, 5, 9, 0)),
+]
+
+
+def _sort_key(created_at):
+    # COALESCE(created_at, '-infinity'::timestamp)
+    return datetime.min if created_at in (None, NULL_CREATED_AT) else created_at
+
+
+class FakePageQuery:
+    """UNRESOLVED_ISSUES_BY_COURSE 의 과정별 keyset 페이지 조회를 메모리에서 흉내냄"""
+
+    def execute(self, cursor, params):
+        course, cursor_created_at, cursor_id, limit, _comments_limit = params
+        boundary = (_sort_key(cursor_created_at), cursor_id)
+        page = sorted(
+            (issue for issue in ISSUES if (_sort_key(issue[1]), issue[0]) < boundary),
+            key=lambda issue: (_sort_key(issue[1]), issue[0]),
+            reverse=True,
+        )[:limit]
+        cursor.rows = [(course, len(ISSUES), [
+            {"id": issue_id, "created_at": created_at.isoformat() if created_at else None}
+            for issue_id, created_at in page
+        ])]
+
+
+class FakeCursor:
+    rows = []
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def cursor(self):
+        return FakeCursor()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    @contextmanager
+    def fake_connection():
+        yield FakeConnection()
+
+    monkeypatch.setattr(issues_routes, "get_db_connection", fake_connection)
+    monkeypatch.setattr(issues_routes, "UNRESOLVED_ISSUES_BY_COURSE", FakePageQuery())
+    app = Flask(__name__)
+    app.register_blueprint(issues_routes.issues_bp)
+    return app.test_client()
+
+
+def test_cursor_round_trip():
+    issue = {"id": 12, "created_at": "2025-02-03 10:20:30"}
+    assert _parse_cursor(_page_cursor(issue)) == (datetime(2025, 2, 3, 10, 20, 30), 12)
+
+
+def test_cursor_for_null_created_at_continues_within_null_rows():
+    # created_at 이 NULL 인 이슈에서 페이지가 끝나도 다음 페이지를 이어서 조회할 수 있어야 함
+    cursor = _page_cursor({"id": 7, "created_at": None})
+    assert cursor == "-infinity:7"
+    assert _parse_cursor(cursor) == (NULL_CREATED_AT, 7)
+
+
+@pytest.mark.parametrize("per_course", [1, 2, 3, 10])
+def test_paging_returns_every_issue_once_including_null_created_at(client, per_course):
+    seen = []
+    cursor = None
+    for _ in range(len(ISSUES) + 1):
+        query = {"training_course": COURSE, "per_course": per_course}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/issues", query_string=query)
+        assert response.status_code == 200
+        group, = response.get_json()["data"]
+        seen += [issue["id"] for issue in group["issues"]]
+        cursor = group["next_cursor"]
+        if cursor is None:
+            break
+
+    # 최신순, created_at 이 NULL 인 이슈는 마지막 (id 내림차순)
+    assert seen == [7, 5, 3, 1, 6, 4, 2]
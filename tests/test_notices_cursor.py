@@ -0,0 +1,93 @@
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+from app.routes import notices as notices_routes
+from app.routes.notices import NULL_DATE, _page_cursor, _parse_cursor
+
+# (id, date) - date 가 NULL 인 공지사항이 페이지 경계에 걸리도록 배치
+NOTICES = [
+    (1, datetime(2025, 1, 2, 9, 0)),
+    (2, None),
+    (3, datetime(2025, 1, 5, 9, 0)),
+    (4, None),
+    (5, datetime(2025, 1, 5, 9, 0)),
+    (6, datetime(2025, 1, 9, 9, 0)),
+]
+
+
+def _sort_key(date):
+    # COALESCE(date, '-infinity'::timestamp)
+    return datetime.min if date in (None, NULL_DATE) else date
+
+
+class FakePageQuery:
+    """ACTIVE_NOTICES_PAGE 의 keyset 페이지 조회를 메모리에서 흉내냄"""
+
+    def execute(self, cursor, params):
+        cursor_date, cursor_id, limit = params
+        boundary = (_sort_key(cursor_date), cursor_id)
+        page = sorted(
+            (notice for notice in NOTICES if (_sort_key(notice[1]), notice[0]) < boundary),
+            key=lambda notice: (_sort_key(notice[1]), notice[0]),
+            reverse=True,
+        )[:limit]
+        cursor.rows = [(notice_id, "공지사항", f"제목 {notice_id}", "내용", date, "김은지")
+                       for notice_id, date in page]
+
+
+class FakeCursor:
+    rows = []
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def cursor(self):
+        return FakeCursor()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    @contextmanager
+    def fake_connection():
+        yield FakeConnection()
+
+    monkeypatch.setattr(notices_routes, "get_dedicated_connection", fake_connection)
+    monkeypatch.setattr(notices_routes, "ACTIVE_NOTICES_PAGE", FakePageQuery())
+    monkeypatch.setattr(notices_routes.notices_cache, "get", lambda key, load: load())
+    app = Flask(__name__)
+    app.register_blueprint(notices_routes.notices_bp)
+    return app.test_client()
+
+
+def test_cursor_for_null_date_continues_within_null_rows():
+    cursor = _page_cursor({"id": 4, "date": None})
+    assert cursor == "-infinity:4"
+    assert _parse_cursor(cursor) == (NULL_DATE, 4)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4, 50])
+def test_paging_returns_every_notice_once_including_null_date(client, limit):
+    seen = []
+    cursor = None
+    for _ in range(len(NOTICES) + 1):
+        query = {"limit": limit}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/notices", query_string=query)
+        assert response.status_code == 200
+        body = response.get_json()
+        seen += [notice["id"] for notice in body["data"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    # 최신순, date 가 NULL 인 공지사항은 마지막 (id 내림차순)
+    assert seen == [6, 5, 3, 1, 4, 2]